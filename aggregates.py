@@ -0,0 +1,145 @@
+"""Dashboard agregatlari — app.py, api.py va precompute.py uchun umumiy.
+
+Bir xil filtr holatida uchalasi ham bir xil natija va bir xil kesh
+kalitini (``section_key``) hosil qiladi, shuning uchun umumiy keshdagi
+(cache.py) natijalar dashboard, API va oldindan hisoblash orasida bo‘lishiladi.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from cube import Cube, genre_peak_years
+from density import bin_votes
+from filters import FilterEngine
+from genres import GenreSet
+from loader import restore
+from relations import MovieIndex
+from topk import TopK, top_k_positions
+
+
+# Top 10 jadvallari: saralash ustuni va ko‘rsatiladigan ustunlar
+TOP_TABLES = {
+    "top_rating": ("IMDb Rating", ["Title", "Year", "IMDb Rating", "Num Votes", "Directors"]),
+    "top_votes": ("Num Votes", ["Title", "Year", "Num Votes", "IMDb Rating"]),
+}
+
+
+# Grafiklar uchun filtrlangan ustunlar (app.py dagi ``filtered_df``)
+CHART_COLUMNS = ["IMDb Rating", "Runtime (mins)", "Num Votes"]
+# Gistogramma grafiklari → ustun
+HISTOGRAMS = {"rating_hist": "IMDb Rating", "runtime_hist": "Runtime (mins)"}
+
+
+def section_key(name, version, year_range=None, rating_range=None, genre_filter=None):
+    # app.py dagi ``(name, *FILTERS)`` / ``(name, *DATA)`` bilan bir xil
+    if year_range is None:
+        return (name, version)
+    return (name, version, year_range, rating_range, genre_filter)
+
+
+def build_top_lists(df):
+    # Filtrlanmagan ko‘rinish uchun doimiy Top 10 lar
+    rated = df["IMDb Rating"].notna().to_numpy()
+    rows = np.flatnonzero(rated)
+    return {
+        column: TopK(10).add(df[column].to_numpy()[rated], rows)
+        for column, _ in TOP_TABLES.values()
+    }
+
+
+def top_rows(df, column, selection, top_list=None):
+    # Filtr yo‘q bo‘lsa — tayyor ro‘yxat, aks holda argpartition (O(n)) bilan
+    if top_list is not None:
+        return top_list.rows()
+    values = df[column].to_numpy()[selection.rows]
+    return selection.rows[top_k_positions(values, 10)]
+
+
+def top_table(df, name, selection, top_list=None):
+    column, columns = TOP_TABLES[name]
+    return restore(df.iloc[top_rows(df, column, selection, top_list)], columns)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Bitta ma'lumotlar versiyasi uchun tayyor tuzilmalar."""
+
+    df: object
+    version: str
+    cube: Cube
+    top_lists: dict
+    engine: FilterEngine
+    genre_set: GenreSet
+    year_range: tuple
+    rating_range: tuple
+
+    @classmethod
+    def build(cls, df, version, cube=None, top_lists=None):
+        if cube is None:
+            cube = Cube.build(df, MovieIndex.build(df))
+        # Slayderlarning standart qiymatlari bilan bir xil (app.py)
+        return cls(
+            df=df,
+            version=version,
+            cube=cube,
+            top_lists=build_top_lists(df) if top_lists is None else top_lists,
+            engine=FilterEngine.build(df),
+            genre_set=GenreSet.build(df),
+            year_range=(int(df["Year"].min()), int(df["Year"].max())),
+            rating_range=(round(float(df["IMDb Rating"].min()), 1),
+                          round(float(df["IMDb Rating"].max()), 1)),
+        )
+
+
+def _top(name):
+    def compute(snap, year_range, rating_range):
+        unfiltered = (year_range, rating_range) == (snap.year_range, snap.rating_range)
+        column = TOP_TABLES[name][0]
+        selection = snap.engine.query(year_range, rating_range)
+        return top_table(snap.df, name, selection,
+                         snap.top_lists[column] if unfiltered else None)
+    return compute
+
+
+def _summary(snap, year_range, rating_range):
+    s = snap.engine.summary(year_range, rating_range)
+    return pd.DataFrame({"count": [s.count], "rating_mean": [s.rating_mean],
+                         "votes_sum": [s.votes_sum]})
+
+
+# API nomi → (app.py dagi bo‘lim nomi, filtrga bog‘liqmi, hisoblash)
+SECTIONS = {
+    "summary": ("summary", True, _summary),
+    "per_year": ("per_year", True, lambda snap, y, r:
+                 snap.engine.summary(y, r).per_year.rename("Movie Count").reset_index()),
+    "top_rating": ("top_rating", True, _top("top_rating")),
+    "top_votes": ("top_votes", True, _top("top_votes")),
+    "directors": ("director_table", True, lambda snap, y, r:
+                  snap.cube.director_rating_table(y, r)),
+    "director_ratings": ("director_ratings", True, lambda snap, y, r:
+                         snap.cube.group_ratings("directors", y, r)),
+    "genre_ratings": ("genre_ratings", True, lambda snap, y, r:
+                      snap.cube.group_ratings("genres", y, r)),
+    "decades": ("decade_stats", True, lambda snap, y, r: snap.cube.decade_stats(y, r)),
+    "directors_by_votes": ("directors_by_votes", False, lambda snap, y, r:
+                           snap.cube.top_directors_by_votes()),
+    "directors_by_rating": ("directors_by_rating", False, lambda snap, y, r:
+                            snap.cube.top_directors_by_rating()),
+    "genre_year": ("genre_year_counts", False, lambda snap, y, r:
+                   snap.genre_set.year_counts(snap.df["Year"])),
+    "genre_peaks": ("genre_peaks", False, lambda snap, y, r:
+                    genre_peak_years(snap.genre_set.year_counts(snap.df["Year"]))),
+}
+
+
+def chart_data(snap, chart_id, year_range, rating_range, window=None):
+    # app.py dagi ``grafik(chart_id, ...)`` ga beriladigan ma'lumot
+    selection = snap.engine.query(year_range, rating_range)
+    if chart_id == "year_line":
+        return selection.per_year
+    filtered = restore(snap.df.iloc[selection.rows], CHART_COLUMNS)
+    if chart_id == "votes_scatter":
+        # window — ko‘rinish oynasi (density.py), ``None`` — butun oraliq
+        return bin_votes(filtered["Num Votes"], filtered["IMDb Rating"], window)
+    return filtered[HISTOGRAMS[chart_id]]
@@ -0,0 +1,221 @@
+"""Dashboard agregatlari uchun faqat o‘qiladigan HTTP API (ASGI, freymvorksiz).
+
+Ma'lumotlar dashboard bilan bir xil manbadan olinadi: CSV ning ustunli keshi
+(loader.py) yoki ``IMDB_STORE`` do‘koni. Jadval natijalari esa umumiy keshda
+(cache.py) dashboard bilan bir xil kalitlar ostida saqlanadi.
+
+    uvicorn api:app --port 8600
+    curl "localhost:8600/v1/top_rating?year_min=1990&year_max=2010&rating_min=8"
+    curl -H "Accept: application/vnd.apache.arrow.stream" localhost:8600/v1/decades
+
+Filtr parametrlari: ``year_min``, ``year_max``, ``rating_min``, ``rating_max``
+(berilmasa — butun oraliq). Javob JSON (``records``) yoki Arrow IPC stream
+(``?format=arrow`` yoki ``Accept`` sarlavhasi). Natija faqat ma'lumotlar
+versiyasi va parametrlarga bog‘liq, shuning uchun ``ETag`` shulardan
+hisoblanadi va ``If-None-Match`` mos kelsa, 304 hech narsa hisoblamasdan qaytadi.
+"""
+import asyncio
+import hashlib
+import json
+import math
+import threading
+from urllib.parse import parse_qs
+
+import pyarrow as pa
+
+from aggregates import SECTIONS, Snapshot, section_key
+from cache import RedisBackend, SharedCache, open_backend
+from charts import FIGURE_CACHE_MB, FigureCache
+from loader import CSV_PATH, load_movies
+from sections import sized
+from store import STORE_PATH, LiveCatalog, MovieStore
+
+
+ARROW = "application/vnd.apache.arrow.stream"
+JSON = "application/json"
+
+
+class BadRequest(ValueError):
+    pass
+
+
+class Unavailable(RuntimeError):
+    # Ma'lumot hali yo‘q (bo‘sh do‘kon) — 503, keyingi so‘rovda qayta tekshiriladi
+    pass
+
+
+def parse_filters(query, snap):
+    def value(name, cast, default):
+        raw = query.get(name)
+        if not raw or raw[0] == "":
+            return default
+        try:
+            parsed = cast(raw[0])
+        except (ValueError, OverflowError):
+            parsed = None
+        # nan / inf float() dan o‘tadi, lekin oraliq sifatida ma'nosiz
+        if parsed is None or not math.isfinite(parsed):
+            raise BadRequest(f"{name}: noto‘g‘ri qiymat {raw[0]!r}")
+        return parsed
+
+    year_range = (value("year_min", int, snap.year_range[0]),
+                  value("year_max", int, snap.year_range[1]))
+    rating_range = (value("rating_min", float, snap.rating_range[0]),
+                    value("rating_max", float, snap.rating_range[1]))
+    if year_range[0] > year_range[1] or rating_range[0] > rating_range[1]:
+        raise BadRequest("oraliq boshi oxiridan katta")
+    return year_range, rating_range
+
+
+def encode(df, fmt):
+    # Nomli indeks (Decade, Directors) — ustun sifatida, qator raqamlari tashlanadi
+    df = df.reset_index(drop=df.index.name is None)
+    if fmt == "arrow":
+        sink = pa.BufferOutputStream()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    return df.to_json(orient="records", force_ascii=False).encode()
+
+
+class Aggregates:
+    """Joriy ma'lumotlar versiyasi va bo‘limlar natijalari (kesh orqali)."""
+
+    def __init__(self, csv_path=CSV_PATH, catalog=None, tables=None):
+        self.csv_path = csv_path
+        self.catalog = catalog
+        self.tables = tables
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        if STORE_PATH:
+            # Do‘kon versiyasi faqat shu SQLite fayli uchun ma'noli — jarayon keshi
+            return cls(catalog=LiveCatalog(MovieStore(STORE_PATH)),
+                       tables=FigureCache(int(FIGURE_CACHE_MB * 2**20)))
+        return cls(tables=SharedCache(open_backend(),
+                                      local=FigureCache(int(FIGURE_CACHE_MB * 2**20))))
+
+    def snapshot(self):
+        with self._lock:
+            if self.catalog is not None:
+                state = self.catalog.snapshot()
+                if state.empty:
+                    raise Unavailable(f"{self.catalog.store.path} do‘koni bo‘sh — avval `store.py refresh`")
+                version = f"store-{state.version}"
+                if self._snapshot is None or self._snapshot.version != version:
+                    self._snapshot = Snapshot.build(state.df, version, state.cube, state.top_lists)
+            elif self._snapshot is None:
+                shared = self.tables if isinstance(self.tables, SharedCache) else None
+                if shared is not None and not isinstance(shared.backend, RedisBackend):
+                    shared = None
+                df, version = load_movies(self.csv_path, shared=shared)
+                self._snapshot = Snapshot.build(df, version)
+            return self._snapshot
+
+    def compute(self, name, snap, year_range, rating_range):
+        section, filtered, create = SECTIONS[name]
+        key = section_key(section, snap.version, year_range, rating_range) if filtered \
+            else section_key(section, snap.version)
+        return self.tables.get(key, lambda: sized(create(snap, year_range, rating_range)))
+
+
+def etag(version, name, year_range, rating_range, fmt):
+    digest = hashlib.sha256(repr((version, name, year_range, rating_range, fmt)).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+class Api:
+    """ASGI ilova: ``GET /v1`` (ro‘yxat), ``GET /v1/<bo‘lim>``, ``GET /health``."""
+
+    def __init__(self, aggregates):
+        self.aggregates = aggregates
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        try:
+            status, headers, body = await self._handle(scope)
+        except BadRequest as e:
+            status, headers, body = 400, [], _json({"error": str(e)})
+        except Unavailable as e:
+            headers = [("content-type", JSON), ("retry-after", "30")]
+            status, body = 503, _json({"error": str(e)})
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(k.encode(), v.encode()) for k, v in headers]
+            + ([(b"content-type", JSON.encode())] if not headers else []),
+        })
+        await send({"type": "http.response.body",
+                    "body": b"" if scope["method"] == "HEAD" else body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                # Ma'lumotlar ishga tushishda yuklanadi — birinchi so‘rov kutmaydi
+                try:
+                    await asyncio.get_running_loop().run_in_executor(None, self.aggregates.snapshot)
+                except Unavailable:
+                    pass  # bo‘sh do‘kon: server ishlaydi, so‘rovlar 503 oladi
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle(self, scope):
+        if scope["method"] not in ("GET", "HEAD"):
+            return 405, [], _json({"error": "faqat GET"})
+        path = scope["path"].rstrip("/")
+        loop = asyncio.get_running_loop()
+        snap = await loop.run_in_executor(None, self.aggregates.snapshot)
+        if path == "/health":
+            return 200, [], _json({"status": "ok", "version": snap.version, "rows": len(snap.df)})
+        if path == "/v1":
+            return 200, [], _json({
+                "version": snap.version,
+                "sections": sorted(SECTIONS),
+                "year_range": snap.year_range,
+                "rating_range": snap.rating_range,
+            })
+        name = path.removeprefix("/v1/")
+        if not path.startswith("/v1/") or name not in SECTIONS:
+            return 404, [], _json({"error": f"bo‘lim topilmadi: {path}"})
+
+        query = parse_qs(scope["query_string"].decode())
+        headers = {k.decode().lower(): v.decode() for k, v in scope["headers"]}
+        fmt = (query.get("format") or [""])[0] or (
+            "arrow" if ARROW in headers.get("accept", "") else "json")
+        if fmt not in ("json", "arrow"):
+            raise BadRequest(f"format: json yoki arrow, {fmt!r} emas")
+        year_range, rating_range = parse_filters(query, snap)
+        if not SECTIONS[name][1]:
+            year_range = rating_range = None
+
+        tag = etag(snap.version, name, year_range, rating_range, fmt)
+        common = [("etag", tag), ("cache-control", "no-cache"), ("vary", "accept")]
+        if tag in headers.get("if-none-match", ""):
+            return 304, common, b""
+        df = await loop.run_in_executor(
+            None, self.aggregates.compute, name, snap, year_range, rating_range)
+        body = encode(df, fmt)
+        return 200, [("content-type", ARROW if fmt == "arrow" else JSON), *common], body
+
+
+def _json(value):
+    return json.dumps(value, ensure_ascii=False).encode()
+
+
+app = Api(Aggregates.from_env())
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="127.0.0.1", port=8600)
@@ -1,8 +1,28 @@
+from urllib.parse import quote
+
 import streamlit as st
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from aggregates import CHART_COLUMNS, HISTOGRAMS, TOP_TABLES, build_top_lists, top_table
+from cache import RedisBackend, SharedCache, open_backend
+from charts import BINNED_RENDERERS, CHART_BACKEND, FIGURE_CACHE_MB, RENDERERS, FigureCache, express
+from cube import Cube, genre_peak_years as peak_years
+from density import bin_votes, vote_steps, votes_label
+from filters import FilterEngine, select_rows
+from genres import GenreSet
+from loader import COLUMNS, load_keys, load_movies, restore
+from precompute import PRECOMPUTE, is_running, launch, presets, read_status
+from profiling import PROFILE, Profiler
+from ranking import top_groups
+from relations import MovieIndex
+from search import SearchIndex
+from sections import SectionRun, sized
+from similar import SimilarIndex
+from store import STORE_PATH, LiveCatalog, MovieStore
+from table import PAGE_SIZE, PAGE_SIZES, SortedViews, page_count, page_rows
+from warehouse import ENGINE, Warehouse
 
 
 # Sahifa sozlamaraniki
@@ -40,56 +60,518 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Profil rejimi: IMDB_PROFILE=1 yoki ?profile=1 — profiling.py ga qarang
+prof = Profiler(PROFILE or st.query_params.get("profile") == "1", get_script_run_ctx())
+prof.section("load")
+
+
+# Replikalar orasida umumiy kesh (IMDB_CACHE: disk / redis://...) — cache.py ga qarang.
+# Jarayon ichida avval LRU, keyin umumiy backend
+@st.cache_resource
+def umumiy_kesh():
+    return SharedCache(open_backend(), local=FigureCache(int(FIGURE_CACHE_MB * 2**20)))
+
+
 # ma'lumotlarni yuklash
 @st.cache_data  # “Agar data o‘zgarmagan bo‘lsa, qayta o‘qima, tez ishlat” , Streamlitga shunaqa deb aytadi.
 def malumotlar():
-    df = pd.read_csv("top_1000ta_kino.csv")
-    # Keraksiz ustunlarni olib tashlash
-    columns_to_drop = [
-        "Position",
-        "Const",
-        "Modified",
-        "Created",
-        "Description",
-        "Original Title",
-        "URL",
-        "Title Type",
-        "Release Date"
-    ]
-    df = df.drop(columns=columns_to_drop)
-    return df
-df = malumotlar()
+    # Faqat kerakli ustunlar o‘qiladi, keyingi ishga tushishlarda esa
+    # ustunli keshdan (.cache/*.arrow) yuklanadi — loader.py ga qarang.
+    # Bu kesh hostdagi replikalar uchun umumiy; Redis bo‘lsa — hostlar orasida ham
+    shared = umumiy_kesh()
+    df, version = load_movies(shared=shared if isinstance(shared.backend, RedisBackend) else None)
+    return df, version
+
+
+# SQLite do‘koni (IMDB_STORE) — yangi eksportlar deltasi jonli yamaladi
+@st.cache_resource
+def katalog():
+    return LiveCatalog(MovieStore(STORE_PATH))
+
+
+# Out-of-core rejim (IMDB_ENGINE=duckdb): katalog xotiraga yuklanmaydi,
+# filtr, guruhlash va Top 10 lar diskdagi Parquet ustida SQL — warehouse.py ga qarang
+@st.cache_resource
+def ombor():
+    return Warehouse.open()
+
+
+# Quyidagi tuzilmalar ma'lumotlar versiyasi bo‘yicha keshlanadi: do‘kon
+# yangilansa, eski versiyaniki tashlab yuboriladi (max_entries=1)
+
+# Rejissyor va janrlar uchun indeks — bir marta quriladi, har bir
+# slayder harakatida str.split + explode qayta bajarilmaydi
+@st.cache_resource(max_entries=1)
+def indekslar(_df, version):
+    return MovieIndex.build(_df)
+
+
+# Yil/reyting filtri uchun saralangan ma'lumot va kumulyativ jadval
+@st.cache_resource(max_entries=1)
+def filtr(_df, version):
+    return FilterEngine.build(_df)
+
+
+# Yil × reyting × janr/rejissyor bo‘yicha agregatlar kubi — barcha
+# bo‘limlar shu kubdan yig‘iladi
+@st.cache_resource(max_entries=1)
+def kub(_df, version):
+    return Cube.build(_df, indekslar(_df, version))
+
+
+# Jadval uchun ustunlar bo‘yicha oldindan saralangan tartiblar
+@st.cache_resource(max_entries=1)
+def saralashlar(_df, version):
+    return SortedViews(_df)
+
+
+# Filtrlanmagan ko‘rinish uchun doimiy Top 10 lar (yangi qatorlar qo‘shilsa
+# faqat ular tekshiriladi)
+@st.cache_resource(max_entries=1)
+def top_royxatlar(_df, version):
+    return build_top_lists(_df)
+
+
+# Janrlar bitmaski ustida filtr va janrlar bo‘yicha sonlar
+@st.cache_resource(max_entries=1)
+def janrlar(_df, version):
+    return GenreSet.build(_df)
+
+
+# Qidiruv va film sahifasi uchun Const / asl nomlar (df qatorlari tartibida).
+# Ustunli kesh yonidagi .keys.arrow dan — loader.load_keys ga qarang
+@st.cache_resource(max_entries=1)
+def kalitlar(version):
+    return load_keys()
+
+
+# Const → df qatori: xesh indeks versiya uchun bir marta quriladi, film sahifasi
+# esa qatorni butun ustunni ko‘rib chiqmasdan topadi
+@st.cache_resource(max_entries=2)
+def film_indeksi(_keys, version):
+    return pd.Index(_keys["Const"])
+
+
+# Nom, asl nom va rejissyor bo‘yicha qidiruv indeksi — search.py ga qarang.
+# Faqat birinchi so‘rovda quriladi
+@st.cache_resource(max_entries=1)
+def qidiruv(_df, _keys, version):
+    return SearchIndex.build(_df["Title"], _keys["Original Title"],
+                             indekslar(_df, version).directors, _df["Num Votes"])
+
+
+# "O‘xshash filmlar" uchun siyrak xususiyatlar matritsasi — similar.py ga qarang.
+# Faqat birinchi film sahifasi ochilganda quriladi
+@st.cache_resource(max_entries=1)
+def oxshashlik(_df, version):
+    return SimilarIndex.build(_df, indekslar(_df, version))
+
+
+# Yangi ma'lumotlar versiyasi uchun og‘ir bo‘limlar fon jarayonida oldindan
+# hisoblanadi (precompute.py) — har bir versiya uchun bir marta
+@st.cache_resource(max_entries=1)
+def oldindan_hisob(version):
+    return launch(version)
+
+
+# Chizilgan grafiklar keshi — barcha sessiyalar uchun umumiy (LRU, hajm chegarasi bilan)
+@st.cache_resource
+def grafiklar_keshi():
+    return FigureCache(int(FIGURE_CACHE_MB * 2**20))
+
+
+# Bo‘limlar natijalari (Plotly figuralar, jadvallar) keshi — sections.py ga qarang
+@st.cache_resource
+def bolimlar_keshi():
+    return FigureCache(int(FIGURE_CACHE_MB * 2**20))
+
+
+OUT_OF_CORE = ENGINE == "duckdb"
+if OUT_OF_CORE:
+    # Kub bo‘limlari (rejissyorlar, yillar) shu nomlar bilan SQL da
+    warehouse = ombor()
+    cube = warehouse
+    data_version = f"duckdb-{warehouse.version}"
+    n_rows = warehouse.n_rows
+else:
+    if STORE_PATH:
+        # Kub va Top 10 lar delta bilan yamalgan — qayta qurilmaydi
+        # Holat qayta chizish boshida bir marta olinadi — parallel yangilanish
+        # ``df``, kalitlar va kubni aralashtirib yubormaydi
+        catalog_state = katalog().snapshot()
+        if catalog_state.empty:
+            st.warning(f"`{STORE_PATH}` do‘koni bo‘sh — avval filmlarni yuklang: "
+                       f"`python store.py refresh top_1000ta_kino.csv --db {STORE_PATH}`")
+            st.stop()
+        df, cube, top_lists = catalog_state.df, catalog_state.cube, catalog_state.top_lists
+        data_version = f"store-{catalog_state.version}"
+    else:
+        df, data_version = malumotlar()
+        cube = kub(df, data_version)
+        top_lists = top_royxatlar(df, data_version)
+    engine = filtr(df, data_version)
+    views = saralashlar(df, data_version)
+    genre_set = janrlar(df, data_version)
+    n_rows = len(df)
+figures = grafiklar_keshi()
+run = SectionRun(bolimlar_keshi())
+# Jadval natijalari (DataFrame) — umumiy keshda. Do‘kon versiyasi faqat shu
+# SQLite fayli uchun ma'noli, shuning uchun do‘kon rejimida jarayon keshida qoladi
+tables = bolimlar_keshi() if STORE_PATH and not OUT_OF_CORE else umumiy_kesh()
+
+DETAIL_COLUMNS = ["Title", "Year", "IMDb Rating", "Num Votes", "Genres"]
+SEARCH_COLUMNS = ["Title", "Year", "IMDb Rating", "Num Votes", "Directors"]
+
+
+def film_kalitlari():
+    # Kalitlar faqat qidiruv yoki film/rejissyor sahifasi kerak bo‘lganda yuklanadi
+    return catalog_state.keys if STORE_PATH else kalitlar(data_version)
+
+
+def film_link(const):
+    return f"?film={const}"
+
+
+def director_link(name):
+    return f"?rejissyor={quote(name)}"
+
+
+def film_qatori(const):
+    # df dagi qator raqami yoki None (Const takrorlansa — birinchisi)
+    row = film_indeksi(film_kalitlari(), data_version).get_indexer_for([const])[0]
+    return int(row) if row >= 0 else None
+
+
+def film_malumoti(const):
+    # Bitta film (asl nomi bilan) yoki None
+    if OUT_OF_CORE:
+        return warehouse.film(const)
+    row = film_qatori(const)
+    if row is None:
+        return None
+    movie = restore(df.iloc[[row]]).iloc[0].copy()
+    movie["Original Title"] = film_kalitlari()["Original Title"].iloc[row]
+    return movie
+
+
+def oxshash_filmlar(const):
+    # Har bir film uchun bir marta hisoblanadi — natija umumiy keshda
+    similar = oxshashlik(df, data_version).similar(film_qatori(const))
+    films = restore(df.iloc[similar["row"]], DETAIL_COLUMNS)
+    consts = film_kalitlari()["Const"].to_numpy()[similar["row"]]
+    films.insert(0, "Sahifa", [film_link(c) for c in consts])
+    films["O‘xshashlik"] = similar["score"].round(3).to_numpy()
+    return sized(films.reset_index(drop=True))
+
+
+def film_sahifasi(const):
+    movie = film_malumoti(const)
+    if movie is None:
+        st.warning(f"{const} — bunday film topilmadi")
+        return
+    st.header(f"🎬 {movie['Title']} ({movie['Year']})")
+    original = movie["Original Title"]
+    if isinstance(original, str) and original != movie["Title"]:
+        st.caption(f"Asl nomi: {original}")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("⭐ IMDb reyting", "—" if pd.isna(movie["IMDb Rating"]) else movie["IMDb Rating"])
+    col2.metric("🗳 Ovozlar", f"{movie['Num Votes']:,}")
+    col3.metric("⏱ Davomiyligi", "—" if pd.isna(movie["Runtime (mins)"])
+                else f"{int(movie['Runtime (mins)'])} daqiqa")
+    st.markdown(f"🎭 **Janrlar:** {movie['Genres'] if isinstance(movie['Genres'], str) else '—'}")
+    if isinstance(movie["Directors"], str):
+        st.markdown("🎬 **Rejissyor:** " + ", ".join(
+            f"[{name}]({director_link(name)})" for name in movie["Directors"].split(", ")
+        ))
+    st.markdown(f"🔗 [IMDb sahifasi](https://www.imdb.com/title/{const}/)")
+    if OUT_OF_CORE:
+        return
+    # Janrlar, rejissyorlar, o‘n yillik va davomiylik bo‘yicha eng yaqin filmlar
+    st.subheader("🎞 O‘xshash filmlar")
+    films = run.compute("similar", (data_version, const), lambda: oxshash_filmlar(const),
+                        cache=tables)
+    if films.empty:
+        st.info("O‘xshash film topilmadi")
+        return
+    st.dataframe(
+        films,
+        column_config={"Sahifa": st.column_config.LinkColumn(display_text="ochish")},
+        use_container_width=True,
+    )
+
+
+def rejissyor_filmlari(name):
+    # (filmlar jadvali, ularning Const lari)
+    if OUT_OF_CORE:
+        films = warehouse.director_films(name, DETAIL_COLUMNS)
+        return restore(films, DETAIL_COLUMNS), films["Const"].to_numpy()
+    keys = film_kalitlari()
+    rows = qidiruv(df, keys, data_version).rows(name)
+    return restore(df.iloc[rows], DETAIL_COLUMNS), keys["Const"].to_numpy()[rows]
+
+
+def rejissyor_sahifasi(name):
+    films, consts = rejissyor_filmlari(name)
+    if films.empty:
+        st.warning(f"{name} — bunday rejissyor topilmadi")
+        return
+    st.header(f"🎬 {name}")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("🎬 Filmlar", len(films))
+    col2.metric("⭐ O‘rtacha reyting", round(films["IMDb Rating"].mean(), 2))
+    col3.metric("🗳 Jami ovozlar", f"{films['Num Votes'].sum():,}")
+    films.insert(0, "Sahifa", [film_link(const) for const in consts])
+    st.dataframe(
+        films.sort_values("Year").reset_index(drop=True),
+        column_config={"Sahifa": st.column_config.LinkColumn(display_text="ochish")},
+        use_container_width=True,
+    )
+
+
+# Film yoki rejissyor sahifasi: ?film=tt0111161 / ?rejissyor=... (qidiruv natijalaridan)
+film = st.query_params.get("film")
+director = st.query_params.get("rejissyor")
+if film or director:
+    prof.section("detail")
+    if st.button("← Dashboardga qaytish"):
+        st.query_params.clear()
+        st.rerun()
+    if film:
+        film_sahifasi(film)
+    else:
+        rejissyor_sahifasi(director)
+    prof.stop()
+    st.stop()
 
 
 
 # Yon panel filtrlari
+prof.section("filters")
 st.sidebar.header("🎛 Filterlar")
 
-min_year, max_year = int(df["Year"].min()), int(df["Year"].max())
+if OUT_OF_CORE:
+    (min_year, max_year), (min_rating, max_rating) = warehouse.year_range, warehouse.rating_range
+    genre_names = warehouse.genre_names
+else:
+    min_year, max_year = int(df["Year"].min()), int(df["Year"].max())
+    # Reyting float32 da saqlanadi — chegaralarni 0.1 qadamga yaxlitlaymiz
+    min_rating = round(float(df["IMDb Rating"].min()), 1)
+    max_rating = round(float(df["IMDb Rating"].max()), 1)
+    genre_names = genre_set.names
+
+# Tayyor filtrlar oldindan hisoblangan — tanlansa, natijalar darhol keshdan.
+# Slayderlar kaliti tanlovga bog‘liq: tanlov o‘zgarsa, ular shu qiymatlarga qaytadi
+preset_ranges = {name: (y, r) for name, y, r in
+                 presets((min_year, max_year), (min_rating, max_rating))}
+preset = st.sidebar.selectbox("⚡ Tayyor filtrlar", list(preset_ranges))
+preset_years, preset_ratings = preset_ranges[preset]
+
 year_range = st.sidebar.slider(
     "📅 Yil oralig‘i",
     min_year,
     max_year,
-    (min_year, max_year)
+    preset_years,
+    key=f"year-{preset}",
 )
 
-min_rating, max_rating = float(df["IMDb Rating"].min()), float(df["IMDb Rating"].max())
 rating_range = st.sidebar.slider(
     "⭐ Reyting oralig‘i",
     min_rating,
     max_rating,
-    (min_rating, max_rating)
+    preset_ratings,
+    key=f"rating-{preset}",
 )
 
-# Ma'lumotlarni filtrlash
-filtered_df = df[
-    (df["Year"].between(year_range[0], year_range[1])) &
-    (df["IMDb Rating"].between(rating_range[0], rating_range[1]))
-]
+selected_genres = st.sidebar.multiselect("🎭 Janrlar", list(genre_names))
+genre_mode = "all" if st.sidebar.radio(
+    "Janrlar mosligi",
+    ["Istalgan (OR)", "Barchasi (AND)"],
+    horizontal=True,
+) == "Barchasi (AND)" else "any"
+
+unfiltered = (year_range == (min_year, max_year)
+              and rating_range == (min_rating, max_rating)
+              and not selected_genres)
+genre_filter = (tuple(sorted(selected_genres)), genre_mode) if selected_genres else None
+
+if OUT_OF_CORE:
+    # Janr filtri ham SQL da; natijada qatorlar yo‘q — faqat ko‘rsatkichlar
+    source = warehouse.filtered(genre_filter)
+    selection = source.query(year_range, rating_range)
+else:
+    # Ma'lumotlarni filtrlash — butun jadval bo‘ylab niqob o‘rniga binar qidiruv,
+    # janrlar esa bitmask bo‘yicha (satrlar bo‘linmaydi)
+    selection = engine.query(year_range, rating_range)
+    if selected_genres:
+        selection = select_rows(df, genre_set.match(selected_genres, genre_mode, selection.rows))
+    filter_mask = selection.mask(len(df))
+    # Grafiklar uchun faqat sonli ustunlar, asl turlarda
+    filtered_df = restore(df.iloc[selection.rows], CHART_COLUMNS)
+
+# Bo‘limlar bog‘liqliklari: faqat ma'lumotlarga yoki filtr holatiga ham
+DATA = (data_version,)
+FILTERS = (data_version, year_range, rating_range, genre_filter)
+
+_genre_cube = []
+
+
+def filter_cube():
+    # Janr filtri bo‘lsa — kub faqat tanlangan qatorlardan quriladi (bir marta)
+    if OUT_OF_CORE:
+        return source
+    if not selected_genres:
+        return cube
+    if not _genre_cube:
+        _genre_cube.append(Cube.build(df, indekslar(df, data_version), selection.rows))
+    return _genre_cube[0]
+
+# Oldindan hisoblash holati (faqat CSV rejimida — do‘kon natijalari jarayon keshida)
+@st.fragment(run_every=2)
+def hisob_holati():
+    state = read_status()
+    if is_running(state, data_version):
+        st.progress(state["done"] / max(state["total"], 1),
+                    text=f"⏳ Oldindan hisoblanmoqda: {state['done']} / {state['total']}"
+                    if state["total"] else "⏳ Oldindan hisoblash boshlanmoqda…")
+    else:
+        st.caption("✅ Og‘ir bo‘limlar oldindan hisoblandi")
+
+
+if PRECOMPUTE and not STORE_PATH and not OUT_OF_CORE and umumiy_kesh().backend is not None:
+    oldindan_hisob(data_version)
+    if is_running(read_status(), data_version):
+        with st.sidebar:
+            hisob_holati()
+
+# Hisoblagich yon panelda, filtrlardan keyin — qiymati oxirida yoziladi
+section_stats = st.sidebar.empty()
+profile_panel = st.sidebar.empty()
+
+
+def top_10_table(name):
+    # Filtr yo‘q bo‘lsa — tayyor ro‘yxat, aks holda argpartition (aggregates.py)
+    if OUT_OF_CORE:
+        return source.top_table(name, year_range, rating_range)
+    column = TOP_TABLES[name][0]
+    return top_table(df, name, selection, top_lists[column] if unfiltered else None)
+
+
+# Out-of-core rejimda grafiklar SQL da sanalgan/binlangan ma'lumotdan (Plotly)
+chart_backend = "binned" if OUT_OF_CORE else CHART_BACKEND
+renderers = BINNED_RENDERERS if OUT_OF_CORE else RENDERERS[CHART_BACKEND]
+
+
+def grafik_malumoti(chart_id, window=None):
+    if chart_id == "year_line":
+        return selection.per_year
+    if OUT_OF_CORE:
+        if chart_id == "votes_scatter":
+            return source.votes_density(year_range, rating_range, window)
+        return source.value_counts(HISTOGRAMS[chart_id], year_range, rating_range)
+    if chart_id == "votes_scatter":
+        return bin_votes(filtered_df["Num Votes"], filtered_df["IMDb Rating"], window)
+    return filtered_df[HISTOGRAMS[chart_id]]
+
+
+def grafik(chart_id, window=None):
+    # Bir xil filtr holati uchun grafik qayta chizilmaydi (ma'lumot ham olinmaydi).
+    # PNG lar (matplotlib) umumiy keshda — oldindan hisoblanganlari (precompute.py) shu yerdan.
+    # Butun oraliq (window=None) kaliti oldindan hisoblangani bilan bir xil
+    deps = (chart_backend, *FILTERS) + (() if window is None else (window,))
+    fig = run.compute(chart_id, deps,
+                      lambda: renderers[chart_id](grafik_malumoti(chart_id, window)),
+                      cache=tables if chart_backend == "matplotlib" else figures)
+    if chart_backend == "matplotlib":
+        st.image(fig, use_container_width=True)
+    else:
+        st.plotly_chart(fig, use_container_width=True)
+
+# Nom va rejissyor bo‘yicha qidiruv — filtrlardan mustaqil, butun katalog bo‘ylab.
+# Fragment: so‘rov yozilganda faqat shu bo‘lim qayta ishga tushadi
+st.subheader("🔎 Film yoki rejissyor qidirish")
+
+
+@st.fragment
+def qidiruv_bolimi():
+    if not run.finished:
+        prof.section("search")
+        run.executed("search")
+    query = st.text_input("Nom, asl nom yoki rejissyor", placeholder="masalan: yasujiro ozu")
+    if not query.strip():
+        return
+    if OUT_OF_CORE:
+        names = warehouse.search_names(query)
+        results = warehouse.search(query, columns=SEARCH_COLUMNS)
+        consts = results.pop("Const").to_numpy()
+    else:
+        keys = film_kalitlari()
+        index = qidiruv(df, keys, data_version)
+        names = index.search_names(query)
+        rows = index.search(query)["row"].to_numpy()
+        results = restore(df.iloc[rows], SEARCH_COLUMNS)
+        consts = keys["Const"].to_numpy()[rows]
+    if names:
+        st.markdown("🎬 **Rejissyorlar:** " + " · ".join(
+            f"[{name}]({director_link(name)})" for name in names
+        ))
+    if results.empty:
+        st.info("Hech narsa topilmadi")
+        return
+    results.insert(0, "Sahifa", [film_link(const) for const in consts])
+    st.dataframe(
+        results.reset_index(drop=True),
+        column_config={"Sahifa": st.column_config.LinkColumn(display_text="ochish")},
+        use_container_width=True,
+    )
+
+
+qidiruv_bolimi()
 
 # Maʼlumotlar toʻplamini koʻrsatish
 st.subheader("📄 Filtrlangan ma’lumotlar")
-st.dataframe(filtered_df, use_container_width=True)
+
+# Brauzerga faqat joriy sahifa yuboriladi — butun filtrlangan jadval emas.
+# Fragment: saralash va sahifa almashtirish faqat shu bo‘limni qayta ishga tushiradi
+@st.fragment
+def jadval():
+    if run.finished:
+        # Skript emas, faqat shu fragment qayta ishga tushdi
+        st.session_state["jadval_fragment"] = st.session_state.get("jadval_fragment", 0) + 1
+    else:
+        prof.section("table")
+        run.executed("table")
+    sort_col, sort_dir, size_col = st.columns([2, 1, 1])
+    sort_by = sort_col.selectbox("Saralash", ["Asl tartib", *COLUMNS])
+    ascending = sort_dir.radio("Yo‘nalish", ["↑", "↓"], horizontal=True) == "↑"
+    page_size = size_col.selectbox(
+        "Sahifa hajmi",
+        PAGE_SIZES,
+        index=PAGE_SIZES.index(PAGE_SIZE),
+    )
+    column = None if sort_by == "Asl tartib" else sort_by
+    n_pages = page_count(selection.count, page_size)
+    page = st.number_input(
+        f"Sahifa (jami {n_pages:,})",
+        min_value=1,
+        max_value=n_pages,
+        value=1,
+        # Filtr yoki saralash o‘zgarsa, birinchi sahifaga qaytamiz
+        key=f"page-{year_range}-{rating_range}-{genre_filter}-{column}-{ascending}-{page_size}",
+    )
+    if OUT_OF_CORE:
+        # Faqat joriy sahifa: ORDER BY ... LIMIT / OFFSET
+        frame = source.page(year_range, rating_range, column, ascending, page - 1, page_size)
+        total = selection.count
+    else:
+        rows, total = page_rows(views, selection.rows, filter_mask, column, ascending,
+                                page - 1, page_size)
+        frame = restore(df.iloc[rows])
+    st.dataframe(frame, use_container_width=True)
+    start = (page - 1) * page_size
+    st.caption(f"{min(start + 1, total):,}–{start + len(frame):,} / {total:,} ta film")
+
+
+jadval()
 
 st.markdown("""
 ℹ️ **Izoh:**  
@@ -100,9 +582,9 @@ Filterlar yordamida foydalanuvchi ma’lumotlarni dinamik ravishda tahlil qilish
 
 # Ko'rsatkichlar
 col1, col2, col3 = st.columns(3)
-col1.metric("🎬 Jami filmlar", len(filtered_df))
-col2.metric("⭐ O‘rtacha reyting", round(filtered_df["IMDb Rating"].mean(),2), "↑0.2")
-col3.metric("🗳 Jami ovozlar", f"{filtered_df['Num Votes'].sum():,}")
+col1.metric("🎬 Jami filmlar", selection.count)
+col2.metric("⭐ O‘rtacha reyting", round(selection.rating_mean,2), "↑0.2")
+col3.metric("🗳 Jami ovozlar", f"{selection.votes_sum:,}")
 
 # Grafiklar
 st.markdown("---")
@@ -115,13 +597,10 @@ st.markdown("---")
 col_left, col_right = st.columns(2)
 
 # ⭐Reytingni taqsimlash
+prof.section("rating_hist")
 with col_left:
     st.subheader("⭐ Reyting taqsimoti")
-    fig, ax = plt.subplots()
-    sns.histplot(filtered_df["IMDb Rating"], bins=10, kde=True, ax=ax)
-    ax.set_xlabel("IMDb reytingi")
-    ax.set_ylabel("Soni")
-    st.pyplot(fig)
+    grafik("rating_hist")
 
     st.markdown("""
     📌 **Tahlil:**  
@@ -136,12 +615,9 @@ with col_left:
 
 # Yiliga filmlar
 with col_right:
+    prof.section("year_line")
     st.subheader("📅 Yillar bo‘yicha filmlar soni")
-    fig, ax = plt.subplots()
-    filtered_df["Year"].value_counts().sort_index().plot(kind="line", ax=ax)
-    ax.set_xlabel("Year")
-    ax.set_ylabel("Number of Movies")
-    st.pyplot(fig)
+    grafik("year_line")
 
     st.markdown("""
     📌 **Tahlil:**  
@@ -157,12 +633,11 @@ with col_right:
 
 # Eng mashhur filmlar
 st.markdown("---")
+prof.section("top_rating")
 st.subheader("🏆 Eng yuqori reytingli Top 10 filmlar")
 
-top_10 = filtered_df.sort_values("IMDb Rating", ascending=False).head(10)
-st.table(
-    top_10[["Title", "Year", "IMDb Rating", "Num Votes", "Directors"]]
-)
+top_10 = run.compute("top_rating", FILTERS, lambda: sized(top_10_table("top_rating")), cache=tables)
+st.table(top_10)
 
 st.markdown("""
 📌 **Xulosa:**  
@@ -177,10 +652,11 @@ Bu filmlar kino tarixidagi eng muvaffaqiyatli va tomoshabinlar tomonidan eng ko
 
 
 # Eng kop ovoz olgan top 10 film
+prof.section("top_votes")
 st.subheader("🔥 Eng ko‘p ovoz olgan Top 10 filmlar")
 
-top_votes = filtered_df.sort_values("Num Votes", ascending=False).head(10)
-st.table(top_votes[["Title", "Year", "Num Votes", "IMDb Rating"]])
+top_votes = run.compute("top_votes", FILTERS, lambda: sized(top_10_table("top_votes")), cache=tables)
+st.table(top_votes)
 
 st.markdown("""
 📌 **Tahlil:**  
@@ -199,28 +675,18 @@ st.success("🏆 Top 10 filmlar tahlili tayyor")
 
 
 
+prof.section("directors_votes")
 st.subheader("📊 Eng ko‘p ko‘rilgan rejissyorlar (Top 10)")
 
-# Ba'zi filmlarda bir nechta rejissyor bo‘lishi mumkin → split qilamiz
-directors_df = df.copy()
-directors_df["Directors"] = directors_df["Directors"].str.split(", ")
-directors_df = directors_df.explode("Directors")
-
-# Har bir rejissyor bo‘yicha umumiy votes
-top_directors_votes = (
-    directors_df.groupby("Directors")["Num Votes"]
-    .sum()
-    .sort_values(ascending=False)
-    .head(10)
-    .reset_index()
-)
-
-fig_votes = px.bar(
-    top_directors_votes,
+# Har bir rejissyor bo‘yicha umumiy votes (bir nechta rejissyorli filmlar
+# indeksda allaqachon ajratilgan)
+# Faqat df ga bog‘liq — versiya uchun bir marta quriladi
+fig_votes = run.compute("directors_votes", DATA, lambda: sized(express().bar(
+    cube.top_directors_by_votes(),
     x="Directors",
     y="Num Votes",
     title="Top 10 rejissyor — filmlarining umumiy ovozlar soni",
-)
+)))
 
 
 st.plotly_chart(fig_votes, use_container_width=True)
@@ -239,22 +705,48 @@ Ovozlar soni mashhurlikni bildiradi, lekin sifatni to‘liq ifodalamaydi.
 
 
 
+prof.section("directors_rating")
 st.subheader("⭐ Rejissyorlar bo‘yicha o‘rtacha IMDb reyting")
 
-top_directors_rating = (
-    directors_df.groupby("Directors")["IMDb Rating"]
-    .mean()
-    .sort_values(ascending=False)
-    .head(10)
-    .reset_index()
-)
+# Saralash → (ustun, 95% ishonch oralig‘i chegaralari) — ranking.py ga qarang.
+# Standart — avvalgidek o‘rtacha reyting; Bayes reytingi (WR) — tanlov bo‘yicha
+RANKINGS = {
+    "O‘rtacha reyting": ("avg_rating", "ci_low", "ci_high"),
+    "Bayes reytingi (WR)": ("wr", "wr_low", "wr_high"),
+}
+RANKING_LABELS = {"wr": "Bayes reytingi (WR)", "avg_rating": "O‘rtacha reyting",
+                  "movie_count": "Filmlar soni"}
+
+
+def reyting_grafigi(ratings, ranking):
+    column, low, high = RANKINGS[ranking]
+    top = top_groups(ratings, column).reset_index()
+    return express().bar(
+        top,
+        x="Directors",
+        y=column,
+        error_y=top[high] - top[column],
+        error_y_minus=top[column] - top[low],
+        hover_data=["movie_count"],
+        labels=RANKING_LABELS,
+        title=f"Top 10 rejissyor — {ranking}, 95% ishonch oralig‘i bilan",
+    )
 
-fig_rating = px.bar(
-    top_directors_rating,
-    x="Directors",
-    y="IMDb Rating",
-    title="Top 10 rejissyor — o‘rtacha IMDb reyting",
-)
+
+ranking = st.radio("Saralash", list(RANKINGS), horizontal=True, key="directors_rating_order")
+if RANKINGS[ranking][0] == "wr":
+    # Barcha rejissyorlar uchun WR va bootstrap oraliqlari — versiya uchun bir marta
+    director_ratings = run.compute("director_ratings", DATA,
+                                   lambda: sized(cube.group_ratings("directors")), cache=tables)
+    fig_rating = run.compute("directors_rating", (*DATA, ranking),
+                             lambda: sized(reyting_grafigi(director_ratings, ranking)))
+else:
+    fig_rating = run.compute("directors_rating", DATA, lambda: sized(express().bar(
+        cube.top_directors_by_rating(),
+        x="Directors",
+        y="IMDb Rating",
+        title="Top 10 rejissyor — o‘rtacha IMDb reyting",
+    )))
 
 st.plotly_chart(fig_rating, use_container_width=True)
 
@@ -262,7 +754,8 @@ st.markdown("""
 📌 **Tahlil:**  
 Bu grafik rejissyorlarning filmlari sifat jihatdan qanchalik yuqori baholanganini ko‘rsatadi.  
 Ba’zi rejissyorlar kam film suratga olgan bo‘lsa ham, ularning reytingi yuqori.  
-Bu sifat har doim miqdordan ustun bo‘lishi mumkinligini ko‘rsatadi.
+Bu sifat har doim miqdordan ustun bo‘lishi mumkinligini ko‘rsatadi.  
+**Bayes reytingi (WR)** tanlansa, kam filmli rejissyor reytingi umumiy o‘rtachaga tortiladi; chiziqlar — 95% ishonch oralig‘i (bootstrap): oraliq qanchalik keng bo‘lsa, reyting shunchalik kam filmga tayanadi.
 """)
 
 
@@ -270,39 +763,35 @@ Bu sifat har doim miqdordan ustun bo‘lishi mumkinligini ko‘rsatadi.
 
 
 
+prof.section("genre_year")
 st.header("🎭 Janrlar va yillar bo‘yicha tahlil")
 st.subheader("📅 Yillar bo‘yicha janrlar taqsimoti")
 
-# Janrlarni alohida qatorlarga ajratamiz
-genres_df = df.copy()
-genres_df["Genres"] = genres_df["Genres"].str.split(", ")
-genres_df = genres_df.explode("Genres")
+def genre_year_counts():
+    # Yil + janr bo‘yicha filmlar soni — har bir janr biti uchun bincount (yoki SQL)
+    if OUT_OF_CORE:
+        return warehouse.genre_year_counts()
+    return genre_set.year_counts(df["Year"])
 
-# Yil + janr bo‘yicha filmlar soni
-genre_year_count = (
-    genres_df.groupby(["Year", "Genres"])
-    .size()
-    .reset_index(name="Movie Count")
-)
 
-# Eng ko‘p uchraydigan 5 ta janrni olamiz (grafik chiroyli bo‘lishi uchun)
-top_genres = (
-    genre_year_count.groupby("Genres")["Movie Count"]
-    .sum()
-    .sort_values(ascending=False)
-    .head(5)
-    .index
-)
+def genre_year_chart():
+    genre_year_count = genre_year_counts()
 
-filtered_data = genre_year_count[genre_year_count["Genres"].isin(top_genres)]
+    # Eng ko‘p uchraydigan 5 ta janrni olamiz (grafik chiroyli bo‘lishi uchun)
+    top_genres = warehouse.top_genres() if OUT_OF_CORE else genre_set.top()
 
-fig_genre_year = px.line(
-    filtered_data,
-    x="Year",
-    y="Movie Count",
-    color="Genres",
-    title="Yillar bo‘yicha eng mashhur janrlar",
-)
+    filtered_data = genre_year_count[genre_year_count["Genres"].isin(top_genres)]
+
+    return sized(express().line(
+        filtered_data,
+        x="Year",
+        y="Movie Count",
+        color="Genres",
+        title="Yillar bo‘yicha eng mashhur janrlar",
+    ))
+
+
+fig_genre_year = run.compute("genre_year", DATA, genre_year_chart)
 
 st.plotly_chart(fig_genre_year, use_container_width=True)
 
@@ -318,22 +807,15 @@ Bu holat tarixiy voqealar, xususan Ikkinchi jahon urushi va undan keyingi ijtimo
 
 
 
+prof.section("movies_per_year")
 st.subheader("🏭 Eng ko‘p film suratga olingan yillar")
 
-movies_per_year = (
-    df.groupby("Year")
-    .size()
-    .reset_index(name="Movie Count")
-    .sort_values("Movie Count", ascending=False)
-    .head(10)
-)
-
-fig_years = px.bar(
-    movies_per_year,
+fig_years = run.compute("movies_per_year", DATA, lambda: sized(express().bar(
+    cube.movies_per_year(),
     x="Year",
     y="Movie Count",
     title="Top 10 eng sermahsul yillar",
-)
+)))
 
 st.plotly_chart(fig_years, use_container_width=True)
 st.markdown("""
@@ -347,26 +829,14 @@ Bu davrlar kino sanoatining rivojlanishi, texnologik yutuqlar yoki jamiyatda kin
 
 
 
+prof.section("genre_peaks")
 st.header("🎯 Janrlar bo‘yicha(Top 5), eng sermahsul yillar")
 
-# Janrlarni alohida qatorlarga ajratamiz
-genre_peak_df = df.copy()
-genre_peak_df["Genres"] = genre_peak_df["Genres"].str.split(", ")
-genre_peak_df = genre_peak_df.explode("Genres")
-
-# Janr + yil bo‘yicha filmlar soni
-genre_year_counts = (
-    genre_peak_df.groupby(["Genres", "Year"])
-    .size()
-    .reset_index(name="Movie Count")
-)
-
-# Har bir janr uchun eng ko‘p film olingan yil
-idx = genre_year_counts.groupby("Genres")["Movie Count"].idxmax()
-genre_peak_years = genre_year_counts.loc[idx].sort_values("Movie Count", ascending=False)
-
-# Faqat eng yuqori 8 janrni olish
-genre_peak_years = genre_peak_years.head(5)
+# Har bir janr uchun eng ko‘p film olingan yil (yuqoridagi yil + janr
+# hisobidan foydalanamiz), faqat eng yuqori 5 janr
+genre_peak_years = run.compute("genre_peaks", DATA,
+                               lambda: sized(peak_years(genre_year_counts())),
+                               cache=tables)
 
 # Natijalarni chiqarish
 for _, row in genre_peak_years.iterrows():
@@ -387,18 +857,40 @@ st.markdown("""
 
 
 # IMDb reytingi va ovozlar soni farqi
+prof.section("votes_scatter")
 st.subheader("📊 IMDb reyting va ovozlar soni o‘rtasidagi bog‘liqlik")
 
-fig, ax = plt.subplots()
-sns.scatterplot(
-    data=filtered_df,
-    x="Num Votes",
-    y="IMDb Rating",
-    ax=ax
-)
-ax.set_xlabel("Ovozlar soni")
-ax.set_ylabel("IMDb reytingi")
-st.pyplot(fig)
+if OUT_OF_CORE:
+    votes_bounds = warehouse.votes_range
+else:
+    votes_bounds = (int(df["Num Votes"].min()), int(df["Num Votes"].max()))
+
+
+# Ko‘rinish oynasi (level of detail): oyna toraytirilsa faqat undagi filmlar qayta
+# binlanadi; kam bo‘lsa — xom nuqtalar (density.py). Fragment: faqat shu grafik qayta chiziladi
+@st.fragment
+def ovozlar_grafigi():
+    steps = vote_steps(*votes_bounds)
+    votes_col, rating_col = st.columns(2)
+    votes_window = votes_col.select_slider(
+        "🔍 Ovozlar oynasi",
+        options=steps,
+        value=(steps[0], steps[-1]),
+        format_func=votes_label,
+    )
+    rating_window = rating_col.slider(
+        "🔍 Reyting oynasi",
+        min_rating,
+        max_rating,
+        (min_rating, max_rating),
+        step=0.1,
+    )
+    window = (votes_window, rating_window)
+    grafik("votes_scatter",
+           None if window == ((steps[0], steps[-1]), (min_rating, max_rating)) else window)
+
+
+ovozlar_grafigi()
 
 st.markdown("""
 📌 **Tahlil:**  
@@ -413,13 +905,10 @@ Demak, reyting va mashhurlik har doim ham bir xil bo‘lmaydi.
 
 
 # Filmlar davomiyligi taqsimoti
+prof.section("runtime_hist")
 st.subheader("⏱ Film davomiyligi taqsimoti")
 
-fig, ax = plt.subplots()
-sns.histplot(filtered_df["Runtime (mins)"], bins=15, ax=ax)
-ax.set_xlabel("Davomiyligi (daqiqa)")
-ax.set_ylabel("Filmlar soni")
-st.pyplot(fig)
+grafik("runtime_hist")
 
 st.markdown("""
 📌 **Tahlil:**  
@@ -435,29 +924,34 @@ Juda qisqa yoki juda uzun filmlar kam uchraydi, chunki ular tomoshabin e’tibor
 
 
 # Eng yaxshi rejiseorlar va filmlari soni
+prof.section("director_table")
 st.subheader("🎬 Eng yaxshi rejissyorlar (o‘rtacha reyting)")
 
-director_df = filtered_df.copy()
-director_df["Directors"] = director_df["Directors"].str.split(", ")
-director_df = director_df.explode("Directors")
-
-top_directors = (
-    director_df.groupby("Directors")
-    .agg(
-        avg_rating=("IMDb Rating", "mean"),
-        movie_count=("Title", "count")
-    )
-    .query("movie_count >= 2")
-    .sort_values("avg_rating", ascending=False)
-    .head(10)
-)
-
-st.dataframe(top_directors)
+table_ranking = st.radio("Saralash", list(RANKINGS), horizontal=True, key="director_table_order")
+# Kubning filtr oralig‘iga mos yacheykalaridan yig‘iladi
+if RANKINGS[table_ranking][0] == "wr":
+    # WR kam filmlilarni o‘zi pastga tortadi — "kamida 2 film" sharti kerak emas
+    filtered_ratings = run.compute(
+        "director_ratings", FILTERS,
+        lambda: sized(filter_cube().group_ratings("directors", year_range, rating_range)),
+        cache=tables)
+    top_directors = top_groups(filtered_ratings)[["wr", "avg_rating", "ci_low", "ci_high", "movie_count"]]
+else:
+    top_directors = run.compute("director_table", FILTERS,
+                                lambda: sized(filter_cube().director_rating_table(year_range, rating_range)),
+                                cache=tables)
+
+if "ci_low" in top_directors:
+    # Bitta filmli rejissyorda oraliq yo‘q (NaN) — "—" bilan
+    st.dataframe(top_directors.style.format(precision=2, na_rep="—", subset=["ci_low", "ci_high"]))
+else:
+    st.dataframe(top_directors)
 
 st.markdown("""
 📌 **Tahlil:**  
 Ushbu jadval bir nechta film suratga olgan va o‘rtacha IMDb reytingi yuqori bo‘lgan rejissyorlarni ko‘rsatadi.  
-Bu rejissyorlar filmlarida **sifat barqarorligi** kuzatiladi va ularning ishlari tomoshabinlar tomonidan yuqori baholanadi.
+Bu rejissyorlar filmlarida **sifat barqarorligi** kuzatiladi va ularning ishlari tomoshabinlar tomonidan yuqori baholanadi.  
+Bayes reytingi (WR) bo‘yicha saralanganda "kamida 2 film" sharti qo‘llanmaydi (WR kam filmlilarni o‘zi pastga tortadi), `ci_low` / `ci_high` — o‘rtacha reytingning 95% ishonch oralig‘i (bitta filmli rejissyorda oraliq yo‘q — "—").
 """)
 
 
@@ -466,17 +960,12 @@ Bu rejissyorlar filmlarida **sifat barqarorligi** kuzatiladi va ularning ishlari
 
 
 # Yillar buyicha filmlar tahlili
+prof.section("decade_stats")
 st.subheader("📅 O‘n yilliklar bo‘yicha filmlar tahlili")
 
-filtered_df["Decade"] = (filtered_df["Year"] // 10) * 10
-
-decade_stats = (
-    filtered_df.groupby("Decade")
-    .agg(
-        avg_rating=("IMDb Rating", "mean"),
-        movie_count=("Title", "count")
-    )
-)
+decade_stats = run.compute("decade_stats", FILTERS,
+                           lambda: sized(filter_cube().decade_stats(year_range, rating_range)),
+                           cache=tables)
 
 st.dataframe(decade_stats)
 
@@ -491,6 +980,18 @@ Bu davrlar kino sanoatining eng faol va samarali bosqichlari ekanini ko‘rsatad
 
 
 
+# Qayta ishga tushgan bo‘limlar hisobi
+prof.section("footer")
+run.finished = True
+stats = run.summary()
+with section_stats.expander(
+    f"🔁 Qayta hisoblangan bo‘limlar: {len(stats['computed'])} / {stats['total']}"
+):
+    st.caption("Hisoblandi: " + (", ".join(stats["computed"]) or "—"))
+    st.caption("Keshdan: " + (", ".join(stats["reused"]) or "—"))
+    st.caption(f"Jadval fragmenti alohida: {st.session_state.pop('jadval_fragment', 0)} marta")
+
+
 # _____________________________________________________________________________________________________________________
 
 # st.sidebar.markdown("---")
@@ -636,4 +1137,12 @@ Data • Streamlit • AI
 """, unsafe_allow_html=True)
 
 
-
+# Profil paneli — barcha bo‘limlar chizilgandan keyin
+timings = prof.stop()
+if timings:
+    prof.export(data_version=data_version, rows=n_rows)
+    with profile_panel.expander("⏱ Profil", expanded=True):
+        st.dataframe(pd.DataFrame(timings).set_index("section").round(1),
+                     use_container_width=True)
+        st.download_button("JSON lines", prof.lines(data_version=data_version, rows=n_rows),
+                           file_name=f"profile-{prof.run_id}.jsonl")
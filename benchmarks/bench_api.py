@@ -0,0 +1,135 @@
+"""api.py uchun yuklama testi: parallel so‘rovlarda p50/p99 kechikish va RPS.
+
+Server alohida jarayonda ishga tushiriladi (yoki ``--url`` bilan tayyor
+serverga ulanadi). Har bir bo‘lim tasodifiy filtrlar bilan so‘raladi; ikkinchi
+o‘tishda ``If-None-Match`` yuboriladi (304 javoblar).
+
+    python benchmarks/bench_api.py --requests 2000 --concurrency 32
+    python benchmarks/bench_api.py --url http://127.0.0.1:8600 --format arrow
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+import aiohttp
+import numpy as np
+
+from common import ROOT
+
+SECTIONS = ["summary", "top_rating", "top_votes", "directors", "decades", "per_year",
+            "genre_year"]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port):
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api:app", "--port", str(port), "--log-level",
+         "warning"],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+    )
+    return proc
+
+
+async def wait_ready(session, url, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            async with session.get(f"{url}/v1") as r:
+                if r.status == 200:
+                    return await r.json()
+        except aiohttp.ClientError:
+            pass
+        await asyncio.sleep(0.2)
+    raise TimeoutError("server ishga tushmadi")
+
+
+def make_paths(info, n, fmt, seed=0):
+    # Slayderlar qadamiga mos (yil — butun, reyting — 0.1) tasodifiy oraliqlar
+    rng = random.Random(seed)
+    (y0, y1), (r0, r1) = info["year_range"], info["rating_range"]
+    paths = []
+    for _ in range(n):
+        a, b = sorted(rng.randint(y0, y1) for _ in range(2))
+        lo, hi = sorted(round(rng.uniform(r0, r1), 1) for _ in range(2))
+        section = rng.choice(SECTIONS)
+        paths.append(f"/v1/{section}?year_min={a}&year_max={b}"
+                     f"&rating_min={lo}&rating_max={hi}&format={fmt}")
+    return paths
+
+
+async def run(session, url, paths, concurrency, etags=None):
+    latencies = np.zeros(len(paths))
+    statuses = {}
+    tags = {}
+    queue = iter(enumerate(paths))
+
+    async def worker():
+        for i, path in queue:
+            headers = {"If-None-Match": etags[path]} if etags and path in etags else {}
+            start = time.perf_counter()
+            async with session.get(url + path, headers=headers) as r:
+                await r.read()
+                tags[path] = r.headers.get("ETag")
+                statuses[r.status] = statuses.get(r.status, 0) + 1
+            latencies[i] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start, statuses, tags
+
+
+def report(label, latencies, elapsed, statuses):
+    p50, p99 = np.percentile(latencies * 1e3, [50, 99])
+    codes = ", ".join(f"{k}: {v}" for k, v in sorted(statuses.items()))
+    print(f"{label:<14} p50 {p50:>7.2f} ms   p99 {p99:>7.2f} ms   "
+          f"{len(latencies) / elapsed:>8.1f} req/s   ({codes})")
+
+
+async def main_async(args):
+    proc = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        proc = start_server(port)
+        url = f"http://127.0.0.1:{port}"
+    try:
+        connector = aiohttp.TCPConnector(limit=args.concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            info = await wait_ready(session, url)
+            paths = make_paths(info, args.requests, args.format)
+            print(f"{url}  {info['version']}  {args.requests} so‘rov, "
+                  f"{args.concurrency} parallel, format={args.format}")
+            lat, elapsed, statuses, tags = await run(session, url, paths, args.concurrency)
+            report("sovuq", lat, elapsed, statuses)
+            lat, elapsed, statuses, _ = await run(session, url, paths, args.concurrency)
+            report("keshdan", lat, elapsed, statuses)
+            lat, elapsed, statuses, _ = await run(session, url, paths, args.concurrency, tags)
+            report("If-None-Match", lat, elapsed, statuses)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--format", choices=["json", "arrow"], default="json")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
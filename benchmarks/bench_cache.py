@@ -0,0 +1,124 @@
+"""Umumiy kesh backendlari (cache.py): yozish/o‘qish vaqti, TTL va hajm chegarasi.
+
+Har bir backend uchun — ``DiskBackend`` (vaqtinchalik papka) va
+``RedisBackend(LocalRedis())``, ``--redis URL`` berilsa haqiqiy Redis ham:
+
+- tipik jadval (Top 10) va katta jadvalni yozish / o‘qish vaqti;
+- qisqa TTL: muddati o‘tgan yozuv o‘qilmaydi va ``prune()`` uni o‘chiradi;
+- kichik hajm chegarasi: eng uzoq ishlatilmagan yozuvlar o‘chiriladi,
+  yaqinda o‘qilgani va eng yangilari qoladi.
+
+    python benchmarks/bench_cache.py
+    python benchmarks/bench_cache.py --redis redis://localhost:6379/15
+"""
+import argparse
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import common  # noqa: F401  (loyiha ildizi sys.path ga)
+from cache import DiskBackend, LocalRedis, RedisBackend, key_digest, to_ipc
+
+TTL = 1.0
+
+
+def table(i, rows=10):
+    # Har biri boshqa mazmunli (DiskBackend bir xil mazmunni bitta faylda saqlaydi)
+    rng = np.random.default_rng(i)
+    return pd.DataFrame({"Directors": [f"d{i}-{j}" for j in range(rows)],
+                         "IMDb Rating": rng.random(rows).round(1) * 10})
+
+
+def timing(backend, rows, repeat=20):
+    df = table(0, rows)
+    start = time.perf_counter()
+    for i in range(repeat):
+        backend.put(key_digest(("bench", rows, i)), df)
+    put = (time.perf_counter() - start) / repeat
+    start = time.perf_counter()
+    for i in range(repeat):
+        assert backend.get(key_digest(("bench", rows, i))) is not None
+    get = (time.perf_counter() - start) / repeat
+    return put, get
+
+
+def entries(backend):
+    # Saqlangan kalitlar soni (muddati o‘tganlari ham) — prune() ni tekshirish uchun
+    if isinstance(backend, DiskBackend):
+        return len(list((backend.root / "keys").glob("*.json")))
+    return len(backend.client.zrange(f"{backend.prefix}:lru", 0, -1))
+
+
+def check_ttl(make):
+    backend = make(max_bytes=1 << 30, ttl=TTL)
+    key = key_digest(("ttl",))
+    backend.put(key, table(1))
+    assert backend.get(key) is not None, "yangi yozuv o‘qilmadi"
+    time.sleep(TTL + 0.2)
+    assert backend.get(key) is None, "TTL o‘tgan yozuv hali o‘qilmoqda"
+    backend.prune()
+    assert entries(backend) == 0, "prune() muddati o‘tgan kalitni o‘chirmadi"
+
+
+def check_eviction(make, n=6, keep=3):
+    # Chegara — taxminan ``keep`` ta yozuv; 0-yozuv har yozuvdan keyin o‘qiladi, shuning uchun qoladi
+    size = to_ipc(table(0)).size
+    backend = make(max_bytes=int(size * (keep + 0.5)), ttl=3600)
+    keys = [key_digest(("lru", i)) for i in range(n)]
+    for i, key in enumerate(keys):
+        backend.put(key, table(i))
+        time.sleep(0.02)
+        assert backend.get(keys[0]) is not None, f"{i}-yozuvdan keyin 0-yozuv o‘chgan"
+        time.sleep(0.02)
+    backend.prune()
+    alive = [i for i, key in enumerate(keys) if backend.get(key) is not None]
+    assert len(alive) <= keep, f"chegara oshdi: {alive}"
+    assert alive == [0, *range(n - keep + 1, n)], f"kutilmagan yozuvlar qoldi: {alive}"
+    return alive
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis", help="haqiqiy Redis (bo‘sh baza, tekshiruvdan keyin tozalanadi)")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="imdb-cache-")
+    runs = [0]
+
+    def disk(max_bytes, ttl):
+        runs[0] += 1
+        return DiskBackend(f"{root}/{runs[0]}", max_bytes, ttl)
+
+    backends = [("disk", disk),
+                ("redis (LocalRedis)", lambda max_bytes, ttl: RedisBackend(LocalRedis(), max_bytes, ttl))]
+    if args.redis:
+        import redis
+
+        client = redis.Redis.from_url(args.redis)
+
+        def real(max_bytes, ttl):
+            client.flushdb()
+            return RedisBackend(client, max_bytes, ttl)
+
+        backends.append(("redis", real))
+    try:
+        print(f"{'backend':<20} {'put 10 ms':>10} {'get 10 ms':>10} {'put 100k ms':>12} "
+              f"{'get 100k ms':>12}  TTL  LRU (qolganlar)")
+        for name, make in backends:
+            backend = make(max_bytes=1 << 30, ttl=3600)
+            small, large = timing(backend, 10), timing(backend, 100_000, repeat=3)
+            check_ttl(make)
+            alive = check_eviction(make)
+            print(f"{name:<20} {small[0] * 1e3:>10.2f} {small[1] * 1e3:>10.2f} "
+                  f"{large[0] * 1e3:>12.1f} {large[1] * 1e3:>12.1f}  ok   ok {alive}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+        if args.redis:
+            client.flushdb()
+
+
+if __name__ == "__main__":
+    main()
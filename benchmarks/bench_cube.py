@@ -0,0 +1,70 @@
+"""Agregatlar kubi va bo‘limlardagi eski groupby/explode hisoblari.
+
+Yuklash, indeks + kub qurish va har bir bo‘lim so‘rovining vaqti o‘lchanadi.
+
+    python benchmarks/bench_cube.py            # 1k, 100k, 1M qator
+"""
+import sys
+
+from common import make_catalog, parse_sizes, timed
+from cube import Cube
+from loader import load_movies
+from relations import MovieIndex
+
+YEARS, RATINGS = (1990, 2010), (8.0, 9.0)
+
+
+def exploded(df, column):
+    out = df.copy()
+    out[column] = out[column].str.split(", ")
+    return out.explode(column)
+
+
+def old_sections(df):
+    # app.py dagi avvalgi bo‘limlar, o‘zgarishsiz
+    directors_df = exploded(df, "Directors")
+    directors_df.groupby("Directors")["Num Votes"].sum().sort_values(ascending=False).head(10)
+    directors_df.groupby("Directors")["IMDb Rating"].mean().sort_values(ascending=False).head(10)
+    genre_year = exploded(df, "Genres").groupby(["Year", "Genres"]).size()
+    genre_year.groupby("Genres").sum().sort_values(ascending=False).head(5)
+    exploded(df, "Genres").groupby(["Genres", "Year"]).size()
+    df.groupby("Year").size().sort_values(ascending=False).head(10)
+    filtered = df[df["Year"].between(*YEARS) & df["IMDb Rating"].between(*RATINGS)].copy()
+    (exploded(filtered, "Directors").groupby("Directors")
+     .agg(avg_rating=("IMDb Rating", "mean"), movie_count=("Title", "count"))
+     .query("movie_count >= 2").sort_values("avg_rating", ascending=False).head(10))
+    filtered["Decade"] = (filtered["Year"] // 10) * 10
+    filtered.groupby("Decade").agg(avg_rating=("IMDb Rating", "mean"),
+                                   movie_count=("Title", "count"))
+
+
+def cube_sections(cube):
+    cube.top_directors_by_votes()
+    cube.top_directors_by_rating()
+    cube.genre_year_counts()
+    cube.top_genres()
+    cube.movies_per_year()
+    cube.director_rating_table(YEARS, RATINGS)
+    cube.decade_stats(YEARS, RATINGS)
+
+
+def build(df):
+    return Cube.build(df, MovieIndex.build(df))
+
+
+def main():
+    sizes = parse_sizes(sys.argv, [1_000, 100_000, 1_000_000])
+    print(f"{'rows':>10} {'load s':>8} {'build s':>8} {'cells':>9} "
+          f"{'old sections s':>15} {'cube sections s':>16}")
+    for n in sizes:
+        csv = make_catalog(n)
+        load, (df, _) = timed(load_movies, csv, cache_dir=csv.parent / f"loader_cache_{n}")
+        build_s, cube = timed(build, df)
+        cells = len(cube.movies) + len(cube.genres) + len(cube.directors)
+        old, _ = timed(old_sections, df)
+        new, _ = timed(cube_sections, cube, repeat=3)
+        print(f"{n:>10,} {load:>8.3f} {build_s:>8.3f} {cells:>9,} {old:>15.3f} {new:>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Slayder so‘rovi: ikki ``between`` niqobi va FilterEngine (searchsorted + prefix sum).
+
+    python benchmarks/bench_filters.py            # 1k, 100k, 1M qator
+"""
+import sys
+
+import numpy as np
+
+from common import make_catalog, parse_sizes, timed
+from filters import FilterEngine
+from loader import load_movies
+
+QUERIES = [((1990, 2010), (8.0, 9.0)), ((1920, 1960), (7.5, 8.5)), ((1900, 2030), (0, 10))]
+
+
+def masks(df, year_range, rating_range):
+    f = df[df["Year"].between(*year_range) & df["IMDb Rating"].between(*rating_range)]
+    return len(f), f["IMDb Rating"].mean(), f["Num Votes"].sum()
+
+
+def main():
+    sizes = parse_sizes(sys.argv, [1_000, 100_000, 1_000_000])
+    print(f"{'rows':>10} {'build s':>9} {'between ms':>11} {'engine ms':>10} {'summary ms':>11}")
+    for n in sizes:
+        df, _ = load_movies(make_catalog(n), cache_dir=make_catalog(n).parent / f"loader_cache_{n}")
+        build, engine = timed(FilterEngine.build, df)
+        old = np.mean([timed(masks, df, *q, repeat=3)[0] for q in QUERIES])
+        new = np.mean([timed(engine.query, *q, repeat=3)[0] for q in QUERIES])
+        stats = np.mean([timed(engine.summary, *q, repeat=3)[0] for q in QUERIES])
+        print(f"{n:>10,} {build:>9.3f} {old * 1e3:>11.2f} {new * 1e3:>10.2f} {stats * 1e3:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
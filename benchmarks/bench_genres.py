@@ -0,0 +1,45 @@
+"""Janr filtri va janr × yil sonlari: satrlar (str.contains / explode) va bitmask.
+
+    python benchmarks/bench_genres.py            # 1k, 100k, 1M qator
+"""
+import sys
+
+from common import make_catalog, parse_sizes, timed
+from genres import GenreSet
+from loader import load_movies
+
+GENRES = ["Drama", "War"]
+
+
+def contains(df, mode):
+    genres = df["Genres"].astype(str)
+    hits = [genres.str.contains(g, regex=False) for g in GENRES]
+    keep = hits[0]
+    for hit in hits[1:]:
+        keep = keep & hit if mode == "all" else keep | hit
+    return keep.to_numpy().nonzero()[0]
+
+
+def exploded_year_counts(df):
+    out = df[["Year", "Genres"]].astype({"Genres": str})
+    out["Genres"] = out["Genres"].str.split(", ")
+    return out.explode("Genres").groupby(["Year", "Genres"]).size()
+
+
+def main():
+    sizes = parse_sizes(sys.argv, [1_000, 100_000, 1_000_000])
+    print(f"{'rows':>10} {'contains ms':>12} {'bits ms':>9} {'explode ms':>11} {'bit counts ms':>14}")
+    for n in sizes:
+        csv = make_catalog(n)
+        df, _ = load_movies(csv, cache_dir=csv.parent / f"loader_cache_{n}")
+        genre_set = GenreSet.build(df)
+        old, _ = timed(contains, df, "all", repeat=3)
+        new, _ = timed(genre_set.match, GENRES, "all", repeat=3)
+        old_counts, _ = timed(exploded_year_counts, df)
+        new_counts, _ = timed(genre_set.year_counts, df["Year"], repeat=3)
+        print(f"{n:>10,} {old * 1e3:>12.1f} {new * 1e3:>9.2f} "
+              f"{old_counts * 1e3:>11.1f} {new_counts * 1e3:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
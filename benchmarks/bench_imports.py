@@ -0,0 +1,92 @@
+"""Yangi replikaning sovuq starti: ``python -X importtime`` bo‘yicha importlar va birinchi chizish.
+
+``app.py`` Streamlit siz ("bare" rejim) alohida jarayonda oxirigacha bajariladi —
+bu birinchi sahifa chizilishigacha ketadigan vaqtga yaqin. Har bir holat uchun:
+importlarning umumiy vaqti, skriptning to‘liq vaqti, og‘ir grafik kutubxonalari
+(matplotlib / seaborn / plotly) yuklandimi va eng qimmat top-level importlar.
+
+Holatlar: matplotlib va plotly backendlari keshsiz (``IMDB_CACHE=off``) va
+matplotlib — umumiy diskdagi keshda oldindan hisoblangan (precompute.py) PNG lar bilan.
+
+    python benchmarks/bench_imports.py
+    python benchmarks/bench_imports.py --top 15
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import ROOT
+
+HEAVY = ("matplotlib", "seaborn", "plotly.graph_objects", "plotly.express")
+
+
+def parse_importtime(stderr):
+    # "import time: self [us] | cumulative | imported package" — chuqurlik bo‘shliqlar bilan
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), int(cumulative) / 1e3, depth))
+    return modules
+
+
+def measure(env):
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "app.py"], cwd=ROOT,
+                          env={**os.environ, **env}, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode:
+        raise RuntimeError(proc.stderr[-2000:])
+    modules = parse_importtime(proc.stderr)
+    top = [(name, ms) for name, ms, depth in modules if depth == 0]
+    loaded = {name for name, _, _ in modules}
+    return {
+        "imports_ms": sum(ms for _, ms in top),
+        "wall_ms": wall * 1e3,
+        "heavy": [h for h in HEAVY if h in loaded],
+        "top": sorted(top, key=lambda item: -item[1]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    status = Path(tempfile.mkdtemp(prefix="imdb-imports-")) / "precompute.json"
+    base = {"IMDB_PRECOMPUTE": "0", "IMDB_CACHE": "off", "IMDB_PROFILE": "0"}
+    cases = [
+        ("matplotlib, keshsiz", {**base, "IMDB_CHART_BACKEND": "matplotlib"}),
+        ("plotly, keshsiz", {**base, "IMDB_CHART_BACKEND": "plotly"}),
+    ]
+    try:
+        # Oldindan hisoblangan PNG lar: avval precompute, keyin yangi "replika"
+        env = {**base, "IMDB_CHART_BACKEND": "matplotlib", "IMDB_CACHE": "disk"}
+        cases.append(("matplotlib, precompute", env))
+        subprocess.run([sys.executable, "precompute.py", "--status", str(status)],
+                       cwd=ROOT, env={**os.environ, **env}, check=True, capture_output=True)
+
+        print(f"{'holat':<24} {'importlar ms':>13} {'skript ms':>10}  og‘ir kutubxonalar")
+        results = []
+        for label, env in cases:
+            r = measure(env)
+            results.append((label, r))
+            print(f"{label:<24} {r['imports_ms']:>13.0f} {r['wall_ms']:>10.0f}  "
+                  f"{', '.join(r['heavy']) or '—'}")
+        for label, r in results:
+            print(f"\n{label} — eng qimmat top-level importlar:")
+            for name, ms in r["top"][:args.top]:
+                print(f"  {ms:>8.1f} ms  {name}")
+    finally:
+        shutil.rmtree(status.parent, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""malumotlar() yuklash yo‘llarini solishtirish: eski read_csv + drop va Arrow kesh.
+
+Har bir o‘lchov alohida jarayonda bajariladi, shunda peak RSS toza o‘lchanadi.
+
+    python benchmarks/bench_loader.py            # 1k, 100k, 1M qator
+    python benchmarks/bench_loader.py 1e3 1e5
+"""
+import json
+import shutil
+import subprocess
+import sys
+
+from common import DATA_DIR, ROOT, make_catalog, parse_sizes
+
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {bench_dir!r})
+from common import peak_rss_mb
+import pandas as pd
+from loader import load_movies
+
+start = time.perf_counter()
+if {mode!r} == "read_csv+drop":
+    df = pd.read_csv({csv!r})
+    df = df.drop(columns=["Position", "Const", "Modified", "Created", "Description",
+                          "Original Title", "URL", "Title Type", "Release Date"])
+else:
+    df, _ = load_movies({csv!r}, cache_dir={cache!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "peak_rss_mb": peak_rss_mb(), "rows": len(df)}}))
+"""
+
+
+def run(mode, csv, cache):
+    code = CHILD.format(bench_dir=str(ROOT / "benchmarks"),
+                        mode=mode, csv=str(csv), cache=str(cache))
+    out = subprocess.run([sys.executable, "-c", code], check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main():
+    sizes = parse_sizes(sys.argv, [1_000, 100_000, 1_000_000])
+    print(f"{'rows':>10} {'mode':<16} {'seconds':>9} {'peak RSS MB':>12}")
+    for n in sizes:
+        csv = make_catalog(n)
+        cache = DATA_DIR / f"loader_cache_{n}"
+        shutil.rmtree(cache, ignore_errors=True)
+        # cold — kesh yo‘q (CSV o‘qiladi va kesh yoziladi), warm — keshdan
+        for mode in ("read_csv+drop", "cache cold", "cache warm"):
+            r = run(mode, csv, cache)
+            print(f"{n:>10,} {mode:<16} {r['seconds']:>9.3f} {r['peak_rss_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Ustunlar bo‘yicha xotira: read_csv dagi turlar va ixcham turlar (loader.compact).
+
+    python benchmarks/bench_memory.py            # 1k, 100k, 1M qator
+"""
+import sys
+
+from common import make_catalog, parse_sizes, timed
+from loader import compact, memory_report, read_csv
+
+
+def main():
+    sizes = parse_sizes(sys.argv, [1_000, 100_000, 1_000_000])
+    for n in sizes:
+        df = read_csv(make_catalog(n))
+        seconds, small = timed(compact, df)
+        print(f"\n{n:,} qator — compact() {seconds:.3f} s")
+        print(memory_report(df, small).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Ro‘yxat sahifalarini tahlil qilish: BeautifulSoup (notebook usuli) va page_parser.
+
+Korpus — ``fixtures/`` dagi saqlangan sahifalar (yoki ``--corpus DIR``); har bir
+sahifadagi filmlar 250 tagacha ko‘paytiriladi, shunda sahifa haqiqiy hajmga yaqin bo‘ladi.
+
+    python benchmarks/bench_parser.py --pages 40
+"""
+import argparse
+import os
+import re
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from common import ROOT
+from page_parser import parse_page, parse_pages, runtime_minutes, vote_count
+
+
+def parse_page_bs4(html):
+    # kino_scrapping.ipynb dagi yondashuv: har bir maydon uchun alohida .find(...)
+    soup = BeautifulSoup(html, "lxml")
+    movies = []
+    for item in soup.find_all("li", class_="ipc-metadata-list-summary-item"):
+        heading = item.find("h3", class_="ipc-title__text").text
+        position, _, title = heading.partition(". ")
+        const = re.search(r"tt\d+", item.find("a", class_="ipc-title-link-wrapper")["href"]).group(0)
+        metadata = [s.text for s in item.find_all("span", class_="dli-title-metadata-item")]
+        rating = item.find("span", class_="ipc-rating-star--rating")
+        votes = item.find("span", class_="ipc-rating-star--voteCount")
+        plot = item.find("div", class_="ipc-html-content-inner-div")
+        genres = [s.text.strip() for s in item.find_all("span", class_="ipc-chip__text")]
+        directors = []
+        for label in item.find_all("span", string=re.compile(r"^Directors?$")):
+            directors += [a.text for a in label.parent.find_all("a")]
+        movies.append({
+            "Position": int(position),
+            "Const": const,
+            "Title": title.strip(),
+            "URL": f"https://www.imdb.com/title/{const}/",
+            "Year": int(metadata[0]) if metadata and metadata[0].isdigit() else None,
+            "Runtime (mins)": runtime_minutes(metadata[1]) if len(metadata) > 1 else None,
+            "IMDb Rating": float(rating.text) if rating else None,
+            "Num Votes": vote_count(votes.text) if votes else None,
+            "Genres": ", ".join(dict.fromkeys(genres)) or None,
+            "Description": plot.text if plot else None,
+            "Directors": ", ".join(directors) or None,
+        })
+    return movies
+
+
+def load_corpus(directory, n_pages, per_page=250):
+    pages = []
+    for path in sorted(Path(directory).glob("*.html")):
+        page = path.read_text(encoding="utf-8")
+        items = re.findall(r'<li class="ipc-metadata-list-summary-item">.*?</li>', page, re.S)
+        body = "".join(
+            items[i % len(items)].replace(">1. ", f">{i + 1}. ", 1) for i in range(per_page)
+        )
+        pages.append(f"<html><body><ul>{body}</ul></body></html>")
+    return [pages[i % len(pages)] for i in range(n_pages)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", default=ROOT / "fixtures")
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus, args.pages)
+    assert parse_page_bs4(pages[0]) == parse_page(pages[0])
+
+    print(f"{len(pages)} sahifa, {sum(map(len, pages)) / 1e6:.1f} MB HTML")
+    for name, run in [
+        ("BeautifulSoup", lambda: [parse_page_bs4(p) for p in pages]),
+        ("lxml XPath", lambda: [parse_page(p) for p in pages]),
+        (f"lxml XPath, {args.workers} jarayon", lambda: parse_pages(pages, args.workers)),
+    ]:
+        start = time.perf_counter()
+        movies = sum(map(len, run()))
+        elapsed = time.perf_counter() - start
+        print(f"{name:<28} {elapsed:>8.3f} s  {movies / elapsed:>10,.0f} film/s")
+
+
+if __name__ == "__main__":
+    main()
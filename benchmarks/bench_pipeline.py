@@ -0,0 +1,94 @@
+"""app.py ning ma'lumotlar yo‘li — Streamlit siz, sintetik kataloglarda.
+
+Har bir hajm alohida jarayonda o‘lchanadi (peak RSS toza bo‘lishi uchun):
+yuklash (sovuq — CSV dan, iliq — Arrow keshdan), indeks (explode o‘rnini
+bosuvchi), filtr/kub/saralash/Top 10 tuzilmalari va bitta slayder harakati —
+filtr, jadval sahifasi, filtrlangan Top 10 lar va kub bo‘limlari.
+
+    python benchmarks/bench_pipeline.py            # 1k, 100k, 1M, 10M qator
+    python benchmarks/bench_pipeline.py 1e3 1e5 --json
+"""
+import json
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+
+from common import DATA_DIR, make_catalog, parse_sizes, peak_rss_mb, timed
+from cube import Cube
+from filters import FilterEngine
+from loader import load_movies
+from relations import MovieIndex
+from table import SortedViews, page_rows
+from topk import TopK, top_k_positions
+
+QUERIES = [((1990, 2010), (8.0, 9.0)), ((1920, 1960), (7.5, 8.5)), ((1900, 2030), (0, 10))]
+STAGES = ["load cold", "load warm", "index", "filter", "cube", "sort", "top lists",
+          "interaction"]
+
+
+def interaction(df, engine, views, cube, year_range, rating_range):
+    # Bitta slayder harakatida app.py bajaradigan hisoblar
+    selection = engine.query(year_range, rating_range)
+    mask = selection.mask(len(df))
+    page_rows(views, selection.rows, mask, "IMDb Rating", False, 0, 50)
+    for column in ("IMDb Rating", "Num Votes"):
+        values = df[column].to_numpy()[selection.rows]
+        selection.rows[top_k_positions(values, 10)]
+    cube.director_rating_table(year_range, rating_range)
+    cube.decade_stats(year_range, rating_range)
+
+
+def child(n):
+    csv = make_catalog(n)
+    cache = DATA_DIR / f"pipeline_cache_{n}"
+    shutil.rmtree(cache, ignore_errors=True)
+    seconds = {}
+    seconds["load cold"], _ = timed(load_movies, csv, cache_dir=cache)
+    seconds["load warm"], (df, _) = timed(load_movies, csv, cache_dir=cache)
+    seconds["index"], index = timed(MovieIndex.build, df)
+    seconds["filter"], engine = timed(FilterEngine.build, df)
+    seconds["cube"], cube = timed(Cube.build, df, index)
+    views = SortedViews(df)
+    seconds["sort"], _ = timed(views.order, "IMDb Rating", False)
+
+    def top_lists():
+        rated = df["IMDb Rating"].notna().to_numpy()
+        rows = np.flatnonzero(rated)
+        return [TopK(10).add(df[c].to_numpy()[rated], rows) for c in ("IMDb Rating", "Num Votes")]
+
+    seconds["top lists"], _ = timed(top_lists)
+    seconds["interaction"] = np.mean([
+        timed(interaction, df, engine, views, cube, *q, repeat=3)[0] for q in QUERIES
+    ])
+    return {"rows": n, "seconds": seconds, "peak_rss_mb": peak_rss_mb()}
+
+
+def run(n):
+    out = subprocess.run([sys.executable, __file__, "--child", str(n)], check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main():
+    if sys.argv[1:2] == ["--child"]:
+        print(json.dumps(child(int(sys.argv[2]))))
+        return
+    as_json = "--json" in sys.argv
+    argv = [a for a in sys.argv if a != "--json"]
+    sizes = parse_sizes(argv, [1_000, 100_000, 1_000_000, 10_000_000])
+    if not as_json:
+        print(f"{'rows':>11} " + " ".join(f"{s:>11}" for s in STAGES) + f" {'peak RSS MB':>12}")
+    for n in sizes:
+        make_catalog(n)  # ma'lumot yaratish o‘lchovga kirmaydi
+        r = run(n)
+        if as_json:
+            print(json.dumps(r))
+            continue
+        cells = " ".join(f"{r['seconds'][s] * 1e3:>9.1f}ms" for s in STAGES)
+        print(f"{n:>11,} {cells} {r['peak_rss_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Rejissyorlar va janrlar WR + bootstrap oraliqlari: har bir guruh uchun sikl va vektorlangan (ranking.py).
+
+Sikl — har bir guruh filmlaridan ``BOOTSTRAP_REPS`` ta qayta tanlov (NumPy,
+lekin guruhlar bo‘yicha Python sikli). Vektorlangan — hamma guruhlar bir
+vaqtda, kub gistogrammasidan (``Cube.group_ratings``).
+
+    python benchmarks/bench_ranking.py            # 1k, 100k, 1M qator
+"""
+import sys
+
+import numpy as np
+
+from common import make_catalog, parse_sizes, timed
+from cube import Cube
+from loader import load_movies
+from ranking import BOOTSTRAP_REPS, group_ratings
+from relations import MovieIndex
+
+# Sikl shundan katta kataloglarda o‘lchanmaydi (daqiqalab ishlaydi)
+LOOP_MAX = 100_000
+
+
+def per_group(codes, buckets, counts, reps=BOOTSTRAP_REPS, seed=0):
+    rng = np.random.default_rng(seed)
+    values = np.repeat(buckets, counts)
+    ends = np.cumsum(np.bincount(np.repeat(codes, counts)))
+    out = []
+    for start, end in zip(np.r_[0, ends[:-1]], ends):
+        group = values[start:end]
+        if not len(group):
+            continue
+        means = rng.choice(group, (reps, len(group))).mean(axis=1)
+        out.append((group.mean(), *np.quantile(means, [0.025, 0.975])))
+    return out
+
+
+def histogram(cells):
+    cells = cells[cells["bucket"] >= 0]
+    hist = cells.groupby(["label", "bucket"], sort=True)["rated"].sum().reset_index()
+    return (hist["label"].to_numpy(), hist["bucket"].to_numpy(), hist["rated"].to_numpy())
+
+
+def main():
+    sizes = parse_sizes(sys.argv, [1_000, 100_000, 1_000_000])
+    print(f"{'rows':>10} {'table':<10} {'groups':>8} {'links':>9} {'loop ms':>9} {'vector ms':>10}")
+    for n in sizes:
+        csv = make_catalog(n)
+        df, _ = load_movies(csv, cache_dir=csv.parent / f"loader_cache_{n}")
+        cube = Cube.build(df, MovieIndex.build(df))
+        for table in ("directors", "genres"):
+            codes, buckets, counts = histogram(getattr(cube, table))
+            vector, stats = timed(group_ratings, codes, buckets, counts)
+            loop = timed(per_group, codes, buckets, counts)[0] if n <= LOOP_MAX else float("nan")
+            print(f"{n:>10,} {table:<10} {len(stats):>8,} {counts.sum():>9,} "
+                  f"{loop * 1e3:>9.0f} {vector * 1e3:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Ovozlar × reyting grafigi: har bir film nuqta (seaborn) va serverda binlash (density.py).
+
+Binlash vaqti, chizish vaqti va brauzerga ketadigan hajm (PNG / Plotly JSON);
+"oyna" — toraytirilgan ko‘rinish (level of detail), faqat undagi filmlar binlanadi.
+
+    python benchmarks/bench_scatter.py            # 10k ... 1M qator
+    python benchmarks/bench_scatter.py 5e6
+"""
+import sys
+
+import numpy as np
+
+from common import parse_sizes, timed
+from charts import votes_scatter_png, votes_scatter_spec
+from density import bin_votes
+
+WINDOW = ((10_000, 1_000_000), (7.0, 9.0))
+
+
+def main():
+    sizes = parse_sizes(sys.argv, [10_000, 100_000, 1_000_000])
+    rng = np.random.default_rng(0)
+    # matplotlib/seaborn importi birinchi qatorga qo‘shilmasin
+    votes_scatter_png(bin_votes([10, 100], [7.0, 8.0]))
+    print(f"{'qator':>11} {'ko‘rinish':<10} {'binlash ms':>11} {'PNG ms':>9} {'PNG KB':>8} "
+          f"{'Plotly ms':>10} {'JSON KB':>8}")
+    for n in sizes:
+        votes = rng.lognormal(8, 2.5, n).clip(5).astype(np.int64)
+        rating = np.round(rng.normal(6.5, 1.1, n).clip(1, 10), 1)
+        cases = [("xom", None, n), ("binlangan", None, 0), ("oyna", WINDOW, 0)]
+        for name, window, raw_max in cases:
+            if name == "xom" and n > 100_000:
+                # seaborn millionlab nuqtada daqiqalab chizadi
+                continue
+            binning, density = timed(bin_votes, votes, rating, window, raw_max=raw_max, repeat=3)
+            png_time, (_, png_bytes) = timed(votes_scatter_png, density)
+            spec_time, (_, spec_bytes) = timed(votes_scatter_spec, density)
+            print(f"{n:>11,} {name:<10} {binning * 1e3:>11.1f} {png_time * 1e3:>9.0f} "
+                  f"{png_bytes / 1024:>8.0f} {spec_time * 1e3:>10.0f} {spec_bytes / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Scraper oflayn: ``fixtures/`` ni mahalliy HTTP serverdan yuklash vaqti (parallellik bo‘yicha).
+
+Server alohida oqimda (``ThreadingHTTPServer``) ishlaydi; ``{page}`` — so‘rov
+parametri, shuning uchun har bir sahifa raqami saqlangan sahifalardan biriga
+tushadi. Natija, 503 dan keyin qayta urinish va davom ettirish
+``tests/test_scraper.py`` da tekshiriladi.
+
+    python benchmarks/bench_scraper.py --pages 20
+"""
+import argparse
+import asyncio
+import shutil
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from common import ROOT
+from scraper import scrape
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    # /list.html?page=N → N-sahifa (saqlangan sahifalar aylana bo‘yicha)
+    pages = []
+
+    def do_GET(self):
+        page = int(parse_qs(urlsplit(self.path).query)["page"][0])
+        body = self.pages[(page - 1) % len(self.pages)].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", default=ROOT / "fixtures")
+    parser.add_argument("--pages", type=int, default=20)
+    args = parser.parse_args()
+
+    FixtureHandler.pages = [p.read_text(encoding="utf-8")
+                            for p in sorted(Path(args.corpus).glob("*.html"))]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/list.html?page={{page}}"
+    state_dir = Path(tempfile.mkdtemp(prefix="imdb-scrape-"))
+    try:
+        print(f"{'concurrency':>11} {'pages':>6} {'movies':>7} {'s':>6} {'pages/s':>8}")
+        for concurrency in (1, 4, 8):
+            start = time.perf_counter()
+            df = asyncio.run(scrape(range(1, args.pages + 1), url, state_dir / "state.jsonl",
+                                    concurrency=concurrency, rate=1000.0))
+            elapsed = time.perf_counter() - start
+            print(f"{concurrency:>11} {args.pages:>6} {len(df):>7} {elapsed:>6.2f} "
+                  f"{args.pages / elapsed:>8.1f}")
+    finally:
+        server.shutdown()
+        shutil.rmtree(state_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Nom/rejissyor qidiruvi: har so‘rovda str.contains va oldindan qurilgan indeks.
+
+    python benchmarks/bench_search.py            # 1k, 100k, 1M qator
+"""
+import sys
+
+import numpy as np
+
+from common import make_catalog, parse_sizes, timed
+from loader import load_movies, read_keys
+from relations import MovieIndex
+from search import SearchIndex
+
+QUERIES = ["Yasujirô Ozu", "kurosawa", "silent river", "golden empir", "kubrik"]
+
+
+def contains(df, keys, query):
+    # Har so‘rovda butun ustunlar bo‘ylab (diakritikalarsiz solishtirish ham yo‘q)
+    hit = np.zeros(len(df), dtype=bool)
+    for column in (df["Title"], keys["Original Title"], df["Directors"].astype(str)):
+        hit |= column.str.contains(query, case=False, regex=False).to_numpy()
+    return np.flatnonzero(hit)
+
+
+def main():
+    sizes = parse_sizes(sys.argv, [1_000, 100_000, 1_000_000])
+    print(f"{'rows':>10} {'build ms':>9} {'contains ms':>12} {'index ms':>9} {'hits':>8}")
+    for n in sizes:
+        csv = make_catalog(n)
+        df, _ = load_movies(csv, cache_dir=csv.parent / f"loader_cache_{n}")
+        keys = read_keys(csv)
+        directors = MovieIndex.build(df).directors
+        build, index = timed(SearchIndex.build, df["Title"], keys["Original Title"],
+                             directors, df["Num Votes"])
+        old = np.mean([timed(contains, df, keys, q)[0] for q in QUERIES])
+        new = np.mean([timed(index.search, q, repeat=3)[0] for q in QUERIES])
+        hits = sum(len(index.search(q, k=len(df))) for q in QUERIES)
+        print(f"{n:>10,} {build * 1e3:>9.1f} {old * 1e3:>12.1f} {new * 1e3:>9.2f} {hits:>8,}")
+
+
+if __name__ == "__main__":
+    main()
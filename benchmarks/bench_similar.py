@@ -0,0 +1,52 @@
+"""O‘xshash filmlar: butun matritsa × vektor va teskari indeks (similar.py).
+
+Butun matritsa — CSR ning barcha nolmas elementlari bo‘ylab skalyar ko‘paytma
+(har so‘rovda n × ~6 amal). Teskari indeks — faqat filmning xususiyatlari
+postinglari.
+
+    python benchmarks/bench_similar.py            # 1k, 100k, 1M qator
+"""
+import sys
+import time
+
+import numpy as np
+
+from common import make_catalog, parse_sizes, timed
+from loader import load_movies
+from relations import MovieIndex
+from similar import SimilarIndex
+
+QUERIES = 200
+
+
+def full_product(index, rows, row):
+    query = np.zeros(len(index.feature_offsets) - 1, dtype=np.float32)
+    start, end = index.offsets[row], index.offsets[row + 1]
+    query[index.features[start:end]] = index.values[start:end]
+    return np.bincount(rows, weights=index.values * query[index.features], minlength=len(index))
+
+
+def main():
+    sizes = parse_sizes(sys.argv, [1_000, 100_000, 1_000_000])
+    print(f"{'rows':>10} {'build ms':>9} {'MB':>7} {'full ms':>8} "
+          f"{'p50 ms':>7} {'p99 ms':>7} {'max ms':>7}")
+    for n in sizes:
+        csv = make_catalog(n)
+        df, _ = load_movies(csv, cache_dir=csv.parent / f"loader_cache_{n}")
+        build, index = timed(SimilarIndex.build, df, MovieIndex.build(df))
+        size = sum(value.nbytes for value in vars(index).values()) / 2**20
+        rows = np.random.default_rng(0).integers(0, n, QUERIES)
+        times = []
+        for row in rows:
+            start = time.perf_counter()
+            index.similar(int(row))
+            times.append(time.perf_counter() - start)
+        links = np.repeat(np.arange(n), np.diff(index.offsets))
+        full = np.mean([timed(full_product, index, links, int(r))[0] for r in rows[:20]])
+        print(f"{n:>10,} {build * 1e3:>9.0f} {size:>7.1f} {full * 1e3:>8.1f} "
+              f"{np.median(times) * 1e3:>7.2f} {np.percentile(times, 99) * 1e3:>7.2f} "
+              f"{max(times) * 1e3:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
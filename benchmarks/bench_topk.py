@@ -0,0 +1,51 @@
+"""Top 10 tanlash: to‘liq sort_values().head(), nlargest, argpartition va TopK.
+
+Ustunlar reyting (0.1 qadamli, ko‘p teng qiymatlar) va ovozlar soniga o‘xshash.
+
+    python benchmarks/bench_topk.py            # 1k ... 10M qator
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from common import parse_sizes, timed
+from topk import TopK, top_k_positions
+
+K = 10
+
+
+def incremental(values, batch):
+    # Katalog bo‘laklab keladi; har bir yangi bo‘lakda faqat u tekshiriladi
+    top = TopK(K)
+    for start in range(0, len(values), batch):
+        chunk = values[start:start + batch]
+        top.add(chunk, np.arange(start, start + len(chunk)))
+    return top
+
+
+def main():
+    sizes = parse_sizes(sys.argv, [1_000, 10_000, 100_000, 1_000_000, 10_000_000])
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>11} {'column':<8} {'sort+head ms':>13} {'nlargest ms':>12} "
+          f"{'argpartition ms':>16} {'TopK add ms':>12}")
+    for n in sizes:
+        columns = {
+            "rating": np.round(rng.normal(7.9, 0.3, n).clip(1, 10), 1),
+            "votes": rng.lognormal(10, 2, n).astype(np.int64).astype(np.float64),
+        }
+        for name, values in columns.items():
+            series = pd.Series(values)
+            sort, _ = timed(lambda: series.sort_values(ascending=False).head(K), repeat=3)
+            nlargest, _ = timed(series.nlargest, K, repeat=3)
+            part, _ = timed(top_k_positions, values, K, repeat=3)
+            # Filtrlanmagan ko‘rinish: 1% yangi qatorlar qo‘shilganda yangilash narxi
+            top = incremental(values, max(n // 10, 1))
+            new = values[: max(n // 100, 1)]
+            add, _ = timed(top.add, new, np.arange(n, n + len(new)), repeat=3)
+            print(f"{n:>11,} {name:<8} {sort * 1e3:>13.2f} {nlargest * 1e3:>12.2f} "
+                  f"{part * 1e3:>16.2f} {add * 1e3:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
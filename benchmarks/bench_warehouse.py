@@ -0,0 +1,105 @@
+"""Xotiradagi rejim (pandas) va out-of-core SQL rejimi (warehouse.py, DuckDB).
+
+Har bir rejim alohida jarayonda o‘lchanadi (cho‘qqi RSS aralashmasligi uchun):
+tayyorlash (CSV → Arrow kesh + tuzilmalar / CSV → Parquet ombor), keyin
+dashboardning bitta qayta chizishi — ko‘rsatkichlar, Top 10 lar, rejissyorlar
+va o‘n yilliklar jadvallari, gistogrammalar — bir nechta filtr holatida.
+
+    python benchmarks/bench_warehouse.py              # 100k, 1M qator
+    python benchmarks/bench_warehouse.py 5e6
+    IMDB_DUCKDB_MEMORY=512MB python benchmarks/bench_warehouse.py 1e7
+"""
+import shutil
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from common import DATA_DIR, ROOT, make_catalog, parse_sizes, peak_rss_mb
+
+FILTERS = [
+    ((1950, 2020), (1.0, 10.0)),
+    ((1990, 2010), (7.0, 9.0)),
+    ((2000, 2005), (8.0, 8.5)),
+]
+
+
+def rerun_pandas(snap, year_range, rating_range):
+    from aggregates import HISTOGRAMS, chart_data, top_table
+
+    selection = snap.engine.query(year_range, rating_range)
+    for name in ("top_rating", "top_votes"):
+        top_table(snap.df, name, selection)
+    snap.cube.director_rating_table(year_range, rating_range)
+    snap.cube.decade_stats(year_range, rating_range)
+    for chart_id in (*HISTOGRAMS, "votes_scatter"):
+        chart_data(snap, chart_id, year_range, rating_range)
+
+
+def rerun_duckdb(warehouse, year_range, rating_range):
+    from aggregates import HISTOGRAMS
+
+    warehouse.query(year_range, rating_range)
+    for name in ("top_rating", "top_votes"):
+        warehouse.top_table(name, year_range, rating_range)
+    warehouse.director_rating_table(year_range, rating_range)
+    warehouse.decade_stats(year_range, rating_range)
+    for column in HISTOGRAMS.values():
+        warehouse.value_counts(column, year_range, rating_range)
+    warehouse.votes_density(year_range, rating_range)
+
+
+def child(mode, csv_path, cache_dir):
+    start = time.perf_counter()
+    if mode == "pandas":
+        from aggregates import Snapshot
+        from loader import load_movies
+
+        df, version = load_movies(csv_path, cache_dir)
+        source, rerun = Snapshot.build(df, version), rerun_pandas
+    else:
+        from warehouse import Warehouse, build_from_csv
+
+        source, rerun = Warehouse(build_from_csv(csv_path, cache_dir)), rerun_duckdb
+    prepare = time.perf_counter() - start
+    times = []
+    for year_range, rating_range in FILTERS * 3:
+        start = time.perf_counter()
+        rerun(source, year_range, rating_range)
+        times.append(time.perf_counter() - start)
+    print(f"{prepare:.3f} {np.median(times) * 1e3:.1f} {max(times) * 1e3:.1f} {peak_rss_mb():.0f}")
+
+
+def measure(mode, csv_path, cache_dir):
+    # Birinchi marta — kesh/ombor quriladi, ikkinchisi — tayyoridan (qayta ishga tushish)
+    rows = []
+    for _ in range(2):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", mode, str(csv_path), str(cache_dir)],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        rows.append([float(x) for x in out])
+    return rows
+
+
+def main():
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:5])
+        return
+    sizes = parse_sizes(sys.argv, [100_000, 1_000_000])
+    print(f"{'qator':>11} {'rejim':<7} {'qurish s':>9} {'tayyor s':>9} "
+          f"{'rerun p50 ms':>13} {'max ms':>8} {'RSS MB':>8}")
+    for n in sizes:
+        csv_path = make_catalog(n)
+        for mode in ("pandas", "duckdb"):
+            cache_dir = DATA_DIR / f"cache_{mode}_{n}"
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            (cold, _, _, _), (warm, p50, worst, rss) = measure(mode, csv_path, cache_dir)
+            print(f"{n:>11,} {mode:<7} {cold:>9.2f} {warm:>9.2f} {p50:>13.1f} "
+                  f"{worst:>8.1f} {rss:>8.0f}")
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
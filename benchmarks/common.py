@@ -0,0 +1,50 @@
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from synthetic import write_csv  # noqa: E402
+
+DATA_DIR = Path(os.environ.get("IMDB_BENCH_DIR", ROOT / ".cache" / "bench"))
+
+
+def make_catalog(n_rows, seed=0):
+    # CSV sxemasidagi sintetik katalog (synthetic.py) — bir marta yaratilib, qayta ishlatiladi
+    path = DATA_DIR / f"synthetic_{n_rows}.csv"
+    if path.exists():
+        return path
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    return write_csv(path, n_rows, seed)
+
+
+def peak_rss_mb():
+    # Linux da VmHWM ishlatamiz: ru_maxrss exec dan keyin ham ota jarayonning
+    # cho‘qqisini saqlab qoladi va subprocess o‘lchovlarini buzadi
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss Linux da kilobaytlarda, macOS da baytlarda
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20) if sys.platform == "darwin" else rss / 1024
+
+
+def timed(fn, *args, repeat=1, **kwargs):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def parse_sizes(argv, default):
+    sizes = [int(float(a)) for a in argv[1:]]
+    return sizes or default
@@ -0,0 +1,349 @@
+"""Jarayonlar (replikalar) orasida umumiy kesh: ma'lumot jadvali va agregatlar.
+
+``st.cache_data`` / ``st.cache_resource`` har bir jarayonda alohida va qayta
+ishga tushganda yo‘qoladi. Bu qatlam ``DataFrame`` natijalarni Arrow IPC
+ko‘rinishida tashqi backendda saqlaydi (``bytes`` — masalan, PNG grafiklar —
+bitta ustunli jadvalga o‘raladi):
+
+- ``DiskBackend`` — bitta hostdagi jarayonlar uchun. Qiymatlar mazmun xeshi
+  bo‘yicha nomlanadi (``blobs/<sha256>.arrow``, bir xil natija bir marta
+  yoziladi), kalitlar esa ularga ishora qiladi (``keys/<xesh>.json``).
+  O‘qish memory-map orqali;
+- ``RedisBackend`` — bir nechta host uchun, Redis bilan mos istalgan klient
+  (``redis.Redis``). Redis serversiz — xotiradagi ``LocalRedis``: TTL va hajm
+  chegarasi ikkala backendda ``benchmarks/bench_cache.py`` bilan tekshiriladi.
+
+Ikkalasida ham TTL (``IMDB_CACHE_TTL``) va umumiy hajm chegarasi
+(``IMDB_CACHE_MAX_MB``): chegara oshsa, eng uzoq ishlatilmagan kalitlar o‘chiriladi.
+
+    IMDB_CACHE=disk                         # standart: .cache/shared
+    IMDB_CACHE=redis://localhost:6379/0
+    IMDB_CACHE=off
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from loader import CACHE_DIR
+from sections import payload_size
+
+
+CACHE_BACKEND = os.environ.get("IMDB_CACHE", "disk")
+CACHE_TTL = float(os.environ.get("IMDB_CACHE_TTL", 24 * 3600))
+CACHE_MAX_MB = float(os.environ.get("IMDB_CACHE_MAX_MB", 512))
+
+# Saqlash formati o‘zgarsa oshiriladi — eski yozuvlar o‘qilmaydi
+FORMAT = 1
+# Tozalash butun kalitlar ro‘yxatini o‘qiydi — har bir yozuvda emas, shu
+# oraliqda yoki chegaraning 1/16 qismi yozilganda bir marta
+PRUNE_SECONDS = 5.0
+
+
+class _Pruning:
+    def _init_pruning(self):
+        self._written = 0
+        self._pruned_at = 0.0
+
+    def _maybe_prune(self, nbytes):
+        self._written += nbytes
+        now = time.monotonic()
+        if now - self._pruned_at >= PRUNE_SECONDS or self._written >= self.max_bytes / 16:
+            self._written, self._pruned_at = 0, now
+            self.prune()
+
+
+# ``bytes`` qiymatlar shu nomli yagona ustunda saqlanadi
+BYTES_COLUMN = "__bytes__"
+
+
+def key_digest(key):
+    # Kalit — oddiy turlar kortejlari (versiya, oraliqlar, nomlar); repr jarayonlar orasida barqaror
+    return hashlib.sha256(repr((FORMAT, key)).encode()).hexdigest()
+
+
+def to_ipc(df):
+    sink = pa.BufferOutputStream()
+    table = pa.Table.from_pandas(df)
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def from_ipc(buffer):
+    return pa.ipc.open_file(buffer).read_all().to_pandas()
+
+
+class DiskBackend(_Pruning):
+    """Bitta host uchun: mazmun bo‘yicha nomlangan Arrow fayllar."""
+
+    def __init__(self, root, max_bytes, ttl):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        (self.root / "keys").mkdir(parents=True, exist_ok=True)
+        (self.root / "blobs").mkdir(parents=True, exist_ok=True)
+        self._init_pruning()
+
+    def _key_path(self, digest):
+        return self.root / "keys" / f"{digest}.json"
+
+    def _blob_path(self, sha):
+        return self.root / "blobs" / f"{sha}.arrow"
+
+    def get(self, digest):
+        path = self._key_path(digest)
+        try:
+            entry = json.loads(path.read_text())
+            if entry["expires"] < time.time():
+                return None
+            with pa.memory_map(str(self._blob_path(entry["blob"])), "r") as source:
+                df = from_ipc(source)
+            # mtime — oxirgi ishlatilish vaqti (LRU uchun)
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            # Boshqa jarayon o‘chirib ulgurgan yoki yarim yozilgan — keshda yo‘q deb hisoblaymiz
+            return None
+        return df
+
+    def put(self, digest, df):
+        data = to_ipc(df)
+        sha = hashlib.sha256(data).hexdigest()
+        blob = self._blob_path(sha)
+        if not blob.exists():
+            _write_atomic(blob, data)
+        entry = {"blob": sha, "nbytes": data.size, "expires": time.time() + self.ttl}
+        _write_atomic(self._key_path(digest), json.dumps(entry).encode())
+        self._maybe_prune(data.size)
+
+    def prune(self):
+        """Muddati o‘tgan kalitlar, keyin hajm chegarasigacha eng eskilari o‘chiriladi."""
+        now = time.time()
+        live = []
+        for path in (self.root / "keys").glob("*.json"):
+            try:
+                entry = json.loads(path.read_text())
+                used = path.stat().st_mtime
+            except (OSError, ValueError):
+                continue
+            if entry["expires"] < now:
+                path.unlink(missing_ok=True)
+            else:
+                live.append((used, path, entry))
+        live.sort(key=lambda item: item[0])
+        # Bir xil mazmunli kalitlar bitta faylni bo‘lishadi — hajm fayllar bo‘yicha
+        refs = Counter(entry["blob"] for _, _, entry in live)
+        sizes = {entry["blob"]: entry["nbytes"] for _, _, entry in live}
+        total = sum(sizes.values())
+        while live and total > self.max_bytes:
+            _, path, entry = live.pop(0)
+            path.unlink(missing_ok=True)
+            refs[entry["blob"]] -= 1
+            if not refs[entry["blob"]]:
+                total -= entry["nbytes"]
+        # Hech bir kalit ishora qilmaydigan fayllar. Yangilari (1 daqiqagacha)
+        # qoldiriladi — boshqa jarayon hozirgina yozib, kalitini hali yozmagan bo‘lishi mumkin
+        referenced = {entry["blob"] for _, _, entry in live}
+        for blob in (self.root / "blobs").glob("*.arrow"):
+            try:
+                if blob.stem not in referenced and now - blob.stat().st_mtime > 60:
+                    blob.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+class RedisBackend(_Pruning):
+    """Bir nechta host uchun: qiymatlar Redis da, TTL server tomonida.
+
+    Hajm chegarasi uchun ``<prefix>:lru`` (oxirgi ishlatilish vaqti) va
+    ``<prefix>:sizes`` (hajmlar) yordamchi kalitlari yuritiladi.
+    """
+
+    def __init__(self, client, max_bytes, ttl, prefix="imdb"):
+        self.client = client
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.prefix = prefix
+        self._init_pruning()
+
+    def _name(self, digest):
+        return f"{self.prefix}:{digest}"
+
+    def get(self, digest):
+        data = self.client.get(self._name(digest))
+        if data is None:
+            return None
+        self.client.zadd(f"{self.prefix}:lru", {digest: time.time()})
+        return from_ipc(pa.py_buffer(data))
+
+    def put(self, digest, df):
+        data = to_ipc(df).to_pybytes()
+        if len(data) > self.max_bytes:
+            return
+        self.client.set(self._name(digest), data, ex=max(int(self.ttl), 1))
+        self.client.zadd(f"{self.prefix}:lru", {digest: time.time()})
+        self.client.hset(f"{self.prefix}:sizes", digest, len(data))
+        self._maybe_prune(len(data))
+
+    def prune(self):
+        lru, sizes = f"{self.prefix}:lru", f"{self.prefix}:sizes"
+        # TTL bilan o‘chgan qiymatlar yordamchi kalitlardan ham olib tashlanadi
+        stale = _text(self.client.zrangebyscore(lru, 0, time.time() - self.ttl))
+        if stale:
+            self.client.zrem(lru, *stale)
+            self.client.hdel(sizes, *stale)
+        total = sum(int(n) for n in self.client.hvals(sizes))
+        while total > self.max_bytes:
+            oldest = _text(self.client.zrange(lru, 0, 0))
+            if not oldest:
+                break
+            digest = oldest[0]
+            total -= int(self.client.hget(sizes, digest) or 0)
+            self.client.delete(self._name(digest))
+            self.client.zrem(lru, digest)
+            self.client.hdel(sizes, digest)
+
+
+class LocalRedis:
+    """``RedisBackend`` ishlatadigan buyruqlarning xotiradagi o‘rnini bosuvchisi (Redis serversiz tekshiruvlar uchun)."""
+
+    def __init__(self):
+        self._values = {}
+        self._expires = {}
+        self._zsets = {}
+        self._hashes = {}
+        self._lock = threading.Lock()
+
+    def _alive(self, name):
+        if name in self._expires and self._expires[name] < time.time():
+            self._values.pop(name, None)
+            self._expires.pop(name, None)
+        return name in self._values
+
+    def get(self, name):
+        with self._lock:
+            return self._values[name] if self._alive(name) else None
+
+    def set(self, name, value, ex=None):
+        with self._lock:
+            self._values[name] = bytes(value)
+            if ex is None:
+                self._expires.pop(name, None)
+            else:
+                self._expires[name] = time.time() + ex
+        return True
+
+    def delete(self, *names):
+        with self._lock:
+            return sum(self._values.pop(n, None) is not None for n in names)
+
+    def zadd(self, name, mapping):
+        with self._lock:
+            self._zsets.setdefault(name, {}).update(mapping)
+
+    def zrem(self, name, *members):
+        with self._lock:
+            zset = self._zsets.get(name, {})
+            return sum(zset.pop(m, None) is not None for m in members)
+
+    def _sorted(self, name):
+        return sorted(self._zsets.get(name, {}).items(), key=lambda item: (item[1], item[0]))
+
+    def zrange(self, name, start, end):
+        with self._lock:
+            members = [m for m, _ in self._sorted(name)]
+        return members[start:None if end == -1 else end + 1]
+
+    def zrangebyscore(self, name, low, high):
+        with self._lock:
+            return [m for m, score in self._sorted(name) if low <= score <= high]
+
+    def hset(self, name, key, value):
+        with self._lock:
+            self._hashes.setdefault(name, {})[key] = str(value).encode()
+
+    def hget(self, name, key):
+        with self._lock:
+            return self._hashes.get(name, {}).get(key)
+
+    def hdel(self, name, *keys):
+        with self._lock:
+            table = self._hashes.get(name, {})
+            return sum(table.pop(k, None) is not None for k in keys)
+
+    def hvals(self, name):
+        with self._lock:
+            return list(self._hashes.get(name, {}).values())
+
+
+class SharedCache:
+    """``charts.FigureCache`` interfeysli kesh: avval jarayon ichidagi ``local``,
+    keyin umumiy backend, oxirida ``create()``. Qiymatlar — ``DataFrame`` yoki ``bytes``."""
+
+    def __init__(self, backend, local=None):
+        self.backend = backend
+        self.local = local
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, key):
+        if self.backend is None:
+            return None
+        df = self.backend.get(key_digest(key))
+        if df is not None and list(df.columns) == [BYTES_COLUMN]:
+            return df[BYTES_COLUMN].iloc[0]
+        return df
+
+    def save(self, key, value):
+        if self.backend is None:
+            return
+        if isinstance(value, bytes):
+            value = pd.DataFrame({BYTES_COLUMN: [value]})
+        self.backend.put(key_digest(key), value)
+
+    def _shared(self, key, create):
+        value = self.load(key)
+        if value is not None:
+            self.hits += 1
+            return value, payload_size(value)
+        self.misses += 1
+        value, nbytes = create()
+        self.save(key, value)
+        return value, nbytes
+
+    def get(self, key, create):
+        if self.local is None:
+            return self._shared(key, create)[0]
+        return self.local.get(key, lambda: self._shared(key, create))
+
+
+def open_backend(spec=CACHE_BACKEND, max_mb=CACHE_MAX_MB, ttl=CACHE_TTL):
+    """``IMDB_CACHE`` qiymatidan backend: ``disk``, ``redis://...`` yoki ``off`` (None)."""
+    max_bytes = int(max_mb * 2**20)
+    if spec in ("", "off", "0"):
+        return None
+    if spec == "disk":
+        return DiskBackend(Path(CACHE_DIR) / "shared", max_bytes, ttl)
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        # Ixtiyoriy bog‘liqlik — faqat Redis tanlanganda kerak
+        import redis
+
+        return RedisBackend(redis.Redis.from_url(spec), max_bytes, ttl)
+    raise ValueError(f"IMDB_CACHE: noma'lum backend {spec!r}")
+
+
+def _text(values):
+    return [v.decode() if isinstance(v, bytes) else v for v in values]
+
+
+def _write_atomic(path, data):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
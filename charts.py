@@ -0,0 +1,290 @@
+import importlib.util
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from density import votes_label
+
+
+def _default_backend():
+    # seaborn o‘rnatilmagan bo‘lsa — Plotly; modul import qilinmaydi, faqat qidiriladi
+    return "matplotlib" if importlib.util.find_spec("seaborn") else "plotly"
+
+
+# "matplotlib" — avvalgidek seaborn rasmlari (PNG),
+# "plotly" — oldindan binlangan ma'lumotdan Plotly spetsifikatsiyasi
+# (matplotlib va seaborn umuman yuklanmaydi, ularni o‘rnatmasa ham bo‘ladi)
+CHART_BACKEND = os.environ.get("IMDB_CHART_BACKEND") or _default_backend()
+FIGURE_CACHE_MB = float(os.environ.get("IMDB_FIGURE_CACHE_MB", 64))
+
+
+class FigureCache:
+    """Tayyor grafiklar uchun LRU kesh, umumiy hajmi ``max_bytes`` dan oshmaydi.
+
+    Kalit — (grafik id, filtr holati, ma'lumotlar versiyasi); qiymat yaratuvchi
+    funksiya ``(value, nbytes)`` qaytaradi. Streamlit sessiyalari alohida
+    oqimlarda ishlagani uchun qulf bilan himoyalangan.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, create):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key][0]
+            self.misses += 1
+
+        # Chizish qulfdan tashqarida — boshqa sessiyalarni to‘xtatib qo‘ymaydi
+        value, size = create()
+
+        with self._lock:
+            if key not in self._items and size <= self.max_bytes:
+                self._items[key] = (value, size)
+                self.nbytes += size
+                while self.nbytes > self.max_bytes:
+                    _, (_, evicted) = self._items.popitem(last=False)
+                    self.nbytes -= evicted
+        return value
+
+
+def _pyplot():
+    # pyplot va seaborn sekin yuklanadi (~0.7 s) — birinchi PNG chizilgandagina.
+    # Agg: oynasiz backend, GUI toolkitlar qidirilmaydi
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _seaborn():
+    import seaborn as sns
+
+    return sns
+
+
+def _graph_objects():
+    # Plotly ham birinchi spetsifikatsiya qurilgandagina yuklanadi —
+    # grafik chizmaydigan jarayonlar (api.py, precompute ishchilari) uni umuman yuklamaydi
+    import plotly.graph_objects as go
+
+    return go
+
+
+def express():
+    """``plotly.express`` — birinchi chaqiruvda yuklanadi (~0.1 s), app.py grafiklari uchun."""
+    import plotly.express as px
+
+    return px
+
+
+def to_png(fig):
+    # st.pyplot bilan bir xil sozlamalar; figura darhol yopiladi
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, format="png", bbox_inches="tight", dpi=200)
+    finally:
+        _pyplot().close(fig)
+    png = buf.getvalue()
+    return png, len(png)
+
+
+def to_spec(fig):
+    return fig, len(fig.to_json())
+
+
+# ---------------------------------------------------------------- Matplotlib
+
+def rating_histogram_png(ratings):
+    fig, ax = _pyplot().subplots()
+    _seaborn().histplot(ratings, bins=10, kde=True, ax=ax)
+    ax.set_xlabel("IMDb reytingi")
+    ax.set_ylabel("Soni")
+    return to_png(fig)
+
+
+def year_line_png(per_year):
+    fig, ax = _pyplot().subplots()
+    per_year.plot(kind="line", ax=ax)
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Number of Movies")
+    return to_png(fig)
+
+
+def votes_scatter_png(density):
+    # density.Density: kam nuqtada — avvalgidek seaborn scatter (chiziqli o‘q),
+    # aks holda log10(ovozlar) bo‘yicha binlangan to‘r (log o‘q)
+    fig, ax = _pyplot().subplots()
+    if density.binned:
+        counts = np.ma.masked_equal(density.counts.T, 0)
+        mesh = ax.pcolormesh(10 ** density.x_edges, density.y_edges, counts, cmap="Blues")
+        fig.colorbar(mesh, ax=ax, label="Filmlar")
+        ax.set_xscale("log")
+    else:
+        _seaborn().scatterplot(data=density.points, x="Num Votes", y="IMDb Rating", ax=ax)
+    ax.set_xlabel("Ovozlar soni")
+    ax.set_ylabel("IMDb reytingi")
+    return to_png(fig)
+
+
+def runtime_histogram_png(runtime):
+    fig, ax = _pyplot().subplots()
+    _seaborn().histplot(runtime, bins=15, ax=ax)
+    ax.set_xlabel("Davomiyligi (daqiqa)")
+    ax.set_ylabel("Filmlar soni")
+    return to_png(fig)
+
+
+# ------------------------------------------------------- Plotly (binlangan)
+
+def _valid(values, weights):
+    # weights — har bir qiymat necha marta uchraydi (SQL da sanalgan qiymatlar uchun)
+    values = np.asarray(values, dtype=np.float64)
+    weights = np.ones(len(values), dtype=np.int64) if weights is None else np.asarray(weights)
+    keep = ~np.isnan(values)
+    return values[keep], weights[keep]
+
+
+def _bars(values, bins, xlabel, ylabel, weights=None):
+    go = _graph_objects()
+    values, weights = _valid(values, weights)
+    counts, edges = np.histogram(values, bins=bins, weights=weights)
+    counts = counts.astype(np.int64)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_line_width=1,
+    ))
+    fig.update_layout(xaxis_title=xlabel, yaxis_title=ylabel, bargap=0)
+    return fig, counts, edges
+
+
+def _binned_kde(values, edges, n_points=200, step=0.1, weights=None):
+    # Reytinglar 0.1 qadamli — KDE ni qatorlar emas, 0.1 li bucketlar ustida
+    # hisoblaymiz (Scott qoidasi, seaborn dagi kabi), natija soni bo‘yicha masshtablanadi
+    buckets = np.rint(values / step).astype(np.int64)
+    lo = buckets.min()
+    weights = np.bincount(buckets - lo, weights=weights).astype(np.float64)
+    centers = (np.arange(len(weights)) + lo) * step
+    n = weights.sum()
+    mean = np.average(centers, weights=weights)
+    std = np.sqrt(np.average((centers - mean) ** 2, weights=weights))
+    bandwidth = std * n ** (-1 / 5)
+    grid = np.linspace(edges[0], edges[-1], n_points)
+    if bandwidth == 0:
+        return grid, np.zeros_like(grid)
+    z = (grid[:, None] - centers[None, :]) / bandwidth
+    density = (np.exp(-0.5 * z ** 2) @ weights) / (n * bandwidth * np.sqrt(2 * np.pi))
+    return grid, density * n * (edges[1] - edges[0])
+
+
+def rating_histogram_spec(ratings, weights=None):
+    go = _graph_objects()
+    fig, _, edges = _bars(ratings, 10, "IMDb reytingi", "Soni", weights)
+    values, weights = _valid(ratings, weights)
+    if weights.sum() > 1:
+        x, y = _binned_kde(values, edges, weights=weights)
+        fig.add_trace(go.Scatter(x=x, y=y, mode="lines", name="KDE"))
+    fig.update_layout(showlegend=False)
+    return to_spec(fig)
+
+
+def year_line_spec(per_year):
+    go = _graph_objects()
+    fig = go.Figure(go.Scatter(x=per_year.index, y=per_year.to_numpy(), mode="lines"))
+    fig.update_layout(xaxis_title="Year", yaxis_title="Number of Movies")
+    return to_spec(fig)
+
+
+def votes_scatter_spec(density):
+    # Binlangan to‘r — x o‘qi log10(ovozlar); xom nuqtalar — matplotlib dagi kabi chiziqli
+    go = _graph_objects()
+    fig = go.Figure()
+    if density.binned:
+        _heatmap(fig, density.counts, density.x_edges, density.y_edges)
+        x0, x1 = density.x_edges[0], density.x_edges[-1]
+        ticks = np.arange(np.ceil(x0), np.floor(x1) + 1)
+        fig.update_xaxes(tickvals=ticks, ticktext=[votes_label(10 ** tick) for tick in ticks])
+        fig.update_layout(xaxis_title="Ovozlar soni (log)", yaxis_title="IMDb reytingi")
+        return to_spec(fig)
+    if density.total:
+        fig.add_trace(go.Scattergl(
+            x=density.points["Num Votes"].to_numpy(),
+            y=density.points["IMDb Rating"].to_numpy(),
+            mode="markers",
+            marker={"size": 5, "opacity": 0.6},
+            hovertemplate="Ovozlar: %{x:,}<br>Reyting: %{y}<extra></extra>",
+        ))
+    fig.update_layout(xaxis_title="Ovozlar soni", yaxis_title="IMDb reytingi")
+    return to_spec(fig)
+
+
+def _heatmap(fig, counts, x_edges, y_edges):
+    go = _graph_objects()
+    z = np.where(counts.T > 0, counts.T, np.nan)
+    fig.add_trace(go.Heatmap(
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        z=z,
+        colorscale="Blues",
+        colorbar_title="Filmlar",
+        hovertemplate="Reyting: %{y:.1f}<br>Filmlar: %{z}<extra></extra>",
+    ))
+
+
+def runtime_histogram_spec(runtime, weights=None):
+    fig, _, _ = _bars(runtime, 15, "Davomiyligi (daqiqa)", "Filmlar soni", weights)
+    return to_spec(fig)
+
+
+# ------------------------------------------- SQL da binlangan (warehouse.py)
+
+def rating_counts_spec(counts):
+    # counts: reyting → filmlar soni (``Warehouse.value_counts``)
+    return rating_histogram_spec(counts.index, counts.to_numpy())
+
+
+def runtime_counts_spec(counts):
+    return runtime_histogram_spec(counts.index, counts.to_numpy())
+
+
+RENDERERS = {
+    "matplotlib": {
+        "rating_hist": rating_histogram_png,
+        "year_line": year_line_png,
+        "votes_scatter": votes_scatter_png,
+        "runtime_hist": runtime_histogram_png,
+    },
+    "plotly": {
+        "rating_hist": rating_histogram_spec,
+        "year_line": year_line_spec,
+        "votes_scatter": votes_scatter_spec,
+        "runtime_hist": runtime_histogram_spec,
+    },
+}
+
+
+# Out-of-core rejim (IMDB_ENGINE=duckdb): ma'lumot SQL da sanalgan/binlangan,
+# xom qatorlar yo‘q — faqat Plotly
+BINNED_RENDERERS = {
+    "rating_hist": rating_counts_spec,
+    "year_line": year_line_spec,
+    "votes_scatter": votes_scatter_spec,
+    "runtime_hist": runtime_counts_spec,
+}
@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from filters import RATING_SCALE, rating_buckets
+from ranking import group_ratings
+from relations import MovieIndex
+
+
+# Reytingi yo‘q filmlar uchun bucket — har qanday reyting oralig‘idan tashqarida
+NO_RATING = -1
+
+MEASURES = ["count", "rated", "votes", "rating_sum", "runtime_sum", "runtime_count"]
+
+
+def _aggregate(frame, keys):
+    grouped = frame.groupby(keys, sort=True)
+    cells = pd.DataFrame({
+        "count": grouped.size(),
+        "rated": grouped["rated"].sum(),
+        "votes": grouped["votes"].sum(),
+        "rating_sum": grouped["rating"].sum(),
+        "runtime_sum": grouped["runtime"].sum(),
+        "runtime_count": grouped["has_runtime"].sum(),
+    })
+    return cells.reset_index()
+
+
+def _slice(cells, year_range, rating_range):
+    # Yacheykalar (year, bucket, ...) bo‘yicha saralangan: yil oralig‘i uzluksiz bo‘lak
+    if year_range is not None:
+        years = cells["year"].to_numpy()
+        lo = np.searchsorted(years, np.ceil(year_range[0]), side="left")
+        hi = np.searchsorted(years, np.floor(year_range[1]), side="right")
+        cells = cells.iloc[lo:hi]
+    if rating_range is not None:
+        b0, b1 = rating_buckets(rating_range)
+        bucket = cells["bucket"].to_numpy()
+        cells = cells[(bucket >= b0) & (bucket <= b1)]
+    return cells
+
+
+def _merge(parts, keys):
+    # (yacheykalar, nomlar, ishora) qismlarini umumiy nomlar lug‘atida qo‘shamiz
+    names = None
+    if "label" in keys:
+        names = np.unique(np.concatenate([n for _, n, _ in parts]).astype(object))
+    frames = []
+    for cells, part_names, sign in parts:
+        cells = cells.copy()
+        if names is not None:
+            cells["label"] = np.searchsorted(names, part_names)[cells["label"].to_numpy()]
+        cells[MEASURES] = cells[MEASURES] * sign
+        frames.append(cells)
+    merged = pd.concat(frames, ignore_index=True).groupby(keys, sort=True)[MEASURES].sum()
+    return merged[merged["count"] != 0].reset_index(), names
+
+
+def _mean_rating(rating_sum, rated):
+    # Reyting yig‘indisi butun bucketlarda saqlanadi
+    return rating_sum / rated / RATING_SCALE
+
+
+@dataclass(frozen=True)
+class Cube:
+    """Yil × reyting bucket (0.1) × janr / rejissyor bo‘yicha oldindan hisoblangan agregatlar.
+
+    Uchta guruhlash to‘plami saqlanadi: ``movies`` (year, bucket),
+    ``genres`` (year, bucket, janr) va ``directors`` (year, bucket, rejissyor).
+    Har bir yacheykada: filmlar soni, ovozlar, reytinglar va davomiylik
+    yig‘indilari. Janr va rejissyor alohida to‘plamlarda, chunki bir nechta
+    rejissyorli film (janr, rejissyor) kesimida bir necha marta sanalib qoladi.
+    Dashboard bo‘limlari shu yacheykalarni yig‘ish (roll-up) orqali hisoblanadi.
+    """
+
+    movies: pd.DataFrame
+    genres: pd.DataFrame
+    directors: pd.DataFrame
+    genre_names: np.ndarray
+    director_names: np.ndarray
+
+    @classmethod
+    def build(cls, df, index, rows=None):
+        """``rows`` berilsa — faqat shu qatorlardan (masalan, janr filtridan keyin) kub."""
+        rating = df["IMDb Rating"].to_numpy(dtype=np.float64)
+        runtime = df["Runtime (mins)"].to_numpy(dtype=np.float64, na_value=np.nan)
+        rated = ~np.isnan(rating)
+        bucket = np.where(rated, np.rint(np.nan_to_num(rating) * RATING_SCALE), NO_RATING)
+        base = pd.DataFrame({
+            "year": df["Year"].to_numpy(dtype=np.int64),
+            "bucket": bucket.astype(np.int64),
+            "rated": rated.astype(np.int64),
+            "votes": df["Num Votes"].to_numpy(dtype=np.int64),
+            "rating": np.where(rated, bucket, 0).astype(np.int64),
+            "runtime": np.nan_to_num(runtime),
+            "has_runtime": (~np.isnan(runtime)).astype(np.int64),
+        })
+
+        keep = None
+        if rows is not None:
+            keep = np.zeros(len(df), dtype=bool)
+            keep[rows] = True
+
+        def linked(links):
+            link_rows, codes = links.rows, links.codes
+            if keep is not None:
+                selected = keep[link_rows]
+                link_rows, codes = link_rows[selected], codes[selected]
+            frame = base.iloc[link_rows].reset_index(drop=True)
+            frame["label"] = codes
+            return _aggregate(frame, ["year", "bucket", "label"])
+
+        return cls(
+            movies=_aggregate(base if keep is None else base[keep], ["year", "bucket"]),
+            genres=linked(index.genres),
+            directors=linked(index.directors),
+            genre_names=index.genres.names,
+            director_names=index.directors.names,
+        )
+
+    def patch(self, before, after):
+        """``before`` qatorlarini ayirib, ``after`` ni qo‘shgan yangi kub.
+
+        Faqat delta qatorlari agregatsiya qilinadi — butun katalog qayta ko‘rilmaydi.
+        """
+        parts = [(self, 1)]
+        for frame, sign in ((before, -1), (after, 1)):
+            if len(frame):
+                parts.append((Cube.build(frame, MovieIndex.build(frame)), sign))
+        movies, _ = _merge([(c.movies, None, s) for c, s in parts], ["year", "bucket"])
+        genres, genre_names = _merge(
+            [(c.genres, c.genre_names, s) for c, s in parts], ["year", "bucket", "label"])
+        directors, director_names = _merge(
+            [(c.directors, c.director_names, s) for c, s in parts], ["year", "bucket", "label"])
+        return Cube(movies, genres, directors, genre_names, director_names)
+
+    @property
+    def nbytes(self):
+        return sum(int(t.memory_usage(index=False).sum())
+                   for t in (self.movies, self.genres, self.directors))
+
+    def rollup(self, table, by, year_range=None, rating_range=None):
+        cells = _slice(getattr(self, table), year_range, rating_range)
+        return cells.groupby(by, sort=True)[MEASURES].sum()
+
+    # ------------------------------------------------------------ bo‘limlar
+
+    def movies_per_year(self, k=10):
+        counts = self.rollup("movies", "year")["count"]
+        top = counts.rename_axis("Year").nlargest(k)
+        return top.reset_index(name="Movie Count")
+
+    def decade_stats(self, year_range=None, rating_range=None):
+        cells = _slice(self.movies, year_range, rating_range)
+        decades = cells.groupby((cells["year"] // 10) * 10)[MEASURES].sum()
+        return pd.DataFrame(
+            {
+                "avg_rating": _mean_rating(decades["rating_sum"], decades["rated"]),
+                "movie_count": decades["count"],
+            },
+        ).rename_axis("Decade")
+
+    def genre_year_counts(self):
+        counts = self.rollup("genres", ["year", "label"])["count"].reset_index()
+        return pd.DataFrame({
+            "Year": counts["year"].to_numpy(),
+            "Genres": self.genre_names[counts["label"].to_numpy()],
+            "Movie Count": counts["count"].to_numpy(),
+        })
+
+    def top_genres(self, k=5):
+        counts = self.rollup("genres", "label")["count"]
+        counts.index = self.genre_names[counts.index]
+        return counts.nlargest(k).index.rename("Genres")
+
+    def _directors(self, year_range=None, rating_range=None):
+        totals = self.rollup("directors", "label", year_range, rating_range)
+        totals.index = pd.Index(self.director_names[totals.index], name="Directors")
+        return totals
+
+    def top_directors_by_votes(self, k=10):
+        votes = self._directors()["votes"]
+        return votes.nlargest(k).reset_index(name="Num Votes")
+
+    def top_directors_by_rating(self, k=10):
+        totals = self._directors()
+        totals = totals[totals["rated"] > 0]
+        rating = _mean_rating(totals["rating_sum"], totals["rated"])
+        return rating.nlargest(k).reset_index(name="IMDb Rating")
+
+    def director_rating_table(self, year_range=None, rating_range=None, min_movies=2, k=10):
+        totals = self._directors(year_range, rating_range)
+        table = pd.DataFrame({
+            "avg_rating": _mean_rating(totals["rating_sum"], totals["rated"]),
+            "movie_count": totals["count"],
+        })
+        return table[table["movie_count"] >= min_movies].nlargest(k, "avg_rating")
+
+    def group_ratings(self, table, year_range=None, rating_range=None):
+        """``table`` ("directors" / "genres") bo‘yicha WR va ishonch oraliqlari (ranking.py)."""
+        cells = _slice(getattr(self, table), year_range, rating_range)
+        cells = cells[cells["bucket"] != NO_RATING]
+        hist = cells.groupby(["label", "bucket"], sort=True)["rated"].sum().reset_index()
+        stats = group_ratings(hist["label"], hist["bucket"], hist["rated"])
+        names = self.director_names if table == "directors" else self.genre_names
+        stats.index = pd.Index(names[stats.index], name=table.capitalize())
+        return stats
+
+
+def genre_peak_years(genre_year, k=5):
+    # Har bir janr uchun eng ko‘p film olingan yil (teng bo‘lsa — eng erta yil)
+    by_genre = genre_year.sort_values(["Genres", "Year"], ignore_index=True)
+    peak = by_genre.loc[by_genre.groupby("Genres")["Movie Count"].idxmax()]
+    return peak.nlargest(k, "Movie Count")
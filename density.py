@@ -0,0 +1,123 @@
+"""Ovozlar × reyting zichlik xaritasi — "IMDb reyting va ovozlar soni" grafigi.
+
+Har bir filmni nuqta qilib chizish qatorlar soniga chiziqli qimmatlashadi va
+millionlab nuqtada rasm o‘qib bo‘lmaydi. Shuning uchun ko‘rinadigan oyna
+serverda 2D gistogrammaga binlanadi (NumPy, vektorlangan): ovozlar log10
+shkalada ``X_BINS`` ta teng oraliq, reyting — har bir 0.1 bucket alohida
+qator. Oyna kichraytirilsa (level of detail), faqat shu oynadagi filmlar
+qayta binlanadi — katakchalar maydalashadi. Oynada filmlar ``RAW_MAX`` tadan
+kam bo‘lsa, binlash o‘rniga xom nuqtalar qaytadi.
+
+warehouse.py (``Warehouse.votes_density``) xuddi shu to‘r va shu natijani SQL
+da hisoblaydi.
+"""
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from filters import RATING_SCALE
+
+
+# Oynada shundan ko‘p film bo‘lsa — binlanadi; 0 — har doim binlash
+RAW_MAX = int(os.environ.get("IMDB_SCATTER_RAW_MAX", 5000))
+# log10(ovozlar) bo‘yicha kataklar soni
+X_BINS = 80
+# Oyna slayderi qadamlari: 1, 2, 5, 10, 20, 50, ...
+_STEPS = (1, 2, 5)
+
+
+@dataclass(frozen=True)
+class Density:
+    """Bitta oyna uchun natija: ``counts`` (binlangan) yoki ``points`` (xom).
+
+    ``x_edges`` — log10(ovozlar), ``y_edges`` — reyting; ikkala holatda ham
+    oynaning to‘ri, grafik o‘qlari shu bo‘yicha.
+    """
+
+    counts: object
+    x_edges: np.ndarray
+    y_edges: np.ndarray
+    total: int
+    points: object = None
+
+    @property
+    def binned(self):
+        return self.points is None
+
+
+def log_votes(votes):
+    # Ovozlar ≥ 1 (IMDb da 0 ovozli film reytingsiz)
+    return np.log10(np.maximum(np.asarray(votes, dtype=np.float64), 1.0))
+
+
+def vote_steps(lo, hi):
+    """``[lo, hi]`` ni qoplaydigan 1-2-5 qadamlar (oyna slayderi uchun)."""
+    lo, hi = max(float(lo), 1.0), max(float(hi), 1.0)
+    powers = 10 ** np.arange(int(np.floor(np.log10(lo))), int(np.ceil(np.log10(hi))) + 1)
+    steps = np.outer(powers, _STEPS).ravel()
+    first = np.flatnonzero(steps <= lo)[-1]
+    last = np.flatnonzero(steps >= hi)[0]
+    return [int(v) for v in steps[first:last + 1]]
+
+
+def votes_label(votes):
+    # 1500 → "1.5K", 2000000 → "2M"
+    for scale, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if votes >= scale:
+            return f"{votes / scale:g}{suffix}"
+    return f"{votes:g}"
+
+
+def grid(x_range, bucket_range, x_bins=X_BINS):
+    """Oyna to‘ri: ``x_range`` — log10(ovozlar), ``bucket_range`` — reyting bucketlari."""
+    x0, x1 = x_range
+    if x0 == x1:
+        # np.histogram2d dagi kabi: bitta qiymat atrofida birlik oraliq
+        x0, x1 = x0 - 0.5, x1 + 0.5
+    b0, b1 = bucket_range
+    step = 1 / RATING_SCALE
+    x_edges = np.linspace(x0, x1, x_bins + 1)
+    y_edges = np.linspace(b0 / RATING_SCALE - step / 2, b1 / RATING_SCALE + step / 2,
+                          b1 - b0 + 2)
+    return x_edges, y_edges
+
+
+def window_bounds(window):
+    """``((ovoz_min, ovoz_max), (reyting_min, reyting_max))`` → log10 va bucket chegaralari."""
+    (v0, v1), (r0, r1) = window
+    return ((float(log_votes(v0)), float(log_votes(v1))),
+            (int(round(r0 * RATING_SCALE)), int(round(r1 * RATING_SCALE))))
+
+
+def bin_votes(votes, rating, window=None, x_bins=X_BINS, raw_max=RAW_MAX):
+    """Filtrlangan filmlardan ``window`` oynasidagi zichlik (``None`` — butun oraliq)."""
+    votes = np.asarray(votes, dtype=np.float64)
+    rating = np.asarray(rating, dtype=np.float64)
+    keep = ~np.isnan(votes) & ~np.isnan(rating)
+    x = log_votes(votes)
+    buckets = np.zeros(len(rating), dtype=np.int64)
+    buckets[keep] = np.rint(rating[keep] * RATING_SCALE)
+    if window is not None:
+        (x0, x1), (b0, b1) = window_bounds(window)
+        keep &= (x >= x0) & (x <= x1) & (buckets >= b0) & (buckets <= b1)
+    rows = np.flatnonzero(keep)
+    x, buckets = x[rows], buckets[rows]
+    if window is None:
+        if not len(rows):
+            return Density(None, np.array([]), np.array([]), 0, _points(votes, rating, rows))
+        (x0, x1), (b0, b1) = (x.min(), x.max()), (buckets.min(), buckets.max())
+    x_edges, y_edges = grid((x0, x1), (b0, b1), x_bins)
+    if len(rows) <= raw_max:
+        return Density(None, x_edges, y_edges, len(rows), _points(votes, rating, rows))
+    # histogram2d o‘rniga: katak raqami bitta bincount bilan (oxirgi chegara ichida)
+    span = x_edges[-1] - x_edges[0]
+    xi = np.minimum(((x - x_edges[0]) / span * x_bins).astype(np.int64), x_bins - 1)
+    ny = len(y_edges) - 1
+    counts = np.bincount(xi * ny + (buckets - b0), minlength=x_bins * ny)
+    return Density(counts.reshape(x_bins, ny), x_edges, y_edges, len(rows))
+
+
+def _points(votes, rating, rows):
+    return pd.DataFrame({"Num Votes": votes[rows], "IMDb Rating": rating[rows]})
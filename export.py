@@ -0,0 +1,277 @@
+"""Dashboard ning statik nusxasi — tayyor filtrlar uchun HTML/JSON to‘plamlari.
+
+Ko‘pchilik filtrlanmagan dashboardni ko‘radi, lekin har bir tashrif Streamlit
+sessiyasi va butun ``app.py`` ni ishga tushiradi. Bu buyruq filtrlanmagan
+ko‘rinish va tayyor filtrlar (``precompute.presets()`` yoki ``--preset``)
+uchun jadvallar va Plotly grafiklarini oldindan chizib, istalgan statik fayl
+serveridan (nginx, S3, ``python -m http.server``) beriladigan papkaga yozadi —
+so‘rovda Python yo‘q::
+
+    site/
+    ├─ index.html              # filtrlanmagan ko‘rinish
+    ├─ y1990-2010_r8.0-9.3.html
+    ├─ data/<slug>/<bo‘lim>.json  # API (api.py) bilan bir xil JSON (records)
+    ├─ plotly.min.js           # bir marta, CDN siz
+    └─ manifest.json           # filtrlar, kirish xeshlari — sahifalar menyusi shundan
+
+Filtrlar jarayonlar pulida parallel chiziladi. Har bir filtrning kirishlari
+(ma'lumotlar versiyasi, oraliqlar, eksport formati, reyting sozlamalari)
+xeshi ``manifest.json`` da saqlanadi — keyingi ishga tushirishda faqat
+kirishlari o‘zgargan filtrlar qayta chiziladi, ro‘yxatdan chiqqanlari o‘chiriladi.
+
+    python export.py --out site                                # top_1000ta_kino.csv
+    python export.py --out site --preset "90-yillar:1990-1999:7.5-10" --workers 4
+"""
+import argparse
+import hashlib
+import html
+import json
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import plotly
+
+from aggregates import SECTIONS, Snapshot, chart_data
+from api import encode
+from charts import RENDERERS
+from loader import CSV_PATH, load_movies
+from precompute import WORKERS, presets
+from ranking import BOOTSTRAP_REPS, PRIOR_QUANTILE, top_groups
+
+
+# Sahifa shabloni yoki bo‘limlar o‘zgarsa oshiriladi — barcha sahifalar qayta chiziladi
+FORMAT = 1
+OUT_DIR = "site"
+
+# Sahifa tartibi: (tur, nom, sarlavha) — app.py dagi bo‘limlar kabi
+PAGE = [
+    ("chart", "rating_hist", "⭐ Reyting taqsimoti"),
+    ("chart", "year_line", "📅 Yillar bo‘yicha filmlar soni"),
+    ("table", "top_rating", "🏆 Eng yuqori reytingli Top 10 filmlar"),
+    ("table", "top_votes", "🔥 Eng ko‘p ovoz olgan Top 10 filmlar"),
+    ("table", "directors_by_votes", "📊 Eng ko‘p ko‘rilgan rejissyorlar (Top 10)"),
+    ("table", "director_ratings", "⭐ Rejissyorlar — Bayes reytingi (WR), 95% ishonch oralig‘i"),
+    ("table", "genre_peaks", "🎯 Janrlar bo‘yicha (Top 5), eng sermahsul yillar"),
+    ("chart", "votes_scatter", "📊 IMDb reyting va ovozlar soni o‘rtasidagi bog‘liqlik"),
+    ("chart", "runtime_hist", "⏱ Film davomiyligi taqsimoti"),
+    ("table", "directors", "🎬 Eng yaxshi rejissyorlar (o‘rtacha reyting)"),
+    ("table", "genre_ratings", "🎭 Janrlar — Bayes reytingi (WR)"),
+    ("table", "decades", "📅 O‘n yilliklar bo‘yicha filmlar tahlili"),
+]
+# Barcha guruhlar JSON da (API kabi), sahifada — eng yaxshilari
+TABLE_VIEWS = {
+    "director_ratings": lambda table: top_groups(table),
+    "genre_ratings": lambda table: top_groups(table, k=len(table)),
+}
+
+TEMPLATE = """<!doctype html>
+<html lang="uz">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>IMDb Top Movies — {name}</title>
+<script src="plotly.min.js"></script>
+<style>
+body {{ font-family: sans-serif; max-width: 1200px; margin: 0 auto; padding: 0 16px; }}
+.dashboard-title {{ background: linear-gradient(90deg, #ff512f, #dd2476); padding: 25px;
+  border-radius: 15px; text-align: center; color: white; margin: 20px 0 30px; }}
+nav a {{ margin-right: 12px; }}
+.metrics {{ display: flex; gap: 48px; font-size: 28px; }}
+.metrics small {{ display: block; font-size: 14px; color: #666; }}
+table {{ border-collapse: collapse; font-size: 14px; }}
+th, td {{ border-bottom: 1px solid #ddd; padding: 4px 10px; text-align: right; }}
+</style>
+</head>
+<body>
+<div class="dashboard-title">
+  <h1>🎬 IMDb Top Movies Dashboard</h1>
+  <p>{name}: yillar {years}, reyting {ratings}</p>
+</div>
+<nav id="presets"></nav>
+<div class="metrics">{metrics}</div>
+{body}
+<p><small>Ma'lumotlar versiyasi {version} · JSON: <code>data/{slug}/</code></small></p>
+<script>
+// Menyu manifest.json dan — filtrlar ro‘yxati o‘zgarsa, sahifani qayta chizish kerak emas
+fetch("manifest.json").then(r => r.json()).then(m => {{
+  const nav = document.getElementById("presets");
+  for (const [slug, preset] of Object.entries(m.presets)) {{
+    const a = document.createElement("a");
+    a.href = slug + ".html";
+    a.textContent = preset.name;
+    nav.appendChild(a);
+  }}
+}});
+</script>
+</body>
+</html>
+"""
+
+
+def slug(year_range, rating_range, default):
+    # Filtrlanmagan ko‘rinish — index.html, qolganlari oraliqlardan (URL da barqaror)
+    if default:
+        return "index"
+    (y0, y1), (r0, r1) = year_range, rating_range
+    return f"y{y0}-{y1}_r{r0:.1f}-{r1:.1f}"
+
+
+def parse_preset(text):
+    """``"nom:y0-y1:r0-r1"`` → ``(nom, (y0, y1), (r0, r1))``."""
+    try:
+        name, years, ratings = text.rsplit(":", 2)
+        y0, y1 = (int(v) for v in years.split("-"))
+        r0, r1 = (float(v) for v in ratings.split("-"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r}: kutilgan format nom:1990-2010:8.0-10") from None
+    return name, (y0, y1), (r0, r1)
+
+
+def inputs_hash(name, version, year_range, rating_range):
+    # Sahifa natijasi faqat shularga bog‘liq (nom — sarlavhada)
+    inputs = {"format": FORMAT, "name": name, "version": version,
+              "year_range": list(year_range), "rating_range": list(rating_range), "sections": sorted(SECTIONS),
+              "wr_quantile": PRIOR_QUANTILE, "bootstrap_reps": BOOTSTRAP_REPS}
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _write_atomic(path, data):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _replace_dir(tmp, path):
+    if path.exists():
+        shutil.rmtree(path)
+    os.replace(tmp, path)
+
+
+_worker = {}
+
+
+def _init(csv_path):
+    df, version = load_movies(csv_path)
+    _worker["snap"] = Snapshot.build(df, version)
+
+
+def _render(out, name, year_range, rating_range, page):
+    """Bitta filtr: ``data/<page>/*.json`` va ``<page>.html``."""
+    snap = _worker["snap"]
+    out = Path(out)
+    results = {section: create(snap, year_range, rating_range)
+               for section, (_, _, create) in SECTIONS.items()}
+    # JSON avval vaqtinchalik papkaga — yarim yozilgan to‘plam berilmaydi
+    data = out / "data" / page
+    tmp = data.with_name(f"{page}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    for section, table in results.items():
+        (tmp / f"{section}.json").write_bytes(encode(table, "json"))
+    _replace_dir(tmp, data)
+
+    summary = results["summary"].iloc[0]
+    metrics = "".join(f"<div><small>{label}</small>{value}</div>" for label, value in (
+        ("🎞 Filmlar soni", f"{int(summary['count']):,}"),
+        ("⭐ O‘rtacha reyting", f"{summary['rating_mean']:.2f}"),
+        ("🗳 Ovozlar soni", f"{int(summary['votes_sum']):,}"),
+    ))
+    body = []
+    for kind, item, title in PAGE:
+        body.append(f"<h3>{html.escape(title)}</h3>")
+        if kind == "table":
+            table = TABLE_VIEWS.get(item, lambda t: t)(results[item])
+            body.append(table.to_html(index=table.index.name is not None,
+                                      float_format=lambda v: f"{v:.3g}", border=0))
+        else:
+            fig, _ = RENDERERS["plotly"][item](chart_data(snap, item, year_range, rating_range))
+            # "</script>" JSON ichida skriptni yopib qo‘ymasin
+            spec = fig.to_json().replace("</", "<\\/")
+            body.append(f'<div id="{item}"></div><script>(function(f) {{ '
+                        f'Plotly.newPlot("{item}", f.data, f.layout, {{responsive: true}}); '
+                        f'}})({spec});</script>')
+    text = TEMPLATE.format(
+        name=html.escape(name), years=f"{year_range[0]}–{year_range[1]}",
+        ratings=f"{rating_range[0]:.1f}–{rating_range[1]:.1f}", metrics=metrics,
+        body="\n".join(body), version=html.escape(snap.version), slug=page)
+    _write_atomic(out / f"{page}.html", text.encode())
+    return page
+
+
+def _read_manifest(out):
+    try:
+        return json.loads((Path(out) / "manifest.json").read_text())
+    except (OSError, ValueError):
+        return {"presets": {}}
+
+
+def export(out=OUT_DIR, csv_path=CSV_PATH, preset_list=None, workers=WORKERS, force=False):
+    """Statik to‘plamni yangilaydi: ``(chizilgan, o‘zgarmagan)`` sahifalar soni."""
+    out = Path(out)
+    out.mkdir(parents=True, exist_ok=True)
+    df, version = load_movies(csv_path)
+    snap = Snapshot.build(df, version)
+    del df
+    full = (snap.year_range, snap.rating_range)
+    if preset_list is None:
+        preset_list = presets(*full)
+    elif not any((tuple(y), tuple(r)) == full for _, y, r in preset_list):
+        # Filtrlanmagan ko‘rinish (index.html) har doim bor
+        preset_list = [("Hammasi", *full), *preset_list]
+    manifest = {"format": FORMAT, "version": version, "presets": {}}
+    for name, year_range, rating_range in preset_list:
+        year_range, rating_range = tuple(year_range), tuple(rating_range)
+        page = slug(year_range, rating_range, (year_range, rating_range) == full)
+        manifest["presets"].setdefault(page, {
+            "name": name, "year_range": year_range, "rating_range": rating_range,
+            "inputs": inputs_hash(name, version, year_range, rating_range)})
+    previous = _read_manifest(out)
+    old = previous["presets"]
+    todo = [page for page, entry in manifest["presets"].items()
+            if force or old.get(page, {}).get("inputs") != entry["inputs"]
+            or not (out / f"{page}.html").exists()]
+
+    manifest["plotly"] = plotly.__version__
+    if previous.get("plotly") != plotly.__version__ or not (out / "plotly.min.js").exists():
+        from plotly.offline import get_plotlyjs
+
+        _write_atomic(out / "plotly.min.js", get_plotlyjs().encode())
+    if todo:
+        # spawn — precompute.py dagi kabi; har bir jarayon ma'lumotni bir marta yuklaydi
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(min(workers, len(todo)), mp_context=context,
+                                 initializer=_init, initargs=(str(csv_path),)) as pool:
+            futures = [pool.submit(_render, str(out), entry["name"], entry["year_range"],
+                                   entry["rating_range"], page)
+                       for page, entry in manifest["presets"].items() if page in todo]
+            for future in as_completed(futures):
+                future.result()
+    # Ro‘yxatdan chiqqan filtrlar sahifalari
+    for page in set(old) - set(manifest["presets"]):
+        (out / f"{page}.html").unlink(missing_ok=True)
+        shutil.rmtree(out / "data" / page, ignore_errors=True)
+    _write_atomic(out / "manifest.json", json.dumps(manifest, ensure_ascii=False).encode())
+    return len(todo), len(manifest["presets"]) - len(todo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=OUT_DIR)
+    parser.add_argument("--csv", default=CSV_PATH)
+    parser.add_argument("--preset", action="append", type=parse_preset,
+                        help="nom:y0-y1:r0-r1 (bir necha marta); berilmasa — precompute.presets()")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--force", action="store_true", help="hammasini qayta chizish")
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    rendered, unchanged = export(args.out, args.csv, args.preset, args.workers, args.force)
+    print(f"{args.out}: {rendered} ta sahifa chizildi, {unchanged} tasi o‘zgarmagan, "
+          f"{time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
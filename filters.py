@@ -0,0 +1,160 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+# IMDb reytingi 0.1 qadam bilan beriladi — reytingni butun "bucket"larga o‘tkazamiz
+RATING_SCALE = 10
+_EPS = 1e-9
+
+
+def rating_buckets(rating_range):
+    # Slayder qiymatlari (float) → ichiga tushadigan bucketlarning [b0, b1] oralig‘i
+    return (
+        int(np.ceil(rating_range[0] * RATING_SCALE - _EPS)),
+        int(np.floor(rating_range[1] * RATING_SCALE + _EPS)),
+    )
+
+
+@dataclass(frozen=True)
+class Selection:
+    rows: np.ndarray
+    count: int
+    rating_mean: float
+    votes_sum: int
+    per_year: pd.Series
+
+    def mask(self, n_rows):
+        mask = np.zeros(n_rows, dtype=bool)
+        mask[self.rows] = True
+        return mask
+
+
+@dataclass(frozen=True)
+class FilterEngine:
+    """Yil va reyting oralig‘i bo‘yicha filtr.
+
+    Qatorlar (Year, reyting bucket) bo‘yicha oldindan saralangan: har bir yil
+    ichida kerakli reyting oralig‘i uzluksiz bo‘lak bo‘ladi va ``searchsorted``
+    bilan topiladi. Soni, reytinglar va ovozlar yig‘indisi uchun 2D kumulyativ
+    jadval (prefix sum) saqlanadi — ko‘rsatkichlar O(1) da, yillar bo‘yicha
+    sonlar esa O(yillar soni) da hisoblanadi.
+    """
+
+    order: np.ndarray
+    keys: np.ndarray
+    min_year: int
+    min_bucket: int
+    n_years: int
+    n_buckets: int
+    counts: np.ndarray
+    ratings: np.ndarray
+    votes: np.ndarray
+
+    @classmethod
+    def build(cls, df):
+        rating = df["IMDb Rating"].to_numpy(dtype=np.float64)
+        valid = np.flatnonzero(~np.isnan(rating))
+        year = df["Year"].to_numpy()[valid].astype(np.int64)
+        bucket = np.rint(rating[valid] * RATING_SCALE).astype(np.int64)
+        votes = df["Num Votes"].to_numpy()[valid].astype(np.int64)
+
+        min_year, min_bucket = int(year.min()), int(bucket.min())
+        n_years = int(year.max()) - min_year + 1
+        n_buckets = int(bucket.max()) - min_bucket + 1
+        year_idx, bucket_idx = year - min_year, bucket - min_bucket
+
+        keys = year_idx * n_buckets + bucket_idx
+        order = np.argsort(keys, kind="stable")
+
+        def grid(weights):
+            cells = np.bincount(keys, weights=weights, minlength=n_years * n_buckets)
+            prefix = np.zeros((n_years + 1, n_buckets + 1), dtype=cells.dtype)
+            prefix[1:, 1:] = cells.reshape(n_years, n_buckets).cumsum(0).cumsum(1)
+            return prefix
+
+        return cls(
+            order=valid[order],
+            keys=keys[order],
+            min_year=min_year,
+            min_bucket=min_bucket,
+            n_years=n_years,
+            n_buckets=n_buckets,
+            counts=grid(None),
+            # Reyting yig‘indisi bucket (butun son) larda — aniq hisoblanadi
+            ratings=grid(bucket.astype(np.float64)),
+            votes=grid(votes.astype(np.float64)),
+        )
+
+    def _bounds(self, year_range, rating_range):
+        y0 = max(int(np.ceil(year_range[0])) - self.min_year, 0)
+        y1 = min(int(np.floor(year_range[1])) - self.min_year, self.n_years - 1)
+        b0, b1 = rating_buckets(rating_range)
+        b0 = max(b0 - self.min_bucket, 0)
+        b1 = min(b1 - self.min_bucket, self.n_buckets - 1)
+        return y0, y1, b0, b1
+
+    @staticmethod
+    def _box(prefix, y0, y1, b0, b1):
+        return prefix[y1 + 1, b1 + 1] - prefix[y0, b1 + 1] - prefix[y1 + 1, b0] + prefix[y0, b0]
+
+    def summary(self, year_range, rating_range):
+        # Faqat ko‘rsatkichlar: qatorlarga umuman tegilmaydi
+        return self._select(year_range, rating_range, with_rows=False)
+
+    def query(self, year_range, rating_range):
+        return self._select(year_range, rating_range, with_rows=True)
+
+    def _select(self, year_range, rating_range, with_rows):
+        y0, y1, b0, b1 = self._bounds(year_range, rating_range)
+        if y0 > y1 or b0 > b1:
+            empty = pd.Series([], dtype=np.int64, index=pd.Index([], name="Year"), name="count")
+            return Selection(np.array([], dtype=np.int64), 0, float("nan"), 0, empty)
+
+        count = int(self._box(self.counts, y0, y1, b0, b1))
+        rating_sum = self._box(self.ratings, y0, y1, b0, b1)
+        votes_sum = int(self._box(self.votes, y0, y1, b0, b1))
+        rating_mean = rating_sum / count / RATING_SCALE if count else float("nan")
+
+        # Har bir yil uchun alohida "qator" — kumulyativ jadvaldan ayirma
+        col = self.counts[:, b1 + 1] - self.counts[:, b0]
+        year_counts = np.diff(col[y0:y1 + 2]).astype(np.int64)
+        present = year_counts > 0
+        per_year = pd.Series(
+            year_counts[present],
+            index=pd.Index(np.arange(y0, y1 + 1)[present] + self.min_year, name="Year"),
+            name="count",
+        )
+
+        if not with_rows:
+            return Selection(None, count, rating_mean, votes_sum, per_year)
+
+        # Har bir yil ichidagi reyting oralig‘i — searchsorted bilan bo‘laklar
+        years = np.arange(y0, y1 + 1)
+        starts = np.searchsorted(self.keys, years * self.n_buckets + b0, side="left")
+        stops = np.searchsorted(self.keys, years * self.n_buckets + b1, side="right")
+        lengths = stops - starts
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        positions += np.arange(lengths.sum())
+        # Asl tartibni tiklaymiz — jadval va Top 10 natijalari o‘zgarmasligi uchun
+        rows = np.sort(self.order[positions])
+        return Selection(rows, count, rating_mean, votes_sum, per_year)
+
+
+def select_rows(df, rows):
+    """Tayyor qatorlar to‘plami uchun ``Selection`` (masalan, janr filtri qo‘llangandan keyin).
+
+    Ko‘rsatkichlar ``FilterEngine`` dagi kabi reyting bucketlaridan hisoblanadi.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    if not len(rows):
+        empty = pd.Series([], dtype=np.int64, index=pd.Index([], name="Year"), name="count")
+        return Selection(rows, 0, float("nan"), 0, empty)
+    rating = df["IMDb Rating"].to_numpy(dtype=np.float64)[rows]
+    bucket_sum = np.rint(rating * RATING_SCALE).sum()
+    votes = df["Num Votes"].to_numpy()[rows].astype(np.int64)
+    years, counts = np.unique(df["Year"].to_numpy()[rows].astype(np.int64), return_counts=True)
+    per_year = pd.Series(counts, index=pd.Index(years, name="Year"), name="count")
+    return Selection(rows, len(rows), bucket_sum / len(rows) / RATING_SCALE,
+                     int(votes.sum()), per_year)
@@ -0,0 +1,70 @@
+"""Janrlar bitmaski (loader.GENRE_MASK) ustida filtr va agregatlar.
+
+Har bir film janrlari bitta ``uint32``/``uint64`` sonda: ``i``-bit —
+``names[i]`` janri. Filtr satrlarni bo‘lmasdan, vektorlashgan bit amallari
+bilan bajariladi: "istalgan" (OR) — ``mask & tanlov != 0``, "barchasi"
+(AND) — ``mask & tanlov == tanlov``. Janrlar bo‘yicha sonlar ham har bir bit
+uchun ``bincount`` bilan hisoblanadi — explode qilingan jadval kerak emas.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from loader import GENRE_MASK
+from relations import bitmask
+
+
+@dataclass(frozen=True)
+class GenreSet:
+    names: np.ndarray
+    masks: np.ndarray
+
+    @classmethod
+    def build(cls, df):
+        # Nomlar compact() dagi bilan bir xil: barcha janrlar, alifbo tartibida
+        names = bitmask(pd.Series(df["Genres"].dropna().unique()))[1]
+        return cls(names=names, masks=df[GENRE_MASK].to_numpy())
+
+    def bits(self, genres):
+        lookup = {name: i for i, name in enumerate(self.names)}
+        return self.masks.dtype.type(sum(1 << lookup[g] for g in set(genres)))
+
+    def match(self, genres, mode="any", rows=None):
+        """``rows`` (yoki barcha qatorlar) ichidan tanlangan janrlarga mos qatorlar."""
+        masks = self.masks if rows is None else self.masks[rows]
+        selected = self.bits(genres)
+        hit = masks & selected
+        keep = hit == selected if mode == "all" else hit != 0
+        return np.flatnonzero(keep) if rows is None else rows[keep]
+
+    def _has(self, i, masks):
+        return ((masks >> masks.dtype.type(i)) & 1).astype(bool)
+
+    def counts(self, rows=None):
+        """Har bir janrdagi filmlar soni (``names`` tartibida)."""
+        masks = self.masks if rows is None else self.masks[rows]
+        return pd.Series(
+            [int(np.count_nonzero(self._has(i, masks))) for i in range(len(self.names))],
+            index=pd.Index(self.names, name="Genres"),
+        )
+
+    def top(self, k=5):
+        # Teng bo‘lsa — alifbo bo‘yicha oldingisi
+        return self.counts().nlargest(k).index
+
+    def year_counts(self, years):
+        """(Year, Genres, Movie Count) — Year, keyin janr bo‘yicha saralangan."""
+        years = np.asarray(years, dtype=np.int64)
+        lo = int(years.min()) if len(years) else 0
+        span = int(years.max()) - lo + 1 if len(years) else 0
+        grid = np.stack([
+            np.bincount(years[self._has(i, self.masks)] - lo, minlength=span)
+            for i in range(len(self.names))
+        ], axis=1) if len(self.names) else np.zeros((span, 0), dtype=np.int64)
+        year_idx, genre_idx = np.nonzero(grid)
+        return pd.DataFrame({
+            "Year": year_idx + lo,
+            "Genres": self.names[genre_idx],
+            "Movie Count": grid[year_idx, genre_idx],
+        })
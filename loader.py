@@ -0,0 +1,298 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from relations import bitmask
+
+
+CSV_PATH = "top_1000ta_kino.csv"
+CACHE_DIR = ".cache"
+
+# IMDb ro‘yxat eksportining to‘liq sxemasi (top_1000ta_kino.csv ustunlari)
+CSV_SCHEMA = [
+    "Position",
+    "Const",
+    "Created",
+    "Modified",
+    "Description",
+    "Title",
+    "Original Title",
+    "URL",
+    "Title Type",
+    "IMDb Rating",
+    "Runtime (mins)",
+    "Year",
+    "Genres",
+    "Num Votes",
+    "Release Date",
+    "Directors",
+]
+
+# Dashboard ishlatadigan ustunlar (CSV dagi tartibda).
+# Qolgan 9 ta ustun (Position, Const, URL, ...) umuman o‘qilmaydi.
+COLUMNS = {
+    "Title": "str",
+    "IMDb Rating": "float64",
+    "Runtime (mins)": "float64",
+    "Year": "int64",
+    "Genres": "str",
+    "Num Votes": "int64",
+    "Directors": "str",
+}
+# Scraper (scraper.py) yili yoki ovozlar soni topilmagan filmni bo‘sh qoldiradi.
+# Bu ustunlar avval nullable turda o‘qiladi, bo‘sh qatorlar esa tashlanadi —
+# ular yil filtri, kub va Top 10 larga baribir tushmaydi
+REQUIRED = ["Year", "Num Votes"]
+NULLABLE = {**COLUMNS, **{c: "Int64" for c in REQUIRED}}
+
+
+# Xotirada saqlanadigan ixcham turlar. Title — Arrow satrlari (pandas "str"),
+# takrorlanuvchi Genres/Directors — kategoriya (lug‘at kodlari), reyting 0.1
+# qadamli bo‘lgani uchun float32 da yo‘qotishsiz saqlanadi (restore() da yaxlitlanadi)
+COMPACT = {
+    "Title": "str",
+    "IMDb Rating": "float32",
+    "Runtime (mins)": "Int16",
+    "Year": "int16",
+    "Genres": "category",
+    "Num Votes": "int32",
+    "Directors": "category",
+}
+# Janrlar to‘plami bitta butun sonda (relations.bitmask) — filtrlar uchun
+GENRE_MASK = "Genre Mask"
+
+# Qidiruv va film sahifasi uchun — asosiy jadvalga kirmaydi, alohida o‘qiladi
+KEYS = ["Const", "Original Title"]
+
+
+def complete(frame):
+    """``REQUIRED`` ustunlari to‘ldirilgan qatorlar, shu ustunlar ``COLUMNS`` turlarida."""
+    keep = frame[REQUIRED].notna().all(axis=1)
+    return frame[keep].astype({c: COLUMNS[c] for c in REQUIRED}).reset_index(drop=True)
+
+
+def compact(df):
+    """Ixcham turlar + janrlar bitmaski; qiymatlar o‘zgarmaydi."""
+    out = df[list(COLUMNS)].astype(COMPACT)
+    out[GENRE_MASK] = bitmask(out["Genres"])[0]
+    return out
+
+
+def append_compact(frame, rows, order=None):
+    """Ixcham ``frame`` + ``rows`` (``COLUMNS`` turlarida) — ``compact()`` bilan bir xil natija.
+
+    Faqat ``rows`` o‘giriladi: kategoriyalar birlashtiriladi (alifbo tartibida,
+    eski qatorlar kodlari qayta raqamlanadi), janrlar bitmaski esa qatorlar emas,
+    kategoriyalar bo‘yicha hisoblanib kodlar orqali tarqatiladi. ``order`` —
+    natija qatorlari tartibi (``iloc``).
+    """
+    categorical = [c for c, t in COMPACT.items() if t == "category"]
+    head = frame[list(COLUMNS)].copy()
+    tail = rows[list(COLUMNS)].astype({c: t for c, t in COMPACT.items() if c not in categorical})
+    for column in categorical:
+        categories = head[column].cat.categories
+        new = pd.Index(tail[column].dropna().unique()).difference(categories)
+        if len(new):
+            categories = categories.append(new).sort_values()
+            head[column] = head[column].cat.set_categories(categories)
+        tail[column] = pd.Categorical(tail[column], categories=categories)
+    out = pd.concat([head, tail], ignore_index=True)
+    if order is not None:
+        out = out.iloc[order].reset_index(drop=True)
+    for column in categorical:
+        # O‘chirilgan qatorlardan qolgan kategoriyalar (np.unique o‘rniga bincount — saralashsiz)
+        values = out[column]
+        codes = values.cat.codes.to_numpy()
+        used = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories)) > 0
+        if not used.all():
+            out[column] = values.cat.remove_categories(values.cat.categories[~used])
+    genres = out["Genres"]
+    masks = bitmask(pd.Series(genres.cat.categories, dtype=object))[0]
+    # Bo‘sh janr (kod -1) — oxirgi, nol niqob
+    out[GENRE_MASK] = np.append(masks, masks.dtype.type(0))[genres.cat.codes.to_numpy()]
+    return out
+
+
+def restore(frame, columns=None):
+    """Ko‘rsatish uchun asl turlar (COLUMNS) — jadval va grafiklar avvalgidek chiqadi."""
+    columns = [c for c in (columns or COLUMNS) if c in frame.columns]
+    out = frame[columns].astype({c: COLUMNS[c] for c in columns})
+    if "IMDb Rating" in out:
+        out["IMDb Rating"] = out["IMDb Rating"].round(1)
+    return out
+
+
+def memory_report(before, after):
+    """Har bir ustun xotirasi (MB): oldin, keyin va nisbat."""
+    mb = lambda df: df.memory_usage(index=False, deep=True) / 2**20
+    columns = list(dict.fromkeys([*before.columns, *after.columns]))
+    report = pd.DataFrame({"before_mb": mb(before), "after_mb": mb(after)}).reindex(columns)
+    report = report.fillna(0.0)
+    report.loc["total"] = report.sum()
+    report["ratio"] = report["before_mb"] / report["after_mb"]
+    return report.round(3)
+
+
+def _sha256(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cache_paths(csv_path, cache_dir):
+    stem = Path(csv_path).stem
+    return Path(cache_dir) / f"{stem}.arrow", Path(cache_dir) / f"{stem}.json"
+
+
+def _read_meta(meta_path):
+    try:
+        return json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path, write):
+    # Avval vaqtinchalik faylga yozamiz, keyin almashtiramiz —
+    # parallel ishga tushgan replikalar yarim yozilgan keshni o‘qimasligi uchun
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_meta(meta_path, meta):
+    try:
+        _write_atomic(meta_path, lambda p: p.write_text(json.dumps(meta)))
+    except OSError:
+        pass
+
+
+def _keys_path(arrow_path):
+    # Qidiruv kalitlari — asosiy kesh yonida, o‘sha meta (mtime/hajm/SHA-256) ostida
+    return arrow_path.with_name(f"{arrow_path.stem}.keys.arrow")
+
+
+def _fresh(meta, stat, csv_path, meta_path):
+    """``(mos, sha256)``: meta shu CSV nikimi. mtime o‘zgarib, mazmun
+    o‘zgarmagan bo‘lsa (masalan ``touch``), meta yangi mtime bilan qayta yoziladi."""
+    if meta["mtime_ns"] == stat.st_mtime_ns and meta["size"] == stat.st_size:
+        return True, meta["sha256"]
+    sha256 = _sha256(csv_path)
+    if meta["sha256"] != sha256:
+        return False, sha256
+    meta.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+    _write_meta(meta_path, meta)
+    return True, sha256
+
+
+def read_csv(csv_path=CSV_PATH, keys=False):
+    # Faqat kerakli ustunlarni, aniq turlar bilan o‘qiymiz; keys=True — KEYS ham shu o‘tishda
+    usecols = [*KEYS, *COLUMNS] if keys else list(COLUMNS)
+    dtype = {**dict.fromkeys(KEYS, "str"), **NULLABLE} if keys else NULLABLE
+    return complete(pd.read_csv(csv_path, usecols=usecols, dtype=dtype))
+
+
+def read_keys(csv_path=CSV_PATH):
+    # IMDb identifikatori va asl nom — qatorlar tartibi read_csv() bilan bir xil
+    # (o‘sha to‘liq bo‘lmagan qatorlar tashlanadi)
+    dtype = {**dict.fromkeys(KEYS, "str"), **{c: NULLABLE[c] for c in REQUIRED}}
+    return complete(pd.read_csv(csv_path, usecols=[*KEYS, *REQUIRED], dtype=dtype))[KEYS]
+
+
+def read_cache(arrow_path):
+    # Arrow IPC fayli xotiraga map qilinadi (nusxa ko‘chirmasdan o‘qiladi)
+    with pa.memory_map(str(arrow_path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas()
+
+
+def _write_feather(path, df):
+    # Siqilmagan holda yozamiz, aks holda memory-map foyda bermaydi
+    _write_atomic(path, lambda p: feather.write_feather(df, p, compression="uncompressed"))
+
+
+def load_movies(csv_path=CSV_PATH, cache_dir=CACHE_DIR, shared=None):
+    """CSV ni ustunli keshdan yuklaydi, kesh eskirgan bo‘lsa qayta quradi.
+
+    Kesh kaliti — CSV ning mtime/hajmi va SHA-256 xeshi. mtime o‘zgarib,
+    mazmun o‘zgarmagan bo‘lsa (masalan ``touch``), kesh qayta ishlatiladi.
+    Natija: ``(df, version)``, bu yerda ``version`` — ma'lumotlar versiyasi,
+    ``df`` esa ixcham turlarda (``compact()``). ``shared`` — ``cache.SharedCache``:
+    mahalliy kesh yo‘q bo‘lsa, CSV boshqa host allaqachon o‘qigan jadvaldan olinadi.
+    CSV o‘qilganda ``KEYS`` ham shu o‘tishda olinib, yonma-yon keshga yoziladi
+    (``load_keys``).
+    """
+    arrow_path, meta_path = _cache_paths(csv_path, cache_dir)
+    stat = os.stat(csv_path)
+    meta = _read_meta(meta_path)
+    columns = list(COLUMNS)
+
+    # Kesh ixcham turlarda saqlanadi — turlar o‘zgarsa kesh qayta quriladi
+    if (meta and meta.get("columns") == columns and meta.get("dtypes") == COMPACT
+            and arrow_path.exists()):
+        fresh, sha256 = _fresh(meta, stat, csv_path, meta_path)
+        if fresh:
+            return read_cache(arrow_path), sha256[:12]
+    else:
+        sha256 = _sha256(csv_path)
+
+    key = ("movies", sha256, columns, COMPACT)
+    df = shared.load(key) if shared is not None else None
+    keys = None
+    if df is None:
+        frame = read_csv(csv_path, keys=True)
+        df, keys = compact(frame), frame[KEYS]
+        if shared is not None:
+            shared.save(key, df)
+    meta = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": sha256,
+        "columns": columns,
+        "dtypes": COMPACT,
+        # Jadval umumiy keshdan olingan bo‘lsa kalitlar yo‘q — load_keys o‘zi o‘qiydi
+        "keys": KEYS if keys is not None else None,
+    }
+    try:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        _write_feather(arrow_path, df)
+        if keys is not None:
+            _write_feather(_keys_path(arrow_path), keys)
+        _write_atomic(meta_path, lambda p: p.write_text(json.dumps(meta)))
+    except OSError:
+        # Faqat o‘qish mumkin bo‘lgan muhitda keshsiz ishlayveramiz
+        pass
+    return df, sha256[:12]
+
+
+def load_keys(csv_path=CSV_PATH, cache_dir=CACHE_DIR):
+    """``KEYS`` ustunlari ``load_movies`` qatorlari tartibida — qidiruv va film sahifasi uchun.
+
+    Asosiy kesh bilan bir xil kalit ostidagi ``.keys.arrow`` dan o‘qiladi. U yo‘q
+    bo‘lsa (jadval umumiy keshdan olingan), CSV dan faqat shu ustunlar o‘qilib,
+    keshga yoziladi — keyingi replikalar CSV ni qayta ochmaydi.
+    """
+    arrow_path, meta_path = _cache_paths(csv_path, cache_dir)
+    keys_path = _keys_path(arrow_path)
+    meta = _read_meta(meta_path)
+    fresh = False
+    if meta and meta.get("columns") == list(COLUMNS) and meta.get("dtypes") == COMPACT:
+        fresh, _ = _fresh(meta, os.stat(csv_path), csv_path, meta_path)
+    if fresh and meta.get("keys") == KEYS and keys_path.exists():
+        return read_cache(keys_path)
+    keys = read_keys(csv_path)
+    if fresh:
+        meta["keys"] = KEYS
+        try:
+            _write_feather(keys_path, keys)
+        except OSError:
+            return keys
+        _write_meta(meta_path, meta)
+    return keys
@@ -0,0 +1,170 @@
+"""IMDb ro‘yxat sahifasidan filmlarni bir o‘tishda ajratib olish.
+
+Sahifada ``__NEXT_DATA__`` (Next.js JSON) bo‘lsa — undan o‘qiladi: u yerda
+aniq ovozlar soni va asl nom ham bor. Aks holda lxml daraxti ustida oldindan
+kompilyatsiya qilingan XPath ifodalari ishlatiladi (BeautifulSoup dagi har bir
+maydon uchun alohida ``.find(...)`` o‘rniga). Ko‘p sahifalar jarayonlar
+hovuzida parallel tahlil qilinadi.
+"""
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree, html as lxml_html
+
+
+# ------------------------------------------------------------ yordamchilar
+
+def runtime_minutes(text):
+    # "2h 55m" → 175
+    hours = re.search(r"(\d+)\s*h", text)
+    minutes = re.search(r"(\d+)\s*m", text)
+    if not hours and not minutes:
+        return None
+    return (int(hours.group(1)) * 60 if hours else 0) + (int(minutes.group(1)) if minutes else 0)
+
+
+def vote_count(text):
+    # " (2.2M)" → 2200000 (HTML da ovozlar qisqartirilgan ko‘rinishda)
+    match = re.search(r"([\d.,]+)\s*([KM]?)", text)
+    if not match:
+        return None
+    number = float(match.group(1).replace(",", ""))
+    return int(round(number * {"": 1, "K": 1e3, "M": 1e6}[match.group(2)]))
+
+
+def _class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Har bir film elementi uchun nisbiy ifodalar — bir marta kompilyatsiya qilinadi
+_ITEMS = etree.XPath(f"//li[{_class('ipc-metadata-list-summary-item')}]")
+_HEADING = etree.XPath(f"string(.//h3[{_class('ipc-title__text')}])")
+_HREF = etree.XPath(f"string(.//a[{_class('ipc-title-link-wrapper')}]/@href)")
+_METADATA = etree.XPath(f".//span[{_class('dli-title-metadata-item')}]/text()")
+_RATING = etree.XPath(f"string(.//span[{_class('ipc-rating-star--rating')}])")
+_VOTES = etree.XPath(f"string(.//span[{_class('ipc-rating-star--voteCount')}])")
+_PLOT = etree.XPath(f"string(.//div[{_class('ipc-html-content-inner-div')}])")
+_DIRECTORS = etree.XPath(
+    ".//span[normalize-space(text())='Director' or normalize-space(text())='Directors']"
+    "/following-sibling::span//a/text()"
+)
+# Janrlar: yangi kartalarda "chip" lar, eski ro‘yxatlarda "Crime, Drama" satri
+_GENRES = etree.XPath(
+    f".//span[{_class('ipc-chip__text')}]/text() | .//span[{_class('genre')}]/text()"
+)
+_NEXT_DATA = etree.XPath("//script[@id='__NEXT_DATA__']/text()")
+
+
+def _parse_item(item):
+    position, _, title = _HEADING(item).partition(". ")
+    const = re.search(r"tt\d+", _HREF(item))
+    # Havolasiz yoki tartib raqamisiz karta (reklama, chala yuklangan element) —
+    # butun sahifani yiqitmasdan o‘tkazib yuboriladi
+    if not const or not position.strip().isdigit():
+        return None
+    const = const.group(0)
+    metadata = _METADATA(item)
+    rating, votes, plot = _RATING(item), _VOTES(item), _PLOT(item)
+    directors = _DIRECTORS(item)
+    genres = (g.strip() for text in _GENRES(item) for g in text.split(","))
+    return {
+        "Position": int(position),
+        "Const": const,
+        "Title": title.strip(),
+        "URL": f"https://www.imdb.com/title/{const}/",
+        "Year": int(metadata[0]) if metadata and metadata[0].isdigit() else None,
+        "Runtime (mins)": runtime_minutes(metadata[1]) if len(metadata) > 1 else None,
+        "IMDb Rating": float(rating) if rating else None,
+        "Num Votes": vote_count(votes) if votes else None,
+        "Genres": ", ".join(dict.fromkeys(g for g in genres if g)) or None,
+        "Description": plot or None,
+        "Directors": ", ".join(directors) or None,
+    }
+
+
+# ------------------------------------------------------------ __NEXT_DATA__
+
+def _get(node, *path):
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+def _title_nodes(node):
+    # Sahifa tuzilmasi o‘zgarib turadi — "tt..." id li va titleText li obyektlarni qidiramiz
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if str(node.get("id", "")).startswith("tt") and "titleText" in node:
+                yield node
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _directors(node):
+    names = []
+    for group in node.get("principalCredits") or []:
+        if _get(group, "category", "id") == "director":
+            names += [_get(c, "name", "nameText", "text") for c in group.get("credits") or []]
+    for credit in _get(node, "directors", 0, "credits") or []:
+        names.append(_get(credit, "name", "nameText", "text"))
+    return ", ".join(dict.fromkeys(n for n in names if n)) or None
+
+
+def _release_date(node):
+    date = node.get("releaseDate") or {}
+    if not all(date.get(k) for k in ("year", "month", "day")):
+        return None
+    return f"{date['year']:04d}-{date['month']:02d}-{date['day']:02d}"
+
+
+def _parse_json(data):
+    movies = []
+    for position, node in enumerate(_title_nodes(data), start=1):
+        runtime = _get(node, "runtime", "seconds")
+        genres = [_get(g, "genre", "text") for g in _get(node, "titleGenres", "genres") or []]
+        movies.append({
+            "Position": position,
+            "Const": node["id"],
+            "Title": _get(node, "titleText", "text"),
+            "Original Title": _get(node, "originalTitleText", "text"),
+            "URL": f"https://www.imdb.com/title/{node['id']}/",
+            "Title Type": _get(node, "titleType", "text"),
+            "Year": _get(node, "releaseYear", "year"),
+            "Runtime (mins)": runtime // 60 if runtime else None,
+            "IMDb Rating": _get(node, "ratingsSummary", "aggregateRating"),
+            "Num Votes": _get(node, "ratingsSummary", "voteCount"),
+            "Genres": ", ".join(g for g in genres if g) or None,
+            "Release Date": _release_date(node),
+            "Description": _get(node, "plot", "plotText", "plainText"),
+            "Directors": _directors(node),
+        })
+    return movies
+
+
+# ----------------------------------------------------------------- API
+
+def parse_page(page):
+    tree = lxml_html.fromstring(page)
+    scripts = _NEXT_DATA(tree)
+    if scripts:
+        movies = _parse_json(json.loads(scripts[0]))
+        if movies:
+            return movies
+    movies = (_parse_item(item) for item in _ITEMS(tree))
+    return [movie for movie in movies if movie is not None]
+
+
+def parse_pages(pages, workers=None, chunksize=4):
+    # Sahifalar partiyasi — jarayonlar hovuzida (lxml GIL ni to‘liq qo‘yib yubormaydi)
+    pages = list(pages)
+    if len(pages) <= 1 or workers == 1:
+        return [parse_page(page) for page in pages]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(parse_page, pages, chunksize=chunksize))
@@ -0,0 +1,166 @@
+"""Og‘ir tahlillarni oldindan hisoblash — ma'lumotlar yuklangan/yangilangandan keyin.
+
+Filtrlanmagan ko‘rinish va ``presets()`` dagi tez-tez ishlatiladigan filtrlar
+uchun barcha jadval bo‘limlari (``aggregates.SECTIONS``) va matplotlib
+grafiklari (KDE li reyting gistogrammasi ham) jarayonlar pulida hisoblanadi
+va umumiy keshga (cache.py) dashboard bilan bir xil kalitlar ostida
+yoziladi. Dashboard ularni birinchi so‘rovdayoq keshdan o‘qiydi.
+
+Dashboard yangi ma'lumotlar versiyasini ko‘rganda buni alohida jarayonda
+o‘zi ishga tushiradi (``IMDB_PRECOMPUTE=0`` — o‘chirish). Holat
+``.cache/precompute.json`` da — yon paneldagi ko‘rsatkich shundan o‘qiydi.
+
+    python precompute.py                      # top_1000ta_kino.csv
+    python precompute.py --workers 4 --csv boshqa.csv
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from aggregates import SECTIONS, Snapshot, chart_data, section_key
+from cache import SharedCache, open_backend
+from charts import CHART_BACKEND, RENDERERS
+from loader import CACHE_DIR, CSV_PATH, load_movies
+from sections import sized
+
+
+PRECOMPUTE = os.environ.get("IMDB_PRECOMPUTE", "1") not in ("", "0")
+WORKERS = int(os.environ.get("IMDB_PRECOMPUTE_WORKERS", os.cpu_count() or 1))
+STATUS_PATH = Path(CACHE_DIR) / "precompute.json"
+# Holat shu muddatdan beri yangilanmagan bo‘lsa — jarayon o‘lgan deb hisoblanadi
+STALE_SECONDS = 300
+
+
+def presets(year_range, rating_range):
+    """Tez-tez tanlanadigan filtrlar (yon paneldagi "Tayyor filtrlar"):
+    ``(nom, yil oralig‘i, reyting oralig‘i)``, to‘liq oraliqlardan."""
+    (y0, y1), (r0, r1) = year_range, rating_range
+    out = [("Hammasi", year_range, rating_range)]
+    out.append(("Reyting 8.0+", year_range, (max(r0, 8.0), r1)))
+    out.append(("So‘nggi 20 yil", (max(y0, y1 - 19), y1), rating_range))
+    for decade in range(y0 // 10 * 10, y1 + 1, 10):
+        out.append((f"{decade}-yillar", (max(y0, decade), min(y1, decade + 9)), rating_range))
+    return out
+
+
+def tasks(snap):
+    """``(tur, nom, yil oralig‘i, reyting oralig‘i)`` — filtrga bog‘liq bo‘lmaganlari bir marta."""
+    out = [("section", name, None, None) for name, (_, filtered, _) in SECTIONS.items()
+           if not filtered]
+    for _, year_range, rating_range in presets(snap.year_range, snap.rating_range):
+        out += [("section", name, year_range, rating_range)
+                for name, (_, filtered, _) in SECTIONS.items() if filtered]
+        # Plotly grafiklari oldindan binlangan ma'lumotdan tez chiziladi va
+        # ``bytes`` emas — faqat matplotlib PNG lari oldindan chiziladi
+        if CHART_BACKEND == "matplotlib":
+            out += [("chart", chart_id, year_range, rating_range)
+                    for chart_id in RENDERERS["matplotlib"]]
+    return out
+
+
+_worker = {}
+
+
+def _init(csv_path):
+    # Har bir jarayon ma'lumotni bir marta yuklaydi (Arrow keshdan, memory-map)
+    df, version = load_movies(csv_path)
+    _worker["snap"] = Snapshot.build(df, version)
+    _worker["cache"] = SharedCache(open_backend())
+
+
+def _run(task):
+    kind, name, year_range, rating_range = task
+    snap, cache = _worker["snap"], _worker["cache"]
+    if kind == "chart":
+        # app.py dagi ``grafik()`` kaliti: (chart_id, backend, *FILTERS)
+        key = (name, CHART_BACKEND, snap.version, year_range, rating_range, None)
+        cache.get(key, lambda: RENDERERS["matplotlib"][name](
+            chart_data(snap, name, year_range, rating_range)))
+        return task
+    section, _, create = SECTIONS[name]
+    key = section_key(section, snap.version, year_range, rating_range)
+    cache.get(key, lambda: sized(create(snap, year_range, rating_range)))
+    return task
+
+
+def read_status(path=STATUS_PATH):
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_status(path, **state):
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({**state, "updated": time.time()}))
+    os.replace(tmp, path)
+
+
+def is_running(state, version):
+    return (state is not None and state["version"] == version and not state["finished"]
+            and time.time() - state["updated"] < STALE_SECONDS)
+
+
+def run(csv_path=CSV_PATH, workers=WORKERS, status_path=STATUS_PATH):
+    """Barcha vazifalarni pulda bajaradi, holatni ``status_path`` ga yozib boradi."""
+    if open_backend() is None:
+        raise SystemExit("IMDB_CACHE=off — natijalarni saqlash uchun umumiy kesh kerak")
+    df, version = load_movies(csv_path)
+    todo = tasks(Snapshot.build(df, version))
+    del df
+    state = {"version": version, "total": len(todo), "done": 0, "failed": 0,
+             "started": time.time(), "finished": False, "pid": os.getpid()}
+    _write_status(status_path, **state)
+    # spawn — Streamlit oqimlaridan fork qilish xavfsiz emas
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init,
+                             initargs=(str(csv_path),)) as pool:
+        futures = [pool.submit(_run, task) for task in todo]
+        for future in as_completed(futures):
+            state["done" if future.exception() is None else "failed"] += 1
+            _write_status(status_path, **state)
+    state["finished"] = True
+    _write_status(status_path, **state)
+    return state
+
+
+def launch(version, csv_path=CSV_PATH, status_path=STATUS_PATH):
+    """Dashboard uchun: ``version`` hali hisoblanmagan bo‘lsa, alohida jarayonda ishga tushiradi."""
+    state = read_status(status_path)
+    if state is not None and state["version"] == version and (
+            state["finished"] or is_running(state, version)):
+        return False
+    # Boshqa replika bilan poyga bo‘lsa, ikkinchisi keshdan o‘qib tez tugaydi
+    _write_status(status_path, version=version, total=0, done=0, failed=0,
+                  started=time.time(), finished=False, pid=None)
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "--csv", str(Path(csv_path).resolve()),
+         "--status", str(status_path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default=CSV_PATH)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--status", default=STATUS_PATH)
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    state = run(args.csv, args.workers, args.status)
+    print(f"{state['version']}: {state['done']}/{state['total']} tayyor, "
+          f"{state['failed']} xato, {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
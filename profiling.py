@@ -0,0 +1,127 @@
+"""Dashboard bo‘limlarini o‘lchash: vaqt, CPU, xotira ajratish va brauzerga yuborilgan hajm.
+
+``IMDB_PROFILE=1`` yoki ``?profile=1`` bilan yoqiladi. Skript bo‘limlarga
+``Profiler.section(nom)`` belgilari bilan bo‘linadi — har bir belgi oldingi
+bo‘limni yopib, yangisini boshlaydi (kodni qayta indentatsiya qilish shart emas).
+Har bir bo‘lim uchun:
+
+- ``wall_ms`` — haqiqiy vaqt, ``cpu_ms`` — joriy oqimning CPU vaqti;
+- ``alloc_kb`` — tracemalloc bo‘yicha bo‘lim davomidagi eng yuqori qo‘shimcha xotira;
+- ``payload_kb`` — bo‘lim frontendga yuborgan ForwardMsg lar hajmi (``st.image``
+  rasmlari xabarga kirmaydi, ular alohida media URL orqali yuklanadi).
+
+tracemalloc butun jarayon uchun umumiy: bir vaqtda bir nechta sessiya
+ishlasa, ``alloc_kb`` boshqa sessiyalar ajratgan xotirani ham o‘z ichiga oladi.
+Natijalar JSON lines fayliga yoziladi (``IMDB_PROFILE_LOG``) — turli
+deploylar orasidagi regressiyalarni solishtirish uchun.
+"""
+import json
+import os
+import socket
+import time
+import tracemalloc
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from loader import CACHE_DIR
+
+
+PROFILE = os.environ.get("IMDB_PROFILE", "") not in ("", "0")
+PROFILE_LOG = Path(os.environ.get("IMDB_PROFILE_LOG", Path(CACHE_DIR) / "profile.jsonl"))
+
+
+@dataclass
+class SectionTiming:
+    section: str
+    wall_ms: float
+    cpu_ms: float
+    alloc_kb: float
+    payload_kb: float
+
+
+class Profiler:
+    """Bitta qayta chizish (rerun) bo‘limlarining o‘lchovlari."""
+
+    def __init__(self, enabled, ctx=None):
+        self.enabled = enabled
+        self.records = []
+        self.run_id = uuid.uuid4().hex[:12]
+        self._current = None
+        self._payload = 0
+        self._restore = None
+        if not enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._hook(ctx)
+
+    def _hook(self, ctx):
+        # Streamlit ning ichki navbatini o‘rab, yuborilgan xabarlar hajmini sanaymiz
+        enqueue = getattr(ctx, "_enqueue", None)
+        if enqueue is None:
+            return
+        # Oldingi rerun xato bilan tugab, o‘ram qolib ketgan bo‘lsa — asl funksiya
+        enqueue = getattr(enqueue, "__wrapped__", enqueue)
+
+        def counting(msg):
+            self._payload += msg.ByteSize()
+            enqueue(msg)
+
+        counting.__wrapped__ = enqueue
+        ctx._enqueue = counting
+        self._restore = lambda: setattr(ctx, "_enqueue", enqueue)
+
+    def section(self, name):
+        if not self.enabled:
+            return
+        self._close()
+        tracemalloc.reset_peak()
+        self._current = (
+            name,
+            time.perf_counter(),
+            time.thread_time(),
+            tracemalloc.get_traced_memory()[0],
+            self._payload,
+        )
+
+    def _close(self):
+        if self._current is None:
+            return
+        name, wall, cpu, memory, payload = self._current
+        self.records.append(SectionTiming(
+            section=name,
+            wall_ms=(time.perf_counter() - wall) * 1e3,
+            cpu_ms=(time.thread_time() - cpu) * 1e3,
+            alloc_kb=max(tracemalloc.get_traced_memory()[1] - memory, 0) / 1024,
+            payload_kb=(self._payload - payload) / 1024,
+        ))
+        self._current = None
+
+    def stop(self):
+        """Oxirgi bo‘limni yopadi va o‘lchovlar ro‘yxatini qaytaradi."""
+        if self.enabled:
+            self._close()
+            if self._restore:
+                self._restore()
+            self.enabled = False
+        return self.records
+
+    def lines(self, **meta):
+        """Har bir bo‘lim — bitta JSON qator (vaqt, host, run id va ``meta`` bilan)."""
+        stamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        base = {"ts": stamp, "host": socket.gethostname(), "run": self.run_id, **meta}
+        return "".join(
+            json.dumps({**base, **asdict(r)}, ensure_ascii=False) + "\n" for r in self.records
+        )
+
+    def export(self, path=PROFILE_LOG, **meta):
+        try:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as f:
+                f.write(self.lines(**meta))
+        except OSError:
+            # Faqat o‘qish mumkin bo‘lgan muhitda faqat panelda ko‘rsatamiz
+            pass
@@ -0,0 +1,174 @@
+"""Rejissyorlar va janrlar reytingi: Bayes (WR) reytingi va bootstrap ishonch oraliqlari.
+
+Oddiy o‘rtacha bitta filmli rejissyorlarni yuqoriga chiqaradi. IMDb Top 250
+dagi kabi og‘irlangan reyting guruh o‘rtachasini umumiy o‘rtachaga tortadi::
+
+    WR = v / (v + m) · R + m / (v + m) · C
+
+``v`` — guruhdagi reytingli filmlar soni, ``R`` — guruh o‘rtachasi, ``C`` —
+filtrlangan barcha bog‘lanishlar o‘rtachasi, ``m`` — guruh hajmlarining
+``PRIOR_QUANTILE`` kvantili (90% — keng tarqalgan tanlov).
+
+Ishonch oralig‘i — percentile bootstrap: har bir guruh filmlaridan
+``BOOTSTRAP_REPS`` marta qaytarib tanlab, o‘rtachalar taqsimoti. Hamma guruhlar
+bir vaqtda hisoblanadi — sikl guruhlar bo‘yicha emas, faqat xotira bloklari bo‘yicha:
+
+- 2–3 filmli guruhlar (rejissyorlarning ko‘pchiligi) — barcha ``n^n`` qayta
+  tanlov sanab chiqiladi, tasodifiy tanlovsiz aniq taqsimot;
+- kichik guruhlar — har bir tanlov pozitsiyasi uchun bitta tasodifiy indeks
+  (guruh boshi + ``floor(u · n)``), yig‘indilar bitta ``np.bincount`` bilan;
+- katta guruhlar (``LARGE`` dan ko‘p film, masalan janrlar) — reyting
+  bucketlari gistogrammasidan multinomial tanlov: narxi film soniga bog‘liq emas;
+- bitta filmli guruhlarda oraliq yo‘q (NaN): qayta tanlash o‘sha qiymatni beradi,
+  nol uzunlikdagi oraliq esa reytingni aniq qilib ko‘rsatardi.
+
+Xotira ``BLOCK`` elementli bloklar bilan chegaralangan. Natija deterministik
+(sobit ``seed``) — umumiy keshda (cache.py) replikalar bir xil natija beradi.
+Kirish — kub yacheykalari kabi (guruh, reyting bucket, filmlar soni)
+gistogrammasi: ``Cube.group_ratings`` va ``Warehouse.group_ratings``.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from filters import RATING_SCALE
+
+
+# m — guruh hajmlarining shu kvantili (IMDb ``m`` — "kamida shuncha ovoz")
+PRIOR_QUANTILE = float(os.environ.get("IMDB_WR_QUANTILE", 0.9))
+# Bootstrap takrorlari soni
+BOOTSTRAP_REPS = int(os.environ.get("IMDB_BOOTSTRAP_REPS", 200))
+LEVEL = 0.95
+# Shuncha va undan kam filmli guruhlarda barcha n^n qayta tanlov sanab chiqiladi
+# (3 filmda 27 ta — 200 ta tasodifiy takrordan arzon va aniq)
+EXACT = 3
+# Shundan ko‘p filmli guruhlar multinomial bilan: bitta multinomial (~90 bucket)
+# taxminan 500 ta tasodifiy tanlov narxida
+LARGE = 500
+# Bitta blokdagi tasodifiy sonlar (takrorlar × tanlovlar) chegarasi
+BLOCK = 1 << 22
+
+COLUMNS = ["movie_count", "avg_rating", "ci_low", "ci_high", "wr", "wr_low", "wr_high"]
+
+
+def _blocks(sizes, limit):
+    # Ketma-ket guruhlar bo‘laklari: har birida ``sizes`` yig‘indisi ≈ limit (kamida bitta guruh)
+    ends = np.cumsum(sizes)
+    start = 0
+    while start < len(sizes):
+        stop = int(np.searchsorted(ends, ends[start] - sizes[start] + limit, side="right"))
+        stop = max(stop, start + 1)
+        yield start, stop
+        start = stop
+
+
+def _resampled_exact(values, starts, n):
+    # Barcha n^n ta tartiblangan qayta tanlov teng ehtimolli — aniq bootstrap taqsimoti
+    tuples = np.indices((n,) * n).reshape(n, -1)
+    for g0, g1 in _blocks(np.full(len(starts), tuples.size), BLOCK):
+        sums = values[starts[g0:g1, None, None] + tuples].sum(axis=1, dtype=np.int64)
+        yield g0, g1, sums.T / n
+
+
+def _resampled_small(values, starts, sizes, reps, rng):
+    # (takrorlar, guruhlar) o‘rtachalari: values[starts[g] : starts[g] + sizes[g]] dan qaytarib tanlash
+    for g0, g1 in _blocks(sizes, max(BLOCK // reps, 1)):
+        n = sizes[g0:g1]
+        group = np.repeat(np.arange(g1 - g0), n)
+        # float32 va int32 — bir blokda millionlab element, xotira o‘tishlari kamroq
+        picks = rng.random((reps, len(group)), dtype=np.float32)
+        picks *= n[group].astype(np.float32)
+        picks = picks.astype(np.int32)
+        picks += starts[g0:g1][group]
+        # Guruhlar 2–3 filmli bo‘lganda reduceat dan tezroq: (takror, guruh) bo‘yicha bitta bincount
+        cell = (np.arange(reps)[:, None] * (g1 - g0) + group).ravel()
+        sums = np.bincount(cell, weights=values[picks].ravel(), minlength=reps * (g1 - g0))
+        yield g0, g1, sums.reshape(reps, g1 - g0) / n
+
+
+def _resampled_large(histogram, sizes, reps, rng):
+    # histogram — (guruhlar, bucketlar) sonlari; har bir takror — multinomial(n, p)
+    buckets = np.arange(histogram.shape[1], dtype=np.float64)
+    for g0, g1 in _blocks(np.full(len(sizes), histogram.shape[1]), max(BLOCK // reps, 1)):
+        n = sizes[g0:g1]
+        draws = rng.multinomial(n, histogram[g0:g1] / n[:, None], size=(reps, g1 - g0))
+        yield g0, g1, (draws @ buckets) / n
+
+
+def _percentiles(means, q):
+    # np.quantile(means, q, axis=0, method="inverted_cdf") — aniq taqsimotda ham
+    # tasodifiy takrorlar chegarasi bilan bir xil; to‘liq saralash partition dan tezroq
+    ordered = np.sort(means, axis=0)
+    position = np.ceil(np.asarray(q) * len(ordered) - 1e-9).astype(np.int64) - 1
+    return ordered[np.clip(position, 0, len(ordered) - 1)]
+
+
+def group_ratings(codes, buckets, counts, prior_quantile=PRIOR_QUANTILE,
+                  reps=BOOTSTRAP_REPS, level=LEVEL, seed=0):
+    """(guruh kodi, reyting bucketi, filmlar soni) gistogrammasidan guruhlar jadvali.
+
+    Kodlar bo‘yicha saralangan jadval qaytadi (``COLUMNS`` ustunlari, indeks —
+    kodlar); reytinglar 0–10 shkalada. Bitta filmli guruhlarda oraliq chegaralari NaN.
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    buckets = np.asarray(buckets, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.int64)
+    order = np.lexsort((buckets, codes))
+    codes, buckets, counts = codes[order], buckets[order], counts[order]
+    groups, cell_group = np.unique(codes, return_inverse=True)
+    sizes = np.bincount(cell_group, weights=counts, minlength=len(groups)).astype(np.int64)
+    sums = np.bincount(cell_group, weights=buckets * counts, minlength=len(groups))
+    if not len(groups):
+        return pd.DataFrame({c: np.array([], dtype=np.int64 if c == "movie_count" else np.float64)
+                             for c in COLUMNS}, index=groups)
+    mean = sums / sizes
+    overall = sums.sum() / sizes.sum()
+    prior = float(np.quantile(sizes, prior_quantile))
+
+    # Bitta filmli guruhlarda bootstrap tarqalishni baholay olmaydi — oraliq NaN
+    low, high = np.full(len(groups), np.nan), np.full(len(groups), np.nan)
+    rng = np.random.default_rng(seed)
+    q = [(1 - level) / 2, (1 + level) / 2]
+    # Filmlar guruh tartibida: g-guruh values[starts[g] : starts[g] + sizes[g]]
+    values = np.repeat(buckets, counts).astype(np.int16)
+    starts = (np.cumsum(sizes) - sizes).astype(np.int32)
+    for n in range(2, EXACT + 1):
+        same = np.flatnonzero(sizes == n)
+        for g0, g1, means in _resampled_exact(values, starts[same], n):
+            low[same[g0:g1]], high[same[g0:g1]] = _percentiles(means, q)
+    small = np.flatnonzero((sizes > EXACT) & (sizes <= LARGE))
+    for g0, g1, means in _resampled_small(values, starts[small], sizes[small], reps, rng):
+        low[small[g0:g1]], high[small[g0:g1]] = _percentiles(means, q)
+    large = np.flatnonzero(sizes > LARGE)
+    if len(large):
+        # Katta guruhlar gistogrammasi (guruh × bucket), bucketlar 0 dan
+        position = np.full(len(groups), -1)
+        position[large] = np.arange(len(large))
+        cells = position[cell_group] >= 0
+        histogram = np.zeros((len(large), buckets.max() + 1), dtype=np.int64)
+        np.add.at(histogram, (position[cell_group[cells]], buckets[cells]), counts[cells])
+        for g0, g1, means in _resampled_large(histogram, sizes[large], reps, rng):
+            low[large[g0:g1]], high[large[g0:g1]] = _percentiles(means, q)
+
+    # WR — o‘rtachaning chiziqli funksiyasi, shuning uchun oralig‘i ham shu formula bilan
+    weight = sizes / (sizes + prior)
+
+    def shrunk(values):
+        return (weight * values + (1 - weight) * overall) / RATING_SCALE
+
+    return pd.DataFrame({
+        "movie_count": sizes,
+        "avg_rating": mean / RATING_SCALE,
+        "ci_low": low / RATING_SCALE,
+        "ci_high": high / RATING_SCALE,
+        "wr": shrunk(mean),
+        "wr_low": shrunk(low),
+        "wr_high": shrunk(high),
+    }, index=groups)
+
+
+def top_groups(table, column="wr", k=10):
+    """``column`` bo‘yicha eng yaxshi ``k`` ta; teng qiymatda filmlari ko‘p guruh yuqorida."""
+    order = np.lexsort((-table["movie_count"].to_numpy(), -table[column].to_numpy()))
+    return table.iloc[order[:k]]
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class ManyToMany:
+    """Kino → rejissyor / kino → janr bog‘lanishlari (CSR ko‘rinishida).
+
+    ``i``-kinoning yorliqlari ``codes[offsets[i]:offsets[i + 1]]`` da,
+    ``rows`` esa har bir bog‘lanish qaysi kinoga tegishli ekanini saqlaydi.
+    ``names`` alifbo tartibida, shuning uchun kodlar tartibi groupby bilan bir xil.
+    """
+
+    names: np.ndarray
+    codes: np.ndarray
+    offsets: np.ndarray
+    rows: np.ndarray
+
+    @classmethod
+    def from_column(cls, values, sep=", "):
+        # Satrlar faqat takrorlanmas qiymatlar bo‘yicha bo‘linadi ("Crime, Drama"
+        # kabi kombinatsiyalar qatorlardan ancha kam), keyin kodlar qatorlarga tarqatiladi
+        raw_codes, raw_values = pd.factorize(values)
+        parts = [value.split(sep) for value in raw_values]
+        part_lengths = np.fromiter(map(len, parts), dtype=np.int64, count=len(parts))
+        part_offsets = np.cumsum(part_lengths) - part_lengths
+        labels, names = pd.factorize(
+            np.array([p for ps in parts for p in ps], dtype=object), sort=True
+        )
+
+        present = raw_codes >= 0
+        lengths = np.where(present, part_lengths[np.where(present, raw_codes, 0)], 0)
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        starts = part_offsets[raw_codes[present]]
+        positions = np.repeat(starts - offsets[:-1][present], lengths[present])
+        positions += np.arange(offsets[-1])
+        return cls(
+            names=np.asarray(names, dtype=object),
+            codes=labels[positions].astype(np.int32),
+            offsets=offsets,
+            rows=np.repeat(np.arange(len(values), dtype=np.int32), lengths),
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def _links(self, mask):
+        if mask is None:
+            return self.codes, self.rows
+        keep = np.asarray(mask)[self.rows]
+        return self.codes[keep], self.rows[keep]
+
+    def count(self, mask=None):
+        codes, _ = self._links(mask)
+        return np.bincount(codes, minlength=len(self))
+
+    def total(self, values, mask=None):
+        codes, rows = self._links(mask)
+        return np.bincount(codes, weights=np.asarray(values)[rows], minlength=len(self))
+
+    def mean(self, values, mask=None):
+        # pandas groupby (Kahan yig‘indisi) — natija explode + groupby bilan aynan bir xil
+        codes, rows = self._links(mask)
+        means = pd.Series(np.asarray(values)[rows]).groupby(codes).mean()
+        return means.index.to_numpy(), means.to_numpy()
+
+    def by_key(self, keys, mask=None):
+        # (kalit, yorliq) juftliklari bo‘yicha kinolar soni, masalan (Year, Genres)
+        codes, rows = self._links(mask)
+        key_values, key_codes = np.unique(np.asarray(keys)[rows], return_inverse=True)
+        pair = key_codes.astype(np.int64) * len(self) + codes
+        uniq, counts = np.unique(pair, return_counts=True)
+        return key_values[uniq // len(self)], self.names[uniq % len(self)], counts
+
+
+def bitmask(values, sep=", "):
+    """Har bir qatordagi yorliqlar to‘plami bitta butun sonda: ``i``-bit — ``names[i]``.
+
+    Satrlar faqat takrorlanmas qiymatlar bo‘yicha bo‘linadi; 32 tagacha yorliq
+    uchun ``uint32``, 64 tagacha — ``uint64``.
+    """
+    raw_codes, raw_values = pd.factorize(values)
+    parts = [value.split(sep) for value in raw_values]
+    names = np.array(sorted({p for ps in parts for p in ps}), dtype=object)
+    if len(names) > 64:
+        raise ValueError(f"bitmask uchun yorliqlar juda ko‘p: {len(names)} > 64")
+    dtype = np.uint32 if len(names) <= 32 else np.uint64
+    bit = {name: 1 << i for i, name in enumerate(names)}
+    raw_masks = np.array([sum(bit[p] for p in set(ps)) for ps in parts] + [0], dtype=dtype)
+    # Bo‘sh qiymatlar (kod -1) oxirgi — nol niqobni oladi
+    return raw_masks[raw_codes], names
+
+
+@dataclass(frozen=True)
+class MovieIndex:
+    directors: ManyToMany
+    genres: ManyToMany
+
+    @classmethod
+    def build(cls, df):
+        return cls(
+            directors=ManyToMany.from_column(df["Directors"]),
+            genres=ManyToMany.from_column(df["Genres"]),
+        )
+
@@ -0,0 +1,215 @@
+"""IMDb ro‘yxat sahifalarini parallel yuklab, top_1000ta_kino.csv sxemasida saqlash.
+
+kino_scrapping.ipynb dagi ketma-ket ``requests.get`` + ``time.sleep(5)`` o‘rniga:
+asyncio HTTP mijozi (bitta sessiya, ulanishlar qayta ishlatiladi), cheklangan
+parallellik, token-bucket tezlik cheklovchisi, qayta urinish (exponential
+backoff) va to‘xtagan joydan davom ettirish (holat fayli).
+
+    python scraper.py --pages 40 --out top_1000ta_kino.csv
+
+Oflayn sinash uchun saqlangan sahifalarni mahalliy serverdan olish mumkin:
+
+    python -m http.server 8000 -d fixtures
+    python scraper.py --url "http://127.0.0.1:8000/list_page_{page}.html" --pages 1
+
+Holat fayli URL shabloni bo‘yicha (``state_path``) va muvaffaqiyatli yuklashdan
+keyin o‘chiriladi: qayta ishga tushirish ma'lumotni yangilaydi, davom ettirish
+esa faqat xato bilan to‘xtagan yuklashga tegishli.
+
+Tekshiruvlar (server, natija, 503 va davom ettirish): ``tests/test_scraper.py``;
+tezlik: ``benchmarks/bench_scraper.py``.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+
+import aiohttp
+import pandas as pd
+
+from loader import CACHE_DIR, CSV_PATH, CSV_SCHEMA
+from page_parser import parse_page
+
+
+LIST_URL = "https://www.imdb.com/list/ls048276758/?view=detailed&page={page}"
+STATE_DIR = Path(CACHE_DIR) / "scrape_state"
+
+HEADERS = {
+    "accept-language": "en-US,en;q=0.9,nl;q=0.8,de;q=0.7",
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
+}
+
+# Shu javoblarda qayta urinib ko‘ramiz, qolgan xatolar darhol ko‘tariladi
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Soniyasiga ``rate`` ta so‘rov, ``capacity`` tagacha qisqa "portlash"."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def state_path(url, state_dir=STATE_DIR):
+    """``url`` shabloniga xos holat fayli — boshqa manzildagi yuklash uni davom ettirmaydi."""
+    return Path(state_dir) / f"{hashlib.sha256(url.encode()).hexdigest()[:16]}.jsonl"
+
+
+class Progress:
+    """Tugallangan sahifalar JSON lines faylida — qayta ishga tushganda o‘tkazib yuboriladi.
+
+    Har bir yozuvda ``url`` ham bor: boshqa manzil yozuvlari hisobga olinmaydi.
+    Hamma sahifa yuklangach ``clear()`` faylni o‘chiradi — keyingi ishga tushirish
+    ma'lumotni yangidan yuklaydi.
+    """
+
+    def __init__(self, path, url):
+        self.path = Path(path)
+        self.url = url
+        self.pages = {}
+        if self.path.exists():
+            line = "\n"
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Uzilib qolgan oxirgi qator — sahifa qayta yuklanadi
+                        continue
+                    if record.get("url") == url:
+                        self.pages[record["page"]] = record["movies"]
+            if not line.endswith("\n"):
+                # Uzilgan qatorni yopamiz — keyingi yozuv unga qo‘shilib ketmasin
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write("\n")
+
+    def save(self, page, movies):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        record = {"url": self.url, "page": page, "movies": movies}
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.pages[page] = movies
+
+    def clear(self):
+        self.path.unlink(missing_ok=True)
+
+
+# -------------------------------------------------------------------- tarmoq
+
+def _retry_after(response):
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+async def fetch(session, url, bucket, retries=5, backoff=1.0):
+    for attempt in range(retries + 1):
+        await bucket.acquire()
+        delay = None
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    return await response.text()
+                if response.status not in RETRY_STATUSES:
+                    response.raise_for_status()
+                delay = _retry_after(response)
+                error = f"HTTP {response.status}"
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+            error = repr(exc)
+        if attempt == retries:
+            raise RuntimeError(f"{url}: {retries + 1} ta urinishdan keyin ham xato ({error})")
+        await asyncio.sleep(delay or backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+
+
+async def scrape(pages, url=LIST_URL, state=None, concurrency=4, rate=1.0,
+                 retries=5, backoff=1.0, parse_workers=None):
+    """``pages`` sahifalardagi filmlar (CSV sxemasida).
+
+    Xato bilan to‘xtasa, tugallangan sahifalar ``state`` faylida qoladi
+    (standart — ``state_path(url)``); hammasi yuklangach fayl o‘chiriladi.
+    """
+    progress = Progress(state or state_path(url), url)
+    todo = [page for page in pages if page not in progress.pages]
+    bucket = TokenBucket(rate, capacity=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    timeout = aiohttp.ClientTimeout(total=60)
+
+    loop = asyncio.get_running_loop()
+
+    # Tahlil alohida jarayonlarda — event loop yuklashda davom etadi
+    with ProcessPoolExecutor(max_workers=parse_workers) as pool:
+        async with aiohttp.ClientSession(headers=HEADERS, connector=connector,
+                                         timeout=timeout) as session:
+            async def one(page):
+                async with semaphore:
+                    html = await fetch(session, url.format(page=page), bucket, retries, backoff)
+                progress.save(page, await loop.run_in_executor(pool, parse_page, html))
+
+            # Bitta sahifa xatosi qolganlarini to‘xtatmaydi — tugallanganlari holatga yoziladi
+            results = await asyncio.gather(*(one(page) for page in todo), return_exceptions=True)
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+
+    df = to_frame([movie for page in pages for movie in progress.pages[page]])
+    progress.clear()
+    return df
+
+
+def to_frame(movies, today=None):
+    # malumotlar() o‘qiydigan CSV bilan bir xil ustunlar va tartib
+    today = today or date.today().isoformat()
+    df = pd.DataFrame(movies).reindex(columns=CSV_SCHEMA)
+    df["Position"] = range(1, len(df) + 1)
+    df["Created"] = df["Created"].fillna(today)
+    df["Modified"] = df["Modified"].fillna(today)
+    df["Title Type"] = df["Title Type"].fillna("Movie")
+    df["Original Title"] = df["Original Title"].fillna(df["Title"])
+    # Topilmagan yil/ovoz/davomiylik bo‘sh qoladi, qolganlari "1972.0" emas, "1972" bo‘lib yoziladi
+    return df.astype({"Year": "Int64", "Num Votes": "Int64", "Runtime (mins)": "Int64"})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=LIST_URL, help="{page} o‘rniga sahifa raqami qo‘yiladi")
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--out", default=CSV_PATH)
+    parser.add_argument("--state", default=None, help="holat fayli (standart — URL bo‘yicha)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=1.0, help="soniyasiga so‘rovlar")
+    parser.add_argument("--retries", type=int, default=5)
+    parser.add_argument("--parse-workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    df = asyncio.run(scrape(range(1, args.pages + 1), args.url, args.state,
+                            args.concurrency, args.rate, args.retries,
+                            parse_workers=args.parse_workers))
+    df.to_csv(args.out, index=False)
+    print(f"{len(df)} ta film → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
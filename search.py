@@ -0,0 +1,231 @@
+"""Nom va rejissyor bo‘yicha tezkor qidiruv — yuklashda bir marta quriladigan indeks.
+
+Har bir maydon (Title, Original Title, Directors) uchun:
+
+- takrorlanmas satrlar normallashtiriladi (diakritikalar olib tashlanadi,
+  kichik harflar): "Yasujirô Ozu" → "yasujiro ozu";
+- so‘zlar alifbo bo‘yicha saralangan lug‘atga yig‘iladi (so‘z → satrlar, CSR),
+  so‘rovdagi har bir so‘z ``searchsorted`` bilan prefiks sifatida qidiriladi;
+- prefiks topilmasa (xato yozilgan so‘z), lug‘atdagi so‘zlarning trigram
+  indeksi orqali eng o‘xshash so‘zlar olinadi;
+- satr → filmlar bog‘lanishi ham CSR: bir xil nomli filmlar bitta satrga tushadi.
+
+Natija reytingi: to‘liq so‘z > prefiks > o‘xshash so‘z, maydon vazni bilan;
+teng bo‘lsa — ovozlari ko‘p film yuqorida.
+"""
+import re
+import unicodedata
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+FIELD_WEIGHTS = {"Title": 1.0, "Original Title": 0.9, "Directors": 0.8}
+EXACT, PREFIX, FUZZY = 1.0, 0.8, 0.6
+MIN_SIMILARITY = 0.45
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize(text):
+    # NFKD + birikuvchi belgilarni olib tashlash: "ô" → "o", "ß" → "ss" (casefold)
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_WORD.sub(" ", stripped.casefold()).strip()
+
+
+def _trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _gather(offsets, values, ids):
+    # CSR dan bir nechta qatorni bitta massivga: (qiymatlar, qaysi id ga tegishli)
+    starts = offsets[ids]
+    lengths = offsets[ids + 1] - starts
+    positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    positions += np.arange(lengths.sum())
+    return values[positions], np.repeat(np.arange(len(ids)), lengths)
+
+
+def _csr(keys, values, n_keys):
+    order = np.argsort(keys, kind="stable")
+    offsets = np.zeros(n_keys + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n_keys), out=offsets[1:])
+    return offsets, values[order]
+
+
+def _best_per_key(keys, scores):
+    # Har bir kalit uchun eng yuqori ball (kalitlar o‘sish tartibida)
+    order = np.lexsort((-scores, keys))
+    keys, scores = keys[order], scores[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    return keys[first], scores[first]
+
+
+@dataclass(frozen=True)
+class FieldIndex:
+    """Bitta maydon: so‘z lug‘ati → satrlar → filmlar."""
+
+    strings: np.ndarray
+    vocab: np.ndarray
+    token_offsets: np.ndarray
+    token_strings: np.ndarray
+    row_offsets: np.ndarray
+    rows: np.ndarray
+    trigram_keys: np.ndarray
+    trigram_offsets: np.ndarray
+    trigram_tokens: np.ndarray
+    trigram_sizes: np.ndarray
+
+    @classmethod
+    def from_column(cls, values):
+        codes, strings = pd.factorize(values)
+        present = codes >= 0
+        row_offsets, rows = _csr(codes[present], np.flatnonzero(present), len(strings))
+        return cls._build(np.asarray(strings, dtype=object), row_offsets, rows)
+
+    @classmethod
+    def from_links(cls, links):
+        # relations.ManyToMany: har bir rejissyor alohida satr (kombinatsiyalar emas)
+        row_offsets, rows = _csr(links.codes, links.rows.astype(np.int64), len(links.names))
+        return cls._build(links.names, row_offsets, rows)
+
+    @classmethod
+    def _build(cls, strings, row_offsets, rows):
+        words = [normalize(s).split() for s in strings]
+        lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+        flat = np.array([w for ws in words for w in ws], dtype=object)
+        token_codes, vocab = pd.factorize(flat, sort=True)
+        owner = np.repeat(np.arange(len(strings)), lengths)
+        # Bir satrda takrorlangan so‘z bir marta sanaladi
+        pairs = np.unique(token_codes.astype(np.int64) * max(len(strings), 1) + owner)
+        token_offsets, token_strings = _csr(pairs // max(len(strings), 1),
+                                            pairs % max(len(strings), 1), len(vocab))
+
+        grams = [_trigrams(t) for t in vocab]
+        sizes = np.fromiter(map(len, grams), dtype=np.int64, count=len(grams))
+        gram_codes, gram_keys = pd.factorize(
+            np.array([g for gs in grams for g in gs], dtype=object), sort=True
+        )
+        trigram_offsets, trigram_tokens = _csr(
+            gram_codes, np.repeat(np.arange(len(vocab)), sizes), len(gram_keys)
+        )
+        return cls(
+            strings=strings,
+            vocab=np.asarray(vocab, dtype=object),
+            token_offsets=token_offsets,
+            token_strings=token_strings,
+            row_offsets=row_offsets,
+            rows=rows,
+            trigram_keys=np.asarray(gram_keys, dtype=object),
+            trigram_offsets=trigram_offsets,
+            trigram_tokens=trigram_tokens,
+            trigram_sizes=sizes,
+        )
+
+    def _similar(self, token, limit=20):
+        grams = np.array(sorted(_trigrams(token)), dtype=object)
+        if not len(self.trigram_keys):
+            return np.array([], dtype=np.int64), np.array([])
+        pos = np.minimum(np.searchsorted(self.trigram_keys, grams), len(self.trigram_keys) - 1)
+        pos = pos[self.trigram_keys[pos] == grams]
+        if not len(pos):
+            return np.array([], dtype=np.int64), np.array([])
+        tokens, _ = _gather(self.trigram_offsets, self.trigram_tokens, pos)
+        candidates, shared = np.unique(tokens, return_counts=True)
+        similarity = shared / (len(grams) + self.trigram_sizes[candidates] - shared)
+        keep = similarity >= MIN_SIMILARITY
+        candidates, similarity = candidates[keep], similarity[keep]
+        best = np.argsort(-similarity, kind="stable")[:limit]
+        return candidates[best], similarity[best]
+
+    def _token_scores(self, token):
+        # So‘rovdagi bitta so‘z → (lug‘atdagi so‘zlar, ball)
+        lo = np.searchsorted(self.vocab, token, side="left")
+        hi = np.searchsorted(self.vocab, token + "\U0010ffff", side="left")
+        if hi > lo:
+            ids = np.arange(lo, hi)
+            scores = np.where(self.vocab[ids] == token, EXACT, PREFIX)
+            return ids, scores
+        ids, similarity = self._similar(token)
+        return ids, FUZZY * similarity
+
+    def match(self, tokens):
+        """Barcha so‘zlar mos kelgan satrlar va ularning bali (so‘zlar ballari o‘rtachasi)."""
+        ids, total = None, None
+        for token in tokens:
+            token_ids, scores = self._token_scores(token)
+            strings, owner = _gather(self.token_offsets, self.token_strings, token_ids)
+            found, best = _best_per_key(strings, scores[owner])
+            if ids is None:
+                ids, total = found, best
+                continue
+            # Faqat barcha so‘zlar topilgan satrlar qoladi
+            ids, left, right = np.intersect1d(ids, found, assume_unique=True,
+                                              return_indices=True)
+            total = total[left] + best[right]
+        return ids, total / len(tokens)
+
+    def expand(self, strings, scores):
+        rows, owner = _gather(self.row_offsets, self.rows, strings)
+        return rows, scores[owner]
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    fields: dict
+    popularity: np.ndarray
+
+    @classmethod
+    def build(cls, titles, original_titles, directors, votes):
+        fields = {"Title": FieldIndex.from_column(titles)}
+        if original_titles is not None:
+            fields["Original Title"] = FieldIndex.from_column(original_titles)
+        fields["Directors"] = FieldIndex.from_links(directors)
+        votes = np.asarray(votes, dtype=np.float64)
+        popularity = np.log1p(votes) / max(np.log1p(votes.max(initial=0)), 1.0)
+        return cls(fields=fields, popularity=popularity)
+
+    def search(self, query, k=20):
+        """Eng mos ``k`` ta film: ``row``, ``score``, ``field`` ustunli jadval."""
+        tokens = normalize(query).split()
+        empty = pd.DataFrame({"row": np.array([], dtype=np.int64), "score": [], "field": []})
+        if not tokens:
+            return empty
+        rows, scores, fields = [], [], []
+        for code, (name, index) in enumerate(self.fields.items()):
+            field_rows, field_scores = index.expand(*index.match(tokens))
+            rows.append(field_rows)
+            scores.append(field_scores * FIELD_WEIGHTS[name])
+            fields.append(np.full(len(field_rows), code))
+        rows, scores, fields = map(np.concatenate, (rows, scores, fields))
+        if not len(rows):
+            return empty
+        # Har bir film eng yaxshi maydoni bilan; teng ballda — mashhurlik
+        rank = scores + 1e-3 * self.popularity[rows]
+        order = np.lexsort((-rank, rows))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = rows[order][1:] != rows[order][:-1]
+        best = order[first]
+        top = best[np.argsort(-rank[best], kind="stable")[:k]]
+        names = np.array(list(self.fields), dtype=object)
+        return pd.DataFrame({"row": rows[top], "score": scores[top], "field": names[fields[top]]})
+
+    def search_names(self, query, field="Directors", k=5):
+        """Nomlar (masalan, rejissyorlar) bo‘yicha eng mos ``k`` ta satr."""
+        tokens = normalize(query).split()
+        if not tokens:
+            return []
+        index = self.fields[field]
+        strings, scores = index.match(tokens)
+        best = np.argsort(-scores, kind="stable")[:k]
+        return [index.strings[i] for i in strings[best]]
+
+    def rows(self, name, field="Directors"):
+        """``name`` satriga (masalan, rejissyorga) tegishli filmlar qatorlari."""
+        index = self.fields[field]
+        strings = np.flatnonzero(index.strings == name)
+        return np.sort(index.expand(strings, np.zeros(len(strings)))[0])
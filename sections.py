@@ -0,0 +1,67 @@
+"""Dashboard bo‘limlari reestri.
+
+Har bir bo‘lim nomi va aniq bog‘liqliklari bilan hisoblanadi: ``DATA`` —
+faqat ma'lumotlar versiyasi, ``FILTERS`` — versiya + yil/reyting oralig‘i.
+Natija (figura, jadval) shu bog‘liqliklar kaliti bo‘yicha umumiy keshda
+saqlanadi, shuning uchun slayder harakatida faqat filtrga bog‘liq bo‘limlar
+qayta hisoblanadi, ``df`` ga bog‘liqlari esa har bir versiya uchun bir marta.
+``SectionRun`` bitta qayta chizishda nechta bo‘lim hisoblanganini yozib boradi.
+"""
+import pandas as pd
+
+
+def payload_size(value):
+    # Keshdagi natijaning taxminiy hajmi (bayt)
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if hasattr(value, "to_plotly_json"):
+        return len(value.to_json())
+    if isinstance(value, (tuple, list)):
+        return sum(payload_size(v) for v in value)
+    return 0
+
+
+def sized(value):
+    # Kesh kutgan ``(qiymat, bayt)`` juftligi
+    return value, payload_size(value)
+
+
+class SectionRun:
+    """Bitta qayta chizish (rerun) dagi bo‘limlar: qaysilari hisoblandi, qaysilari keshdan."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.computed = []
+        self.reused = []
+        # To‘liq qayta chizish tugagach True — keyingi chaqiruvlar faqat fragment ichidan
+        self.finished = False
+
+    def compute(self, name, deps, create, cache=None):
+        """``create()`` natijasi ``(name, *deps)`` kaliti bo‘yicha keshlanadi.
+
+        ``cache`` — ``charts.FigureCache`` interfeysli kesh (standart: reestr keshi),
+        ``create`` ``(qiymat, bayt)`` qaytaradi.
+        """
+        created = []
+
+        def tracked():
+            created.append(True)
+            return create()
+
+        value = (self.cache if cache is None else cache).get((name, *deps), tracked)
+        (self.computed if created else self.reused).append(name)
+        return value
+
+    def executed(self, name):
+        # Keshlanmaydigan bo‘lim (masalan, sahifalangan jadval) — har safar hisoblanadi
+        self.computed.append(name)
+
+    def summary(self):
+        return {
+            "computed": list(self.computed),
+            "reused": list(self.reused),
+            "total": len(self.computed) + len(self.reused),
+        }
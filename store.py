@@ -0,0 +1,280 @@
+"""Kinolar uchun SQLite do‘koni: ``Const`` bo‘yicha upsert va o‘zgarishlar jurnali.
+
+CSV ni butunlay qayta yozish o‘rniga yangi eksport do‘konga "upsert" qilinadi:
+``Modified`` ustuni o‘zgargan yoki yangi ``Const`` li qatorlargina yoziladi,
+har bir o‘zgarish (eski va yangi qator bilan) jurnalga tushadi. Dashboard
+jurnaldagi deltani olib, agregatlarni butun ma'lumotdan qayta hisoblamasdan
+yamaydi (``LiveCatalog``).
+
+    python store.py refresh yangi_eksport.csv
+    python store.py refresh yangi_qismi.csv --partial   # o‘chirishlarsiz
+"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cube import Cube
+from loader import CACHE_DIR, COLUMNS, CSV_SCHEMA, KEYS, NULLABLE, append_compact, compact, complete
+from relations import MovieIndex
+from topk import TopK
+
+
+STORE_PATH = os.environ.get("IMDB_STORE", "")
+DEFAULT_STORE = Path(CACHE_DIR) / "movies.sqlite"
+
+_COLUMNS = ", ".join(f'"{c}"' for c in CSV_SCHEMA)
+_PLACEHOLDERS = ", ".join("?" for _ in CSV_SCHEMA)
+
+
+@dataclass(frozen=True)
+class Delta:
+    """``before`` — o‘zgargan/o‘chirilgan qatorlarning eski holati,
+    ``after`` — yangi/o‘zgargan qatorlarning yangi holati (ikkalasi ham CSV sxemasida)."""
+
+    version: int
+    before: pd.DataFrame
+    after: pd.DataFrame
+
+    def __bool__(self):
+        return bool(len(self.before) or len(self.after))
+
+
+def _frame(records):
+    return pd.DataFrame.from_records(records, columns=CSV_SCHEMA)
+
+
+def _clean(value):
+    # NaN → NULL, numpy skalyarlari → Python turlari
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class MovieStore:
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        columns = ", ".join(f'"{c}"' + (" PRIMARY KEY" if c == "Const" else "") for c in CSV_SCHEMA)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS movies ({columns})")
+            # upsert solishtiruvi uchun qoplovchi indeks — jadval qatorlariga tegmaydi
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS movies_modified ON movies (Const, "Modified")')
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS changes ("
+                "version INTEGER, const TEXT, before TEXT, after TEXT, "
+                "PRIMARY KEY (version, const))"
+            )
+
+    @property
+    def version(self):
+        with self._lock:
+            return self._conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def frame(self, columns=CSV_SCHEMA):
+        names = ", ".join(f'"{c}"' for c in columns)
+        with self._lock:
+            df = pd.read_sql_query(f"SELECT {names} FROM movies ORDER BY Position", self._conn)
+        return df.astype({c: t for c, t in NULLABLE.items() if c in columns and t != "str"})
+
+    def upsert(self, incoming, snapshot=True):
+        """Yangi eksportni yozadi va deltani qaytaradi.
+
+        ``snapshot=True`` — ``incoming`` to‘liq ro‘yxat, unda yo‘q qatorlar o‘chiriladi.
+        """
+        incoming = incoming.reindex(columns=CSV_SCHEMA)
+        with self._lock, self._conn:
+            # Kelgan (Const, Modified) juftlari vaqtinchalik jadvalda, do‘kon bilan
+            # (Const, Modified) indeksi bo‘yicha solishtiriladi — butun qatorlar o‘qilmaydi
+            for table, columns in (("incoming", "Const TEXT, Modified"),
+                                   ("fresh", "Const TEXT PRIMARY KEY")):
+                self._conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS {table} ({columns})")
+                self._conn.execute(f"DELETE FROM {table}")
+            modified = incoming["Modified"].astype(object)
+            self._conn.executemany(
+                "INSERT INTO incoming VALUES (?, ?)",
+                zip(incoming["Const"].tolist(), modified.where(modified.notna(), None).tolist()),
+            )
+            self._conn.execute(
+                "INSERT INTO fresh SELECT i.Const FROM incoming i "
+                "LEFT JOIN movies m ON m.Const = i.Const "
+                "WHERE m.Const IS NULL OR m.Modified IS NOT i.Modified"
+            )
+            fresh = [c for (c,) in self._conn.execute("SELECT Const FROM fresh")]
+            changed = incoming[incoming["Const"].isin(fresh)]
+            # Eski holat faqat o‘zgargan va o‘chiriladigan qatorlar uchun o‘qiladi
+            before = pd.read_sql_query(
+                f"SELECT {_COLUMNS} FROM movies WHERE Const IN (SELECT Const FROM fresh)",
+                self._conn)
+            removed = pd.read_sql_query(
+                f"SELECT {_COLUMNS} FROM movies WHERE Const NOT IN (SELECT Const FROM incoming)",
+                self._conn) if snapshot else before.iloc[:0]
+            before = pd.concat([before, removed], ignore_index=True)
+
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if len(changed) or len(removed):
+                version += 1
+                rows = [tuple(map(_clean, row)) for row in changed.itertuples(index=False)]
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO movies ({_COLUMNS}) VALUES ({_PLACEHOLDERS})", rows
+                )
+                self._conn.executemany(
+                    "DELETE FROM movies WHERE Const = ?", [(c,) for c in removed["Const"]]
+                )
+                log = {c: [None, None] for c in pd.concat([before["Const"], changed["Const"]])}
+                for record in before.to_dict("records"):
+                    log[record["Const"]][0] = json.dumps(record, default=_clean)
+                for record in changed.to_dict("records"):
+                    log[record["Const"]][1] = json.dumps(record, default=_clean)
+                self._conn.executemany(
+                    "INSERT INTO changes VALUES (?, ?, ?, ?)",
+                    [(version, const, b, a) for const, (b, a) in log.items()],
+                )
+                self._conn.execute(f"PRAGMA user_version = {version}")
+        return Delta(version, before.reset_index(drop=True), changed.reset_index(drop=True))
+
+    def changes_since(self, version):
+        # Bir xil film bir necha versiyada o‘zgargan bo‘lsa: birinchi "before" va oxirgi "after"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT version, const, before, after FROM changes "
+                "WHERE version > ? ORDER BY version",
+                (version,),
+            ).fetchall()
+            current = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        first, last = {}, {}
+        for _, const, before, after in rows:
+            first.setdefault(const, before)
+            last[const] = after
+        before = [json.loads(b) for b in first.values() if b]
+        after = [json.loads(a) for a in last.values() if a]
+        return Delta(current, _frame(before), _frame(after))
+
+
+@dataclass(frozen=True)
+class CatalogState:
+    """Bitta versiyadagi katalog: ``df``, ``keys``, kub va Top 10 lar bir-biriga mos.
+
+    Yangilanish yangi holatni alohida quradi va bitta havola bilan almashtiradi —
+    o‘quvchi har qayta chizish/so‘rovda holatni bir marta oladi va yarim
+    yangilangan aralashmani ko‘rmaydi.
+    """
+
+    version: int
+    df: pd.DataFrame
+    # ``df`` qatorlariga mos Position, Const va asl nomlar (qidiruv uchun)
+    keys: pd.DataFrame
+    cube: Cube
+    top_lists: dict
+
+    @property
+    def empty(self):
+        # Yangi do‘kon — birinchi ``store.py refresh`` gacha filmlar yo‘q
+        return not len(self.df)
+
+
+def _top_lists(df):
+    rated = df["IMDb Rating"].notna().to_numpy()
+    rows = np.flatnonzero(rated)
+    return {
+        column: TopK(10).add(df[column].to_numpy()[rated], rows)
+        for column in ("IMDb Rating", "Num Votes")
+    }
+
+
+class LiveCatalog:
+    """Dashboard ma'lumotlari: do‘kondagi deltalar bo‘yicha yamaladi.
+
+    Kub va filtrlanmagan Top 10 lar delta orqali yangilanadi; qatorlar
+    darajasidagi tuzilmalar (filtr, saralash) yangi versiya uchun xotiradagi
+    ma'lumotdan quriladi — CSV qayta o‘qilmaydi. Hamma sessiyalar bitta
+    obyektni bo‘lishadi, shuning uchun o‘qish faqat ``snapshot()`` orqali.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        full = complete(store.frame(["Position", *KEYS, *COLUMNS]))
+        df = compact(full)
+        self.state = CatalogState(store.version, df, full[["Position", *KEYS]],
+                                  Cube.build(df, MovieIndex.build(df)), _top_lists(df))
+
+    @property
+    def version(self):
+        return self.state.version
+
+    def snapshot(self):
+        """Do‘kondagi yangi deltalarni qo‘llab, hozirgi ``CatalogState`` ni qaytaradi."""
+        self.refresh()
+        return self.state
+
+    def refresh(self):
+        if self.store.version == self.state.version:
+            return False
+        with self._lock:
+            state = self.state
+            delta = self.store.changes_since(state.version)
+            if delta.version == state.version:
+                return False
+            self.state = _apply(state, delta)
+        return True
+
+
+def _apply(state, delta):
+    # Eski holat o‘zgartirilmaydi — uni hali o‘qiyotgan sessiyalar bor
+    # Yili yoki ovozlari yo‘q qatorlar ``df`` da yo‘q — deltadan ham tashlanadi
+    numeric = {c: t for c, t in NULLABLE.items() if t != "str"}
+    before = complete(delta.before.astype(numeric))
+    after = complete(delta.after.astype(numeric))
+    cube = state.cube.patch(before[list(COLUMNS)], after[list(COLUMNS)])
+
+    touched = state.keys["Const"].isin(pd.concat([before["Const"], after["Const"]]))
+    kept = ~touched.to_numpy()
+    keys = pd.concat([state.keys[kept], after[["Position", *KEYS]]], ignore_index=True)
+    order = np.argsort(keys["Position"].to_numpy(), kind="stable")
+    keys = keys.iloc[order].reset_index(drop=True)
+    # Faqat o‘zgargan qatorlar ixcham turlarga o‘giriladi — qolganlari o‘z holicha
+    df = append_compact(state.df[kept], after, order)
+
+    # Faqat oxiriga yangi qatorlar qo‘shilgan bo‘lsa — Top 10 lar nusxasi yangilanadi;
+    # qatorlar o‘chgan/ko‘chgan bo‘lsa pozitsiyalar siljiydi, qayta quramiz
+    if not kept.all() or not (order == np.arange(len(order))).all():
+        top_lists = _top_lists(df)
+    else:
+        rated = df["IMDb Rating"].notna().to_numpy()
+        new_rows = np.arange(len(df) - len(after), len(df))
+        new_rows = new_rows[rated[new_rows]]
+        top_lists = {column: top.copy().add(df[column].to_numpy()[new_rows], new_rows)
+                     for column, top in state.top_lists.items()}
+    return CatalogState(delta.version, df, keys, cube, top_lists)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    refresh = sub.add_parser("refresh", help="CSV eksportni do‘konga upsert qilish")
+    refresh.add_argument("csv")
+    refresh.add_argument("--db", default=STORE_PATH or DEFAULT_STORE)
+    refresh.add_argument("--partial", action="store_true",
+                         help="CSV to‘liq ro‘yxat emas — yo‘q qatorlarni o‘chirmaslik")
+    args = parser.parse_args(argv)
+
+    delta = MovieStore(args.db).upsert(pd.read_csv(args.csv), snapshot=not args.partial)
+    added = len(set(delta.after["Const"]) - set(delta.before["Const"]))
+    removed = len(set(delta.before["Const"]) - set(delta.after["Const"]))
+    print(f"versiya {delta.version}: {added} yangi, "
+          f"{len(delta.after) - added} o‘zgargan, {removed} o‘chirilgan")
+
+
+if __name__ == "__main__":
+    main()
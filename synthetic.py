@@ -0,0 +1,190 @@
+"""top_1000ta_kino.csv sxemasidagi sintetik katalog — istalgan hajmda.
+
+Taqsimotlar haqiqiy IMDb katalogiga yaqin qilib tanlangan:
+
+- ``Year`` — so‘nggi yillarga og‘ishgan (eksponensial), 1900 dan;
+- ``IMDb Rating`` — normal (6.6 ± 1.0), 0.1 qadam, ~1% reytingsiz;
+- ``Num Votes`` — log-normal (3.5M gacha), reyting bilan musbat bog‘langan;
+- ``Runtime (mins)`` — normal (104 ± 20), ~2% bo‘sh;
+- ``Genres`` — 1–6 ta janr (real CSV dagi ulushlar), mashhurlik bo‘yicha vaznli,
+  alifbo tartibida;
+- ``Directors`` — Zipf bo‘yicha mashhurlik (bir necha "sermahsul" rejissyor),
+  ~9% filmda 2–3 rejissyor, ~1% bo‘sh.
+
+Katta hajmlar bo‘laklab yoziladi — xotira bo‘lak hajmi bilan cheklanadi.
+Bir xil ``seed`` va ``n_rows`` har doim bir xil faylni beradi.
+
+    python synthetic.py 1000000 --out .cache/bench/synthetic_1000000.csv
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from loader import CSV_SCHEMA
+
+
+GENRES = np.array([
+    "Action", "Adventure", "Animation", "Biography", "Comedy", "Crime", "Documentary",
+    "Drama", "Family", "Fantasy", "Film-Noir", "History", "Horror", "Music", "Musical",
+    "Mystery", "News", "Romance", "Sci-Fi", "Short", "Sport", "Thriller", "War", "Western",
+], dtype=object)
+GENRE_WEIGHTS = np.array([
+    9, 6, 3, 3, 9, 7, 2, 30, 2, 3, 0.5, 2, 4, 1.5, 1, 4, 0.1, 6, 3, 1, 1.5, 6, 2, 1,
+])
+# 1, 2, 3, ... janrli filmlar ulushi (top_1000ta_kino.csv dan)
+GENRE_COUNTS = np.array([0.17, 0.35, 0.28, 0.13, 0.05, 0.02])
+
+TITLE_TYPES = np.array(["Movie", "Short", "TV Movie", "TV Mini Series", "TV Episode",
+                        "TV Special"], dtype=object)
+TITLE_TYPE_WEIGHTS = np.array([0.975, 0.008, 0.007, 0.007, 0.002, 0.001])
+
+FIRST_NAMES = [
+    "Akira", "Alfred", "Agnès", "Billy", "Céline", "Charles", "Christopher", "David",
+    "Denis", "Elia", "Federico", "Fritz", "Greta", "Hayao", "Ingmar", "Jean", "Joel",
+    "John", "Krzysztof", "Lee", "Martin", "Michael", "Milos", "Nuri", "Paolo", "Pedro",
+    "Peter", "Quentin", "Ridley", "Roman", "Satyajit", "Sergio", "Sidney", "Sofia",
+    "Stanley", "Steven", "Takeshi", "Terrence", "Wong", "Yasujirô", "Zhang", "Éric",
+]
+LAST_NAMES = [
+    "Almodóvar", "Anderson", "Bergman", "Bigelow", "Ceylan", "Chaplin", "Coen", "Coppola",
+    "Eastwood", "Fellini", "Fincher", "Forman", "Gerwig", "Hitchcock", "Jackson", "Kar-wai",
+    "Kieslowski", "Kubrick", "Kurosawa", "Lang", "Leone", "Lumet", "Lynch", "Malick",
+    "Miyazaki", "Nolan", "Ozu", "Polanski", "Ray", "Rohmer", "Scorsese", "Scott",
+    "Sorrentino", "Spielberg", "Sverák", "Tarantino", "Varda", "Villeneuve", "Wilder",
+    "Yimou", "Zemeckis", "Östlund",
+]
+TITLE_WORDS = (
+    ["The", "A", "", "", ""],
+    ["Silent", "Last", "Dark", "Golden", "Broken", "Hidden", "Lost", "Wild", "Red",
+     "Secret", "Long", "Little", "Great", "Cold", "Final", "Empty", "Burning", "Quiet"],
+    ["River", "Night", "City", "House", "Road", "Summer", "War", "Garden", "Mirror",
+     "Island", "Story", "Empire", "Dream", "Station", "Bridge", "Letter", "Storm", "Sea"],
+    ["", "", "", " II", " of Tokyo", " in Paris", " Returns", ": Part One", " of Love"],
+)
+# Rejissyorlar soni: 0 (bo‘sh), 1, 2, 3
+DIRECTOR_COUNTS = np.array([0.01, 0.90, 0.08, 0.01])
+
+START_DATE = np.datetime64("2019-07-28")
+END_DATE = np.datetime64("2025-12-31")
+
+
+def director_pool(n_rows, seed=0):
+    # Rejissyorlar soni katalog hajmiga mutanosib; nomlar takrorlanmaydi
+    size = max(50, n_rows // 4)
+    base = [f"{f} {l}" for l in LAST_NAMES for f in FIRST_NAMES]
+    rng = np.random.default_rng([seed, 1])
+    rng.shuffle(base)
+    names = [base[i % len(base)] + ("" if i < len(base) else f" {i // len(base) + 1}")
+             for i in range(size)]
+    weights = 1.0 / np.arange(1, size + 1) ** 0.9
+    return np.array(names, dtype=object), weights / weights.sum()
+
+
+def _genres(rng, n):
+    # Gumbel top-k: har bir qator uchun k ta turli janr, vazn bo‘yicha
+    noise = rng.gumbel(size=(n, len(GENRES))).astype(np.float32)
+    keys = np.log(GENRE_WEIGHTS).astype(np.float32) + noise
+    order = np.argsort(-keys, axis=1)
+    k = rng.choice(len(GENRE_COUNTS), n, p=GENRE_COUNTS / GENRE_COUNTS.sum()) + 1
+    chosen = np.arange(len(GENRES)) < k[:, None]
+    bits = np.zeros(n, dtype=np.int64)
+    np.bitwise_or.at(bits, np.nonzero(chosen)[0], 1 << order[chosen].astype(np.int64))
+    # Faqat noyob janr to‘plamlari uchun satr yasaymiz (GENRES alifbo tartibida)
+    unique, inverse = np.unique(bits, return_inverse=True)
+    labels = np.array([
+        ", ".join(GENRES[[i for i in range(len(GENRES)) if b >> i & 1]]) for b in unique
+    ], dtype=object)
+    return labels[inverse]
+
+
+def _directors(rng, n, pool, weights):
+    counts = rng.choice(len(DIRECTOR_COUNTS), n, p=DIRECTOR_COUNTS)
+    first = pool[rng.choice(len(pool), n, p=weights)]
+    out = first.copy()
+    out[counts == 0] = None
+    for extra in (2, 3):
+        rows = np.flatnonzero(counts >= extra)
+        out[rows] = out[rows] + ", " + pool[rng.choice(len(pool), len(rows), p=weights)]
+    return out
+
+
+def _titles(rng, n):
+    parts = [np.array(words, dtype=object)[rng.integers(0, len(words), n)]
+             for words in TITLE_WORDS]
+    article, adjective, noun, suffix = parts
+    prefix = np.where(article == "", "", article + " ")
+    return prefix + adjective + " " + noun + suffix
+
+
+def _dates(rng, n, low, high):
+    days = (high - low).astype(np.int64)
+    return (low + rng.integers(0, days + 1, n)).astype(str).astype(object)
+
+
+def generate(n_rows, seed=0, start=0, pool=None):
+    """``start`` dan boshlab ``n_rows`` ta film (CSV_SCHEMA ustunlari bilan)."""
+    rng = np.random.default_rng([seed, 0, start])
+    pool, weights = pool or director_pool(n_rows, seed)
+    ids = np.arange(start, start + n_rows)
+    const = np.array([f"tt{i:07d}" for i in ids + 1], dtype=object)
+
+    year = np.maximum(2025 - np.floor(rng.exponential(22, n_rows)), 1900).astype(np.int64)
+    rating = np.clip(np.round(rng.normal(6.6, 1.0, n_rows), 1), 1.0, 10.0)
+    rated = rng.random(n_rows) >= 0.01
+    log_votes = rng.normal(3.2 + 0.35 * (rating - 6.6), 1.0)
+    votes = np.where(rated, np.clip(10 ** log_votes, 5, 3.5e6), rng.integers(0, 5, n_rows))
+    runtime = np.clip(np.round(rng.normal(104, 20, n_rows)), 40, 320)
+    runtime[rng.random(n_rows) < 0.02] = np.nan
+
+    created = _dates(rng, n_rows, START_DATE, END_DATE)
+    release_day = (year - 1970).astype("datetime64[Y]").astype("datetime64[D]") \
+        + rng.integers(0, 365, n_rows)
+    titles = _titles(rng, n_rows)
+
+    df = pd.DataFrame({
+        "Position": ids + 1,
+        "Const": const,
+        "Created": created,
+        "Modified": created,
+        "Description": None,
+        "Title": titles,
+        "Original Title": titles,
+        "URL": "https://www.imdb.com/title/" + const + "/",
+        "Title Type": TITLE_TYPES[rng.choice(len(TITLE_TYPES), n_rows, p=TITLE_TYPE_WEIGHTS)],
+        "IMDb Rating": np.where(rated, rating, np.nan),
+        "Runtime (mins)": runtime,
+        "Year": year,
+        "Genres": _genres(rng, n_rows),
+        "Num Votes": votes.astype(np.int64),
+        "Release Date": release_day.astype(str).astype(object),
+        "Directors": _directors(rng, n_rows, pool, weights),
+    })
+    return df[CSV_SCHEMA]
+
+
+def write_csv(path, n_rows, seed=0, chunk_size=1_000_000):
+    """Katalogni CSV ga bo‘laklab yozadi (10M qatorda ham xotira bo‘lak hajmida qoladi)."""
+    pool = director_pool(n_rows, seed)
+    tmp = f"{path}.tmp"
+    for start in range(0, n_rows, chunk_size):
+        chunk = generate(min(chunk_size, n_rows - start), seed, start, pool)
+        chunk.to_csv(tmp, mode="w" if start == 0 else "a", header=start == 0, index=False)
+    os.replace(tmp, path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("rows", type=float)
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    write_csv(args.out, int(args.rows), args.seed, args.chunk_size)
+    print(f"{int(args.rows):,} ta film → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
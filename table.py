@@ -0,0 +1,46 @@
+import os
+import threading
+
+
+PAGE_SIZE = int(os.environ.get("IMDB_PAGE_SIZE", 50))
+PAGE_SIZES = tuple(sorted({25, 50, 100, 250, PAGE_SIZE}))
+
+
+class SortedViews:
+    """Har bir ustun bo‘yicha saralash tartibi — bir marta hisoblanadi.
+
+    Sahifa so‘ralganda butun jadval qayta saralanmaydi: oldindan saralangan
+    tartibdan filtrga mos qatorlar olinadi va faqat ko‘rinadigan oyna kesiladi.
+    """
+
+    def __init__(self, df):
+        self._df = df
+        self._orders = {}
+        self._lock = threading.Lock()
+
+    def order(self, column, ascending=True):
+        key = (column, ascending)
+        with self._lock:
+            if key not in self._orders:
+                # Barqaror saralash, bo‘sh qiymatlar har doim oxirida
+                values = self._df[column].sort_values(
+                    ascending=ascending, kind="stable", na_position="last"
+                )
+                self._orders[key] = self._df.index.get_indexer(values.index)
+            return self._orders[key]
+
+
+def page_rows(views, rows, mask, column, ascending, page, page_size):
+    """``page`` (0 dan) sahifadagi qator pozitsiyalari va jami qatorlar soni."""
+    if column is None:
+        # Asl tartib — filtr natijasi allaqachon shu tartibda
+        selected = rows
+    else:
+        order = views.order(column, ascending)
+        selected = order[mask[order]]
+    start = page * page_size
+    return selected[start:start + page_size], len(selected)
+
+
+def page_count(total, page_size):
+    return max(-(-total // page_size), 1)
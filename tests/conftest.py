@@ -0,0 +1,61 @@
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+FIXTURES = ROOT / "fixtures"
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    # /<nom>.html?page=N → N-sahifa (saqlangan sahifalar aylana bo‘yicha)
+    pages = []
+    requests = []
+    # sahifa → status: 503 bir marta qaytadi, qolganlari — har safar
+    failing = {}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        page = int(parse_qs(urlsplit(self.path).query)["page"][0])
+        with self.lock:
+            self.requests.append(page)
+            status = self.failing.get(page)
+            if status == 503:
+                del self.failing[page]
+        if status:
+            self.send_response(status)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        body = self.pages[(page - 1) % len(self.pages)].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    return [p.read_text(encoding="utf-8") for p in sorted(FIXTURES.glob("*.html"))]
+
+
+@pytest.fixture
+def fixture_server(corpus):
+    """Saqlangan sahifalarni beruvchi mahalliy server; ``{page}`` — so‘rov parametri."""
+    FixtureHandler.pages = corpus
+    FixtureHandler.requests = []
+    FixtureHandler.failing = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", FixtureHandler
+    server.shutdown()
+    server.server_close()
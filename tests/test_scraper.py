@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+import aiohttp
+import pytest
+
+from loader import CSV_SCHEMA
+from page_parser import parse_page
+from scraper import scrape, state_path
+
+
+def run(url, pages, state, **kwargs):
+    options = dict(concurrency=4, rate=100.0, backoff=0.01, parse_workers=1)
+    return asyncio.run(scrape(pages, url, state, **{**options, **kwargs}))
+
+
+def expected(corpus, pages):
+    return [movie for page in pages for movie in parse_page(corpus[(page - 1) % len(corpus)])]
+
+
+@pytest.fixture
+def site(fixture_server):
+    base, handler = fixture_server
+    return f"{base}/list.html?page={{page}}", handler
+
+
+def test_result_matches_parser(site, corpus, tmp_path):
+    url, _ = site
+    pages = range(1, 5)
+    df = run(url, pages, tmp_path / "state.jsonl")
+    movies = expected(corpus, pages)
+    assert list(df.columns) == CSV_SCHEMA
+    assert df["Position"].tolist() == list(range(1, len(movies) + 1))
+    for column in ("Const", "Title", "Year", "IMDb Rating", "Num Votes", "Genres", "Directors"):
+        assert df[column].tolist() == [movie.get(column) for movie in movies], column
+
+
+def test_retries_after_503(site, tmp_path):
+    url, handler = site
+    handler.failing = {2: 503}
+    run(url, range(1, 4), tmp_path / "state.jsonl")
+    assert handler.requests.count(2) == 2
+    assert sorted(handler.requests) == [1, 2, 2, 3]
+
+
+def test_resumes_after_failure(site, corpus, tmp_path):
+    url, handler = site
+    state = tmp_path / "state.jsonl"
+    # 3-sahifa xato bilan tugaydi, qolganlari holat fayliga yoziladi
+    handler.failing = {3: 404}
+    with pytest.raises(aiohttp.ClientResponseError):
+        run(url, range(1, 6), state)
+    assert sorted(json.loads(line)["page"] for line in state.read_text().splitlines()) == [1, 2, 4, 5]
+
+    # Jarayon yozish paytida o‘ldirilgan — uzilgan qator e'tiborsiz qoladi
+    with state.open("a", encoding="utf-8") as f:
+        f.write('{"url": "%s", "page": 3, "movies": [' % url)
+    handler.failing = {}
+    handler.requests.clear()
+    df = run(url, range(1, 6), state)
+    assert handler.requests == [3]
+    assert df["Const"].tolist() == [movie["Const"] for movie in expected(corpus, range(1, 6))]
+    assert not state.exists()
+
+
+def test_finished_run_is_fetched_again(site, tmp_path):
+    url, handler = site
+    state = tmp_path / "state.jsonl"
+    run(url, range(1, 4), state)
+    assert not state.exists()
+    handler.requests.clear()
+    run(url, range(1, 4), state)
+    assert sorted(handler.requests) == [1, 2, 3]
+
+
+def test_state_is_keyed_on_url(site, fixture_server, tmp_path):
+    url, handler = site
+    other = f"{fixture_server[0]}/other.html?page={{page}}"
+    assert state_path(url, tmp_path) != state_path(other, tmp_path)
+
+    # Bitta faylga yozilgan boshqa manzil yozuvlari ham hisobga olinmaydi
+    state = tmp_path / "state.jsonl"
+    handler.failing = {3: 404}
+    with pytest.raises(aiohttp.ClientResponseError):
+        run(other, range(1, 4), state)
+    handler.failing = {}
+    handler.requests.clear()
+    run(url, range(1, 4), state)
+    assert sorted(handler.requests) == [1, 2, 3]
@@ -0,0 +1,72 @@
+import heapq
+import threading
+
+import numpy as np
+
+
+def top_k_positions(values, k):
+    """Eng katta ``k`` ta qiymat pozitsiyalari, kamayish tartibida.
+
+    To‘liq saralash o‘rniga ``argpartition`` (O(n)), so‘ng faqat nomzodlar
+    saralanadi. Teng qiymatlarda oldinroq turgan qator ustun (``nlargest``
+    dagi ``keep="first"`` kabi). NaN qiymatlar oxirida.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) > k:
+        kth = -np.partition(-values[valid], k - 1)[k - 1]
+        # Chegaradagi teng qiymatlar ham nomzod — keyin pozitsiya bo‘yicha tanlanadi
+        candidates = valid[values[valid] >= kth]
+    else:
+        candidates = valid
+    order = np.lexsort((candidates, -values[candidates]))
+    top = candidates[order[:k]]
+    if len(top) < k:
+        missing = np.flatnonzero(np.isnan(values))[:k - len(top)]
+        top = np.concatenate([top, missing])
+    return top
+
+
+def top_k(frame, column, k=10):
+    # sort_values(column, ascending=False).head(k) ning O(n) muqobili
+    return frame.iloc[top_k_positions(frame[column].to_numpy(dtype=np.float64), k)]
+
+
+class TopK:
+    """Qatorlar qo‘shilganda yangilanadigan top-k (min-heap).
+
+    Filtrlanmagan ko‘rinish uchun: butun katalogni qayta ko‘rib chiqish o‘rniga
+    faqat yangi qatorlar tekshiriladi. Heap ildizi — hozirgi eng "zaif" element.
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self._heap = []
+        self._lock = threading.Lock()
+
+    def add(self, values, rows):
+        values = np.asarray(values, dtype=np.float64)
+        rows = np.asarray(rows)
+        # Yangi partiyadan ham faqat k ta nomzod yetarli
+        best = top_k_positions(values, self.k)
+        best = best[~np.isnan(values[best])]
+        with self._lock:
+            for value, row in zip(values[best].tolist(), rows[best].tolist()):
+                item = (value, -row)
+                if len(self._heap) < self.k:
+                    heapq.heappush(self._heap, item)
+                elif item > self._heap[0]:
+                    heapq.heapreplace(self._heap, item)
+        return self
+
+    def copy(self):
+        # Mustaqil nusxa: ``add`` asl heap ni o‘qiyotganlarga ta'sir qilmaydi
+        other = TopK(self.k)
+        with self._lock:
+            other._heap = list(self._heap)
+        return other
+
+    def rows(self):
+        with self._lock:
+            items = sorted(self._heap, reverse=True)
+        return np.array([-row for _, row in items], dtype=np.int64)
@@ -0,0 +1,568 @@
+"""Operativ xotiraga sig‘maydigan kataloglar uchun SQL rejimi (DuckDB, out-of-core).
+
+Oddiy rejimda butun CSV pandas ga yuklanadi (loader.py). ``IMDB_ENGINE=duckdb``
+bo‘lsa, katalog bir marta diskdagi Parquet fayllarga o‘tkaziladi va barcha
+filtrlar, guruhlashlar va Top 10 lar shu fayllar ustida SQL bilan bajariladi —
+pandas ga faqat natija jadvallari (o‘nlab qatorlar) olinadi:
+
+- ``movies.parquet`` — (Year, reyting bucket) bo‘yicha saralangan: yil/reyting
+  filtri Parquet qator guruhlari statistikasi bo‘yicha keraksiz bo‘laklarni
+  o‘qimaydi;
+- ``directors.parquet`` — film → rejissyor bog‘lanishlari (relations.MovieIndex
+  kabi) filtr ustunlari bilan birga: rejissyorlar jadvali join siz;
+- janrlar — ``genre_mask`` bitmaski (loader.GENRE_MASK kabi), filtr satrlarni
+  bo‘lmasdan bit amallari bilan; janr × yil sonlari tayyor ``genre_years.parquet``;
+- ``director_names.parquet`` — rejissyor nomlari alifbo tartibida raqamlangan;
+- qidiruv uchun nom, asl nom va rejissyorlar oldindan normallangan
+  (``search.normalize`` ga yaqin) ``search_*`` ustunlarda.
+
+Natijalar xotiradagi rejim (cube.py, filters.py, topk.py) bilan bir xil:
+bir xil ustunlar, turlar va teng qiymatlarda bir xil tartib. DuckDB xotira
+chegarasidan (``IMDB_DUCKDB_MEMORY``) oshsa, oraliq natijalarni diskka yozadi.
+
+    IMDB_ENGINE=duckdb streamlit run app.py                 # top_1000ta_kino.csv dan
+    python warehouse.py import-dumps --basics title.basics.tsv.gz \\
+        --ratings title.ratings.tsv.gz --crew title.crew.tsv.gz \\
+        --names name.basics.tsv.gz --out .cache/imdb
+    IMDB_ENGINE=duckdb IMDB_WAREHOUSE=.cache/imdb streamlit run app.py
+"""
+import argparse
+import copy
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from aggregates import TOP_TABLES
+from density import RAW_MAX, X_BINS, Density, grid, window_bounds
+from filters import RATING_SCALE, Selection, rating_buckets
+from loader import CACHE_DIR, COLUMNS, CSV_PATH, restore
+from ranking import group_ratings
+from search import normalize
+
+
+# "pandas" — butun katalog xotirada (standart), "duckdb" — Parquet ustida SQL
+ENGINE = os.environ.get("IMDB_ENGINE", "pandas")
+# Tayyor ombor papkasi (masalan, ``import-dumps`` natijasi); bo‘sh bo‘lsa — CSV dan
+WAREHOUSE_PATH = os.environ.get("IMDB_WAREHOUSE", "")
+# DuckDB xotira chegarasi ("4GB"); bo‘sh — DuckDB standarti (RAM ning 80%)
+MEMORY_LIMIT = os.environ.get("IMDB_DUCKDB_MEMORY", "")
+
+# Ombor sxemasi o‘zgarsa oshiriladi — eski papkalar qayta quriladi
+FORMAT = 2
+TABLES = ("movies", "directors", "director_names", "genre_years")
+# genre_mask — BIGINT (IMDb da ~28 janr)
+MAX_GENRES = 62
+# Parquet qator guruhi: filtr statistikasi shu bo‘laklar bo‘yicha
+ROW_GROUP_SIZE = 122_880
+
+_RATING = f'CAST(round("IMDb Rating" * {RATING_SCALE}) AS SMALLINT)'
+# Qidiruv maydonlari → normallangan ustun
+SEARCH_FIELDS = {"Title": "search_title", "Original Title": "search_original",
+                 "Directors": "search_directors"}
+
+
+def _normalized(column):
+    # search.normalize ning SQL dagi o‘xshashi (casefold o‘rniga lower)
+    return (f"trim(regexp_replace(strip_accents(lower(coalesce({_q(column)}, ''))), "
+            f"'[^\\pL\\pN_]+', ' ', 'g'))")
+
+
+def _q(name):
+    # SQL identifikatori: "IMDb Rating"
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _sha256(paths, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _stats(paths):
+    return [[str(p), os.stat(p).st_mtime_ns, os.stat(p).st_size] for p in paths]
+
+
+def _read_meta(path):
+    try:
+        return json.loads((Path(path) / "meta.json").read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _connect(memory_limit=MEMORY_LIMIT, temp_dir=None):
+    import duckdb
+
+    con = duckdb.connect()
+    if memory_limit:
+        con.execute(f"SET memory_limit = {_literal(memory_limit)}")
+    if temp_dir is not None:
+        # Xotiraga sig‘magan saralash/guruhlashlar shu papkaga yoziladi
+        con.execute(f"SET temp_directory = {_literal(temp_dir)}")
+    return con
+
+
+def _write_tables(con, movies_sql, out, meta):
+    """``movies_sql`` (CSV sxemasidagi ustunlar + ``row``) dan ombor papkasini quradi.
+
+    Avval vaqtinchalik papkaga yoziladi, keyin almashtiriladi — parallel
+    replikalar yarim yozilgan omborni o‘qimaydi.
+    """
+    out = Path(out)
+    tmp = out.with_name(f"{out.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    options = f"(FORMAT parquet, ROW_GROUP_SIZE {ROW_GROUP_SIZE})"
+    base, movies = tmp / "base.parquet", tmp / "movies.parquet"
+    columns = ", ".join(_q(c) for c in ["row", "Const", "Original Title", *COLUMNS])
+    con.execute(
+        f"COPY (SELECT {columns}, {_RATING} AS bucket FROM ({movies_sql}) "
+        f"ORDER BY Year, bucket, row) TO {_literal(base)} {options}"
+    )
+    # Janrlar to‘plami bitta sonda (loader.GENRE_MASK kabi): i-bit — genres[i]
+    genres = [name for (name,) in con.execute(
+        f"SELECT DISTINCT unnest(string_split(Genres, ', ')) AS name "
+        f"FROM read_parquet({_literal(base)}) ORDER BY name").fetchall()]
+    if len(genres) > MAX_GENRES:
+        raise ValueError(f"janrlar soni {len(genres)} > {MAX_GENRES}")
+    names = "[" + ", ".join(map(_literal, genres)) + "]"
+    searchable = "".join(f", {_normalized(field)} AS {column}"
+                         for field, column in SEARCH_FIELDS.items())
+    con.execute(
+        f"COPY (SELECT *{searchable}, CAST(coalesce(list_sum(list_transform(list_distinct("
+        f"string_split(Genres, ', ')), g -> 1::BIGINT << (list_position({names}, g) - 1))), 0) "
+        f"AS BIGINT) AS genre_mask FROM read_parquet({_literal(base)})) "
+        f"TO {_literal(movies)} {options}"
+    )
+    base.unlink()
+    # Rejissyorlar: nomlar alifbo tartibida raqamlanadi (relations.ManyToMany kabi) —
+    # guruhlash butun son bo‘yicha, teng qiymatlarda kod tartibi = nom tartibi
+    links = (f"SELECT DISTINCT row, Year, bucket, {_q('Num Votes')}, genre_mask, "
+             f"unnest(string_split(Directors, ', ')) AS name FROM read_parquet({_literal(movies)}) "
+             f"WHERE Directors IS NOT NULL")
+    names = tmp / "director_names.parquet"
+    con.execute(
+        f"COPY (SELECT row_number() OVER (ORDER BY name) - 1 AS director, name FROM "
+        f"(SELECT DISTINCT name FROM ({links}))) TO {_literal(names)} {options}"
+    )
+    # Bog‘lanishlar filtr ustunlari bilan — so‘rovlarda movies bilan join yo‘q
+    con.execute(
+        f"COPY (SELECT l.* EXCLUDE (name), n.director FROM ({links}) l "
+        f"JOIN read_parquet({_literal(names)}) n USING (name) ORDER BY Year, bucket, row) "
+        f"TO {_literal(tmp / 'directors.parquet')} {options}"
+    )
+    # Janr × yil filtrga bog‘liq emas — tayyor agregat
+    con.execute(
+        f"COPY (SELECT Year, name AS Genres, count(*) AS {_q('Movie Count')} FROM ("
+        f"SELECT Year, unnest(list_distinct(string_split(Genres, ', '))) AS name "
+        f"FROM read_parquet({_literal(movies)})) GROUP BY ALL ORDER BY Year, Genres) "
+        f"TO {_literal(tmp / 'genre_years.parquet')} {options}"
+    )
+    meta = {**meta, "format": FORMAT, "genres": genres}
+    (tmp / "meta.json").write_text(json.dumps(meta))
+    if out.exists():
+        shutil.rmtree(out)
+    os.replace(tmp, out)
+    return out
+
+
+def build_from_csv(csv_path=CSV_PATH, cache_dir=CACHE_DIR):
+    """Ro‘yxat eksporti (CSV) dan ombor; CSV o‘zgarmagan bo‘lsa — mavjudi qaytariladi.
+
+    Kesh loader.py dagi kabi: mtime/hajm, ular o‘zgarsa — SHA-256 xesh.
+    """
+    out = Path(cache_dir) / "warehouse" / Path(csv_path).stem
+    meta = _read_meta(out)
+    stats = _stats([csv_path])
+    if meta and meta.get("format") == FORMAT:
+        if meta["sources"] == stats:
+            return out
+        if meta["sha256"] == _sha256([csv_path]):
+            meta["sources"] = stats
+            (out / "meta.json").write_text(json.dumps(meta))
+            return out
+    sha256 = _sha256([csv_path])
+    types = {c: {"str": "VARCHAR", "float64": "DOUBLE", "int64": "BIGINT"}[t]
+             for c, t in COLUMNS.items()}
+    types.update({"Const": "VARCHAR", "Original Title": "VARCHAR", "Position": "BIGINT"})
+    struct = "{" + ", ".join(f"{_literal(c)}: {_literal(t)}" for c, t in types.items()) + "}"
+    # row — CSV dagi tartib (Position), pandas rejimidagi qator raqami bilan bir xil;
+    # yili yoki ovozlari yo‘q qatorlar loader.complete() dagi kabi tashlanadi
+    movies_sql = (
+        f"SELECT row_number() OVER (ORDER BY Position) - 1 AS row, * "
+        f"FROM read_csv({_literal(csv_path)}, header = true, types = {struct}) "
+        f"WHERE Year IS NOT NULL AND {_q('Num Votes')} IS NOT NULL"
+    )
+    temp_dir = Path(cache_dir) / "duckdb_tmp"
+    con = _connect(temp_dir=temp_dir)
+    try:
+        return _write_tables(con, movies_sql, out,
+                             {"sources": stats, "sha256": sha256, "version": sha256[:12]})
+    finally:
+        con.close()
+
+
+def import_dumps(basics, ratings, out, crew=None, names=None, title_types=("movie",),
+                 cache_dir=CACHE_DIR):
+    """IMDb ochiq dumplari (``title.basics``, ``title.ratings``, ixtiyoriy
+    ``title.crew`` + ``name.basics``) dan ro‘yxat eksporti sxemasidagi ombor.
+
+    Yili yo‘q yozuvlar tashlanadi; rejissyorlar ``name.basics`` dagi ismlar bilan.
+    """
+    sources = [p for p in (basics, ratings, crew, names) if p is not None]
+    if crew is not None and names is None:
+        raise ValueError("--crew uchun --names ham kerak (rejissyor ismlari)")
+
+    def tsv(path):
+        return (f"read_csv({_literal(path)}, delim = '\\t', quote = '', header = true, "
+                f"nullstr = '\\N', all_varchar = true)")
+
+    directors = "SELECT NULL::VARCHAR AS tconst, NULL::VARCHAR AS Directors WHERE false"
+    if crew is not None:
+        # "nm1,nm2" → ismlar crew dagi tartibda, ", " bilan
+        directors = (
+            f"SELECT tconst, string_agg(n.primaryName, ', ' ORDER BY i) AS Directors FROM ("
+            f"SELECT tconst, unnest(string_split(directors, ',')) AS nconst, "
+            f"unnest(range(len(string_split(directors, ',')))) AS i "
+            f"FROM {tsv(crew)} WHERE directors IS NOT NULL) c "
+            f"JOIN {tsv(names)} n USING (nconst) GROUP BY tconst"
+        )
+    kinds = ", ".join(_literal(t) for t in title_types)
+    movies_sql = (
+        f"SELECT row_number() OVER (ORDER BY b.tconst) - 1 AS row, b.tconst AS Const, "
+        f"b.originalTitle AS {_q('Original Title')}, b.primaryTitle AS Title, "
+        f"CAST(r.averageRating AS DOUBLE) AS {_q('IMDb Rating')}, "
+        f"CAST(b.runtimeMinutes AS DOUBLE) AS {_q('Runtime (mins)')}, "
+        f"CAST(b.startYear AS BIGINT) AS Year, replace(b.genres, ',', ', ') AS Genres, "
+        f"coalesce(CAST(r.numVotes AS BIGINT), 0) AS {_q('Num Votes')}, d.Directors "
+        f"FROM {tsv(basics)} b LEFT JOIN {tsv(ratings)} r USING (tconst) "
+        f"LEFT JOIN ({directors}) d USING (tconst) "
+        f"WHERE b.titleType IN ({kinds}) AND b.startYear IS NOT NULL"
+    )
+    sha256 = _sha256(sources)
+    con = _connect(temp_dir=Path(cache_dir) / "duckdb_tmp")
+    try:
+        return _write_tables(con, movies_sql, out,
+                             {"sources": _stats(sources), "sha256": sha256,
+                              "version": sha256[:12]})
+    finally:
+        con.close()
+
+
+class Warehouse:
+    """Ombor papkasi ustida dashboard so‘rovlari.
+
+    Metodlar nomi va natijasi ``cube.Cube`` / ``filters.FilterEngine`` dagi
+    kabi. ``filtered()`` — janr filtri qo‘llangan ko‘rinish (xuddi shu ulanish).
+    """
+
+    genre_filter = None
+
+    def __init__(self, path, memory_limit=MEMORY_LIMIT):
+        self.path = Path(path)
+        meta = _read_meta(self.path)
+        if meta is None or meta.get("format") != FORMAT:
+            raise ValueError(f"{self.path}: ombor topilmadi yoki eski format")
+        self.version = meta["version"]
+        self._con = _connect(memory_limit, self.path.parent / "duckdb_tmp")
+        for table in TABLES:
+            self._con.execute(f"CREATE VIEW {table} AS SELECT * FROM "
+                              f"read_parquet({_literal(self.path / f'{table}.parquet')})")
+        bounds = self._df(
+            "SELECT count(*) AS n, min(Year) AS y0, max(Year) AS y1, "
+            f"min(bucket) AS b0, max(bucket) AS b1, min({_q('Num Votes')}) AS v0, "
+            f"max({_q('Num Votes')}) AS v1 FROM movies").iloc[0]
+        self.n_rows = int(bounds["n"])
+        self.year_range = (int(bounds["y0"]), int(bounds["y1"]))
+        self.rating_range = (round(float(bounds["b0"]) / RATING_SCALE, 1),
+                             round(float(bounds["b1"]) / RATING_SCALE, 1))
+        self.votes_range = (int(bounds["v0"]), int(bounds["v1"]))
+        self.genre_names = np.array(meta["genres"], dtype=object)
+
+    @classmethod
+    def open(cls, csv_path=CSV_PATH, path=WAREHOUSE_PATH, cache_dir=CACHE_DIR):
+        return cls(path or build_from_csv(csv_path, cache_dir))
+
+    def close(self):
+        self._con.close()
+
+    def filtered(self, genre_filter):
+        """``(janrlar, "any" | "all")`` filtri bilan ko‘rinish (app.py dagi ``genre_filter``)."""
+        view = copy.copy(self)
+        view.genre_filter = genre_filter
+        return view
+
+    def _df(self, sql, params=()):
+        # Har bir so‘rov alohida kursorda — Streamlit sessiyalari parallel oqimlarda
+        with self._con.cursor() as cur:
+            return cur.execute(sql, list(params)).df()
+
+    def _where(self, year_range=None, rating_range=None):
+        clauses, params = [], []
+        if year_range is not None:
+            clauses.append("m.Year BETWEEN ? AND ?")
+            params += [int(np.ceil(year_range[0])), int(np.floor(year_range[1]))]
+        if rating_range is not None:
+            # Reytingi yo‘q filmlar (bucket NULL) har qanday oraliqdan tashqarida
+            clauses.append("m.bucket BETWEEN ? AND ?")
+            params += list(rating_buckets(rating_range))
+        if self.genre_filter:
+            # genres.GenreSet.match kabi: OR — mask & tanlov != 0, AND — == tanlov
+            genres, mode = self.genre_filter
+            lookup = {name: i for i, name in enumerate(self.genre_names)}
+            bits = sum(1 << lookup[g] for g in set(genres))
+            clauses.append("m.genre_mask & ?::BIGINT = ?" if mode == "all"
+                           else "m.genre_mask & ?::BIGINT != 0")
+            params += [bits, bits] if mode == "all" else [bits]
+        return " AND ".join(clauses) or "true", params
+
+    # ------------------------------------------------- filtr va ko‘rsatkichlar
+
+    def query(self, year_range, rating_range):
+        """``FilterEngine.query`` kabi, lekin qatorlarsiz (``rows=None``)."""
+        where, params = self._where(year_range, rating_range)
+        years = self._df(
+            f"SELECT Year, count(*) AS count, sum(bucket)::DOUBLE AS ratings, "
+            f"sum({_q('Num Votes')}) AS votes FROM movies m WHERE {where} "
+            f"GROUP BY Year ORDER BY Year", params)
+        count = int(years["count"].sum())
+        per_year = pd.Series(years["count"].to_numpy(dtype=np.int64),
+                             index=pd.Index(years["Year"].to_numpy(dtype=np.int64), name="Year"),
+                             name="count")
+        rating_mean = years["ratings"].sum() / count / RATING_SCALE if count else float("nan")
+        return Selection(None, count, rating_mean, int(years["votes"].sum()), per_year)
+
+    def top_table(self, name, year_range, rating_range, k=10):
+        """``aggregates.top_table`` — teng qiymatlarda oldingi qator ustun."""
+        column, columns = TOP_TABLES[name]
+        where, params = self._where(year_range, rating_range)
+        frame = self._df(
+            f"SELECT row, {', '.join(map(_q, columns))} FROM movies m "
+            f"WHERE {where} AND {_q(column)} IS NOT NULL "
+            f"ORDER BY {_q(column)} DESC, row LIMIT {int(k)}", params)
+        return restore(frame.set_index("row").rename_axis(None), columns)
+
+    def page(self, year_range, rating_range, column, ascending, page, page_size):
+        """``table.page_rows`` — ``column=None`` bo‘lsa asl tartib; bo‘sh qiymatlar oxirida."""
+        where, params = self._where(year_range, rating_range)
+        order = "row" if column is None else (
+            f"{_q(column)} {'ASC' if ascending else 'DESC'} NULLS LAST, row")
+        frame = self._df(
+            f"SELECT row, {', '.join(map(_q, COLUMNS))} FROM movies m WHERE {where} "
+            f"ORDER BY {order} LIMIT {int(page_size)} OFFSET {int(page) * int(page_size)}",
+            params)
+        return restore(frame.set_index("row").rename_axis(None))
+
+    # ------------------------------------------------------ grafiklar uchun
+
+    def value_counts(self, column, year_range, rating_range):
+        """Ustun qiymatlari va soni (bo‘sh qiymatlarsiz) — gistogrammalar uchun."""
+        where, params = self._where(year_range, rating_range)
+        value = f"bucket / {RATING_SCALE}" if column == "IMDb Rating" else _q(column)
+        counts = self._df(
+            f"SELECT {value} AS value, count(*) AS count FROM movies m "
+            f"WHERE {where} AND {value} IS NOT NULL GROUP BY 1 ORDER BY 1", params)
+        return pd.Series(counts["count"].to_numpy(dtype=np.int64),
+                         index=counts["value"].to_numpy(dtype=np.float64), name=column)
+
+    def votes_density(self, year_range, rating_range, window=None, x_bins=X_BINS,
+                      raw_max=RAW_MAX):
+        """``density.bin_votes`` ning SQL dagi o‘xshashi — natija ``density.Density``.
+
+        Faqat oynadagi filmlar sanaladi; ``raw_max`` tadan kam bo‘lsa xom nuqtalar olinadi.
+        """
+        where, params = self._where(year_range, rating_range)
+        votes = _q("Num Votes")
+        x = f"log10(greatest({votes}, 1))"
+        where += f" AND bucket IS NOT NULL AND {votes} IS NOT NULL"
+        if window is not None:
+            (x0, x1), (b0, b1) = window_bounds(window)
+            where += f" AND {x} BETWEEN ? AND ? AND bucket BETWEEN ? AND ?"
+            params = [*params, x0, x1, b0, b1]
+        stats = self._df(f"SELECT count(*) AS n, min({x}) AS x0, max({x}) AS x1, "
+                         f"min(bucket) AS b0, max(bucket) AS b1 FROM movies m WHERE {where}",
+                         params).iloc[0]
+        total = int(stats["n"])
+        if window is None:
+            if not total:
+                return Density(None, np.array([]), np.array([]), 0,
+                               pd.DataFrame({"Num Votes": [], "IMDb Rating": []}))
+            (x0, x1) = float(stats["x0"]), float(stats["x1"])
+            (b0, b1) = int(stats["b0"]), int(stats["b1"])
+        x_edges, y_edges = grid((x0, x1), (b0, b1), x_bins)
+        if total <= raw_max:
+            points = self._df(f"SELECT {votes}, {_q('IMDb Rating')} FROM movies m "
+                              f"WHERE {where} ORDER BY row", params)
+            return Density(None, x_edges, y_edges, total, points.astype(np.float64))
+        span = x_edges[-1] - x_edges[0]
+        cells = self._df(
+            f"SELECT least(floor(({x} - ?) / ? * {int(x_bins)}), {int(x_bins) - 1}) AS x, "
+            f"bucket - ? AS y, count(*) AS count FROM movies m WHERE {where} GROUP BY 1, 2",
+            [x_edges[0], span, b0, *params])
+        counts = np.zeros((x_bins, len(y_edges) - 1), dtype=np.int64)
+        counts[cells["x"].to_numpy(dtype=np.int64), cells["y"].to_numpy(dtype=np.int64)] = \
+            cells["count"].to_numpy()
+        return Density(counts, x_edges, y_edges, total)
+
+    # ------------------------------------------------------- kub bo‘limlari
+
+    def _directors(self, measures, column, k, year_range=None, rating_range=None, having=None):
+        # Eng katta ``k`` ta (nlargest, keep="first"): kodlar bo‘yicha, nomlar faqat natijaga
+        where, params = self._where(year_range, rating_range)
+        return self._df(
+            f"WITH top AS (SELECT director, {measures} FROM directors m WHERE {where} "
+            f"GROUP BY director" + (f" HAVING {having}" if having else "")
+            + f" ORDER BY {_q(column)} DESC, director LIMIT {int(k)}) "
+            f"SELECT n.name AS Directors, top.* EXCLUDE (director) FROM top "
+            f"JOIN director_names n USING (director) ORDER BY {_q(column)} DESC, director",
+            params)
+
+    def movies_per_year(self, k=10):
+        return self._df(f"SELECT Year, count(*) AS {_q('Movie Count')} FROM movies "
+                        f"GROUP BY Year ORDER BY 2 DESC, Year LIMIT {int(k)}")
+
+    def decade_stats(self, year_range=None, rating_range=None):
+        where, params = self._where(year_range, rating_range)
+        return self._df(
+            f"SELECT Year // 10 * 10 AS Decade, "
+            f"sum(bucket)::DOUBLE / count(bucket) / {RATING_SCALE} AS avg_rating, "
+            f"count(*) AS movie_count FROM movies m WHERE {where} "
+            f"GROUP BY Decade ORDER BY Decade", params).set_index("Decade")
+
+    def top_directors_by_votes(self, k=10):
+        return self._directors(f"sum({_q('Num Votes')}) AS {_q('Num Votes')}", "Num Votes", k)
+
+    def top_directors_by_rating(self, k=10):
+        return self._directors(
+            f"sum(bucket)::DOUBLE / count(bucket) / {RATING_SCALE} AS {_q('IMDb Rating')}",
+            "IMDb Rating", k, having="count(bucket) > 0")
+
+    def director_rating_table(self, year_range=None, rating_range=None, min_movies=2, k=10):
+        return self._directors(
+            f"sum(bucket)::DOUBLE / count(bucket) / {RATING_SCALE} AS avg_rating, "
+            f"count(*) AS movie_count", "avg_rating", k, year_range, rating_range,
+            having=f"count(*) >= {int(min_movies)}").set_index("Directors")
+
+    def group_ratings(self, table, year_range=None, rating_range=None):
+        """``Cube.group_ratings`` — gistogramma SQL da, WR va bootstrap ranking.py da."""
+        where, params = self._where(year_range, rating_range)
+        if table == "directors":
+            sql = f"SELECT director AS label, bucket, count(*) AS count FROM directors m WHERE {where}"
+        else:
+            # Janr bitlari bo‘yicha: i-bit — genre_names[i]
+            sql = (f"SELECT g.i AS label, bucket, count(*) AS count FROM movies m "
+                   f"CROSS JOIN range({len(self.genre_names)}) g(i) "
+                   f"WHERE {where} AND (m.genre_mask >> g.i) & 1 = 1")
+        sql += " AND bucket IS NOT NULL GROUP BY 1, 2"
+        if table == "directors":
+            sql = (f"SELECT h.*, n.name FROM ({sql}) h "
+                   f"JOIN director_names n ON n.director = h.label")
+        hist = self._df(f"{sql} ORDER BY 1, 2", params)
+        stats = group_ratings(hist["label"], hist["bucket"], hist["count"])
+        if table == "directors":
+            names = hist.drop_duplicates("label")["name"].to_numpy(dtype=object)
+        else:
+            names = self.genre_names[stats.index]
+        stats.index = pd.Index(names, name=table.capitalize())
+        return stats
+
+    def genre_year_counts(self):
+        """(Year, Genres, Movie Count) — ``GenreSet.year_counts`` kabi."""
+        return self._df("SELECT * FROM genre_years ORDER BY Year, Genres")
+
+    def top_genres(self, k=5):
+        counts = self._df(f"SELECT Genres, sum({_q('Movie Count')}) AS count FROM genre_years "
+                          f"GROUP BY Genres ORDER BY count DESC, Genres LIMIT {int(k)}")
+        return pd.Index(counts["Genres"].to_numpy(dtype=object), name="Genres")
+
+    # ------------------------------------------------ qidiruv va sahifalar
+
+    def film(self, const):
+        """Bitta film (asl nomi bilan) yoki ``None``."""
+        frame = self._df(
+            f"SELECT {', '.join(map(_q, ['Original Title', *COLUMNS]))} FROM movies "
+            f"WHERE Const = ? LIMIT 1", [const])
+        if frame.empty:
+            return None
+        movie = restore(frame).iloc[0].copy()
+        movie["Original Title"] = frame["Original Title"].iloc[0]
+        return movie
+
+    def director_films(self, name, columns=("Title", "Year", "IMDb Rating", "Num Votes", "Genres")):
+        # Avval qator raqamlari (kichik ro‘yxat), keyin faqat shu qatorlar o‘qiladi
+        rows = self._df("SELECT row FROM directors JOIN director_names USING (director) "
+                        "WHERE name = ? ORDER BY row", [name])["row"].tolist()
+        frame = self._df(
+            f"SELECT row, Const, {', '.join(_q(c) for c in columns)} FROM movies "
+            f"WHERE row IN ({', '.join(map(str, rows)) or 'NULL'}) ORDER BY row")
+        return frame.set_index("row").rename_axis(None)
+
+    def search(self, query, k=20, columns=("Title", "Year", "IMDb Rating", "Num Votes", "Directors")):
+        """Barcha so‘zlar bitta maydonda (nom, asl nom yoki rejissyorlar; qism satr) —
+        ovozlari ko‘p filmlar yuqorida. Xotiradagi indeksdan farqli, xatolarga chidamsiz."""
+        tokens = normalize(query).split()
+        if not tokens:
+            return pd.DataFrame(columns=["Const", *columns])
+        # Normallangan ustunlar tayyor — har qatorda strip_accents/lower hisoblanmaydi
+        where = " OR ".join(
+            "(" + " AND ".join(f"{column} LIKE ?" for _ in tokens) + ")"
+            for column in SEARCH_FIELDS.values())
+        frame = self._df(
+            f"SELECT row, Const, {', '.join(_q(c) for c in columns)} FROM movies WHERE {where} "
+            f"ORDER BY {_q('Num Votes')} DESC, row LIMIT {int(k)}",
+            [f"%{token}%" for token in tokens] * len(SEARCH_FIELDS))
+        return restore(frame.set_index("row").rename_axis(None), columns).assign(
+            Const=frame["Const"].to_numpy())
+
+    def search_names(self, query, k=5):
+        tokens = normalize(query).split()
+        if not tokens:
+            return []
+        where = " AND ".join("strip_accents(lower(n.name)) LIKE ?" for _ in tokens)
+        names = self._df(
+            f"SELECT n.name FROM director_names n JOIN directors m USING (director) WHERE {where} "
+            f"GROUP BY n.name ORDER BY sum(m.{_q('Num Votes')}) DESC, n.name LIMIT {int(k)}",
+            [f"%{token}%" for token in tokens])
+        return names["name"].tolist()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="CSV ro‘yxat eksportidan ombor (.cache/warehouse)")
+    build.add_argument("csv", nargs="?", default=CSV_PATH)
+    dumps = sub.add_parser("import-dumps", help="IMDb ochiq dumplaridan ombor")
+    dumps.add_argument("--basics", required=True)
+    dumps.add_argument("--ratings", required=True)
+    dumps.add_argument("--crew")
+    dumps.add_argument("--names")
+    dumps.add_argument("--types", default="movie",
+                       help="titleType lar, vergul bilan (masalan, movie,tvMovie)")
+    dumps.add_argument("--out", required=True)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.command == "build":
+        out = build_from_csv(args.csv)
+    else:
+        out = import_dumps(args.basics, args.ratings, args.out, crew=args.crew,
+                           names=args.names, title_types=tuple(args.types.split(",")))
+    warehouse = Warehouse(out)
+    print(f"{out}: {warehouse.n_rows:,} film, versiya {warehouse.version}, "
+          f"{time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()